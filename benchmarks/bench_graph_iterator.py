@@ -0,0 +1,37 @@
+"""
+Times a full walk over graphs of growing size. The time per node should stay
+flat as the graph grows.
+
+    python -m benchmarks.bench_graph_iterator --nodes 50000
+"""
+
+import argparse
+import time
+
+from palatable.graph import Graph
+
+
+def walk(graph):
+    start = time.perf_counter()
+    for _ in graph:
+        pass
+
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=50000)
+    args = parser.parse_args()
+
+    for nodes in (args.nodes, args.nodes * 2, args.nodes * 4):
+        graph = Graph(directed=False)
+        for node in range(nodes):
+            graph.adj_list[node] = {}
+
+        elapsed = walk(graph)
+        print(f"{nodes:>9} nodes: {elapsed:.4f}s ({elapsed / nodes * 1e9:.0f}ns/node)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Compares GraphBuilder._process_courses against the per-pair call sequence it
+replaced (get_weight, then set_weight or add_edge), and against the sparse
+engine when numpy and scipy are installed.
+
+    python -m benchmarks.bench_graphbuilder --courses 4000 --students 50000
+"""
+
+import argparse
+import time
+from itertools import combinations
+
+from benchmarks.generators import generate_courses, generate_schedules
+from palatable.graph import Graph
+from palatable.graphbuilder import GraphBuilder
+
+
+def legacy_process_courses(schedules):
+    graph = Graph(directed=False)
+
+    for schedule in schedules:
+        for source, destination in combinations(schedule, 2):
+            weight = graph.get_weight(source, destination)
+            if weight:
+                graph.set_weight(source, destination, weight=weight + 1)
+            else:
+                graph.add_edge(source, destination)
+
+    for course in graph:
+        course.degree = graph.get_degree(course)
+        course.largest_weight = graph.get_largest_weight(course)
+
+    return graph
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--courses", type=int, default=4000)
+    parser.add_argument("--students", type=int, default=50000)
+    parser.add_argument("--per-student", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    courses = generate_courses(args.courses)
+    schedules = list(
+        generate_schedules(courses, args.students, args.per_student, args.seed)
+    )
+
+    builder = GraphBuilder(0, None, None)
+    legacy, legacy_time = timed(legacy_process_courses, schedules)
+    graph, bulk_time = timed(builder._process_courses, schedules)
+
+    sparse, sparse_time = timed(builder._process_courses_sparse, schedules)
+
+    for course in courses:
+        assert dict(legacy.adj_list[course]) == dict(graph.adj_list[course])
+        assert dict(sparse.adj_list[course]) == dict(graph.adj_list[course])
+
+    print(f"legacy call sequence: {legacy_time:.3f}s")
+    print(f"bulk accumulation:    {bulk_time:.3f}s")
+    print(f"sparse engine:        {sparse_time:.3f}s")
+    print(f"speedup (bulk):       {legacy_time / bulk_time:.2f}x")
+    print(f"speedup (sparse):     {legacy_time / sparse_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
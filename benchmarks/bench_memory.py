@@ -0,0 +1,70 @@
+"""
+Measures the memory the students take once registered in their courses, with
+the compact Student (__slots__ and a tuple of courses) and with a subclass
+that brings back the previous layout (a __dict__ and a set of courses).
+
+    python -m benchmarks.bench_memory --students 500000
+"""
+
+import argparse
+import tracemalloc
+
+from benchmarks.generators import generate_courses, generate_schedules
+from palatable.student import Student
+
+
+class LegacyStudent(Student):
+    """
+    A Student with a __dict__, as a subclass without __slots__ gets one, and
+    its courses in a set.
+    """
+
+    def __init__(self, key: str) -> None:
+        super().__init__(key)
+        self._registered_courses = set()
+
+    def add_course(self, course):
+        self._registered_courses.add(course)
+
+
+def measure(student_class, schedules):
+    for course in {course for schedule in schedules for course in schedule}:
+        course._students = []
+
+    tracemalloc.start()
+
+    for key, schedule in enumerate(schedules):
+        student = student_class(f"{key:07d}")
+
+        for course in schedule:
+            course.students.append(student)
+            student.add_course(course)
+
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--courses", type=int, default=300)
+    parser.add_argument("--students", type=int, default=500000)
+    parser.add_argument("--per-student", type=int, default=5)
+    args = parser.parse_args()
+
+    courses = generate_courses(args.courses)
+    schedules = list(generate_schedules(courses, args.students, args.per_student))
+
+    print(f"{'students':>9} {'layout':>9} {'MiB':>8} {'bytes/student':>14}")
+
+    for layout, student_class in (("legacy", LegacyStudent), ("compact", Student)):
+        current = measure(student_class, schedules)
+        print(
+            f"{args.students:>9} {layout:>9} {current / 2**20:>8.1f} "
+            f"{current / args.students:>14.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Compares parsing a schedule file with helpers.read_file (decode, split and
+look up str keys) against the memory-mapped mmapreader (split and look up
+bytes keys).
+
+    python -m benchmarks.bench_readers --size-mb 1024
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from palatable import mmapreader
+from palatable.helpers import read_file
+
+
+def write_schedule(path: str, size: int, courses: int, seed: int = 0):
+    """
+    Writes a schedule file of about `size` bytes. A block of random lines is
+    repeated to keep generation fast for large sizes.
+    """
+    rng = random.Random(seed)
+    keys = [f"{key:07d}" for key in range(courses)]
+
+    lines = []
+    for student in range(10000):
+        schedule = " ".join(rng.sample(keys, rng.randint(3, 7)))
+        lines.append(f"{student:07d}     {schedule}\n")
+    block = "".join(lines).encode()
+
+    with open(path, "wb") as file:
+        for _ in range(max(size // len(block), 1)):
+            file.write(block)
+
+    return keys
+
+
+def read_text(path: str, keys):
+    ids = {key: idx for idx, key in enumerate(keys)}
+    students = 0
+
+    for line in read_file(path):
+        _, *courses_ids = line.split()
+        [ids[key] for key in courses_ids if key in ids]
+        students += 1
+
+    return students
+
+
+def read_mmap(path: str, keys):
+    ids = mmapreader.intern_keys(keys)
+    students = 0
+
+    for _ in mmapreader.read_schedule(path, ids):
+        students += 1
+
+    return students
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=100)
+    parser.add_argument("--courses", type=int, default=4000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "schedule.txt")
+        keys = write_schedule(path, args.size_mb * 2**20, args.courses)
+        print(f"file size: {os.path.getsize(path) / 2 ** 20:.0f} MiB")
+
+        for name, reader in (("read_file", read_text), ("mmap", read_mmap)):
+            start = time.perf_counter()
+            students = reader(path, keys)
+            elapsed = time.perf_counter() - start
+            print(f"{name:>9}: {students} students in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
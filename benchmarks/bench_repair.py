@@ -0,0 +1,94 @@
+"""
+Compares a full rebuild and repaint with an incremental update and repair
+after a few enrollment changes: how long each takes and how many courses
+change their exam session.
+
+    python -m benchmarks.bench_repair --courses 300 --students 20000 --changes 300
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.generators import (
+    generate_courses,
+    generate_schedules,
+    write_files,
+)
+from palatable.graphbuilder import GraphBuilder
+from palatable.graphpainter import GraphPainter
+from palatable.schedulediff import ScheduleDiff
+
+
+def build_and_paint(args, schedule_path, courses_path):
+    start = time.perf_counter()
+    builder = GraphBuilder(args.slots, schedule_path, courses_path)
+    graph = builder.build()
+    painter = GraphPainter(graph, args.days, args.slots, args.fairness)
+    painter.paint()
+
+    coloring = {
+        course.key: position for course, position in painter.get_coloring().items()
+    }
+    return builder, graph, coloring, time.perf_counter() - start
+
+
+def moved(before, after):
+    return sum(after.get(key) != position for key, position in before.items())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--courses", type=int, default=300)
+    parser.add_argument("--students", type=int, default=20000)
+    parser.add_argument("--per-student", type=int, default=5)
+    parser.add_argument("--changes", type=int, default=300)
+    parser.add_argument("--days", type=int, default=15)
+    parser.add_argument("--slots", type=int, default=5)
+    parser.add_argument("--fairness", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+
+    with tempfile.TemporaryDirectory() as directory:
+        courses = generate_courses(args.courses)
+        schedules = list(generate_schedules(courses, args.students, args.per_student))
+        courses_path, old_path = write_files(directory, courses, schedules)
+
+        # Students that drop and add a course
+        for key in rng.sample(range(args.students), args.changes):
+            schedule = dict.fromkeys(schedules[key][1:])
+            while len(schedule) < len(schedules[key]):
+                schedule.update(dict.fromkeys(rng.choices(courses, k=1)))
+            schedules[key] = list(schedule)
+
+        new_directory = os.path.join(directory, "new")
+        os.mkdir(new_directory)
+        _, new_path = write_files(new_directory, courses, schedules)
+
+        builder, graph, before, _ = build_and_paint(args, old_path, courses_path)
+
+        start = time.perf_counter()
+        diff = ScheduleDiff.from_files(old_path, new_path)
+        builder.update(graph, diff)
+        report = GraphPainter(graph, args.days, args.slots, args.fairness).repair()
+        incremental = time.perf_counter() - start
+        repaired = {
+            course.key: (course.color.day, course.color.slot)
+            for course in graph
+            if course.is_colored
+        }
+
+        *_, repainted, full = build_and_paint(args, new_path, courses_path)
+
+    print(f"{len(diff)} students changed, {len(before)} courses colored before")
+    print(f"{'mode':>12} {'moved':>6} {'time':>8}")
+    print(f"{'rebuild':>12} {moved(before, repainted):>6} {full:>7.3f}s")
+    print(f"{'incremental':>12} {len(report.moved):>6} {incremental:>7.3f}s")
+    print(f"{'repair only':>12} {moved(before, repaired):>6} {report.elapsed:>7.3f}s")
+
+
+if __name__ == "__main__":
+    main()
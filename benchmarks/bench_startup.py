@@ -0,0 +1,50 @@
+"""
+Measures the wall time of the command line: `palatable -h`, which is mostly
+imports, and a small run on the sample files. Every command runs in a fresh
+interpreter, and the best and median of the repetitions are reported.
+
+    python -m benchmarks.bench_startup --repeat 10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+FILES = os.path.join(os.path.dirname(os.path.dirname(__file__)), "files")
+
+COMMANDS = {
+    "help": ["-h"],
+    "small run": [
+        "--schedule",
+        os.path.join(FILES, "schedule.txt"),
+        "--courses",
+        os.path.join(FILES, "courses.txt"),
+    ],
+}
+
+
+def run(arguments):
+    command = [sys.executable, "-m", "palatable.scheduler", *arguments]
+
+    start = time.perf_counter()
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'command':>10} {'best':>8} {'median':>8}")
+
+    for name, arguments in COMMANDS.items():
+        times = [run(arguments) for _ in range(args.repeat)]
+        print(f"{name:>10} {min(times):>7.3f}s {statistics.median(times):>7.3f}s")
+
+
+if __name__ == "__main__":
+    main()
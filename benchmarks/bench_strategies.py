@@ -0,0 +1,64 @@
+"""
+Compares the greedy and DSATUR painting strategies on synthetic graphs: how
+many courses each colors, how many distinct colors (exam sessions) they use
+and how long they take.
+
+    python -m benchmarks.bench_strategies --courses 300 --students 5000
+"""
+
+import argparse
+import time
+
+from benchmarks.generators import (
+    generate_courses,
+    generate_schedules,
+    register_students,
+)
+from palatable.graphbuilder import GraphBuilder
+from palatable.graphpainter import STRATEGIES, GraphPainter
+
+
+def paint(graph, strategy, days, slots, fairness):
+    for course in graph:
+        course.color = None
+
+    painter = GraphPainter(graph, days, slots, fairness, strategy=strategy)
+
+    start = time.perf_counter()
+    colored = painter.paint()
+    elapsed = time.perf_counter() - start
+
+    used = {course.color.key for course in graph if course.is_colored}
+    return colored, len(used), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--courses", type=int, default=300)
+    parser.add_argument("--students", type=int, default=5000)
+    parser.add_argument("--per-student", type=int, default=5)
+    parser.add_argument("--days", type=int, default=15)
+    parser.add_argument("--slots", type=int, default=5)
+    parser.add_argument("--fairness", type=int, default=3)
+    parser.add_argument("--seeds", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'seed':>4} {'strategy':>8} {'colored':>8} {'colors':>7} {'time':>8}")
+
+    for seed in range(args.seeds):
+        courses = generate_courses(args.courses)
+        schedules = list(
+            generate_schedules(courses, args.students, args.per_student, seed)
+        )
+        register_students(schedules)
+        graph = GraphBuilder(args.slots, None, None)._process_courses(schedules)
+
+        for strategy in STRATEGIES:
+            colored, used, elapsed = paint(
+                graph, strategy, args.days, args.slots, args.fairness
+            )
+            print(f"{seed:>4} {strategy:>8} {colored:>8} {used:>7} {elapsed:>7.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Measures the peak memory of building the graph from files with a growing
+number of students. With keep_students=False the streaming build should
+stay flat once every course pair has been seen.
+
+    python -m benchmarks.bench_streaming --students 20000
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.generators import (
+    generate_courses,
+    generate_schedules,
+    write_files,
+)
+from palatable.graphbuilder import GraphBuilder
+
+
+def measure(courses_path, schedule_path, keep_students, streaming):
+    builder = GraphBuilder(1, schedule_path, courses_path, keep_students=keep_students)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    if streaming:
+        builder.build()
+    else:
+        builder._read_courses()
+        builder._process_courses(builder._read_schedule())
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--courses", type=int, default=300)
+    parser.add_argument("--students", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'students':>9} {'mode':>22} {'peak MiB':>9} {'time':>8}")
+
+    for students in (args.students, args.students * 4):
+        with tempfile.TemporaryDirectory() as directory:
+            courses = generate_courses(args.courses)
+            schedules = generate_schedules(courses, students)
+            paths = write_files(directory, courses, schedules)
+
+            for mode, keep_students, streaming in (
+                ("read + process", True, False),
+                ("streaming", True, True),
+                ("streaming, no students", False, True),
+            ):
+                peak, elapsed = measure(*paths, keep_students, streaming)
+                print(
+                    f"{students:>9} {mode:>22} {peak / 2 ** 20:>9.1f} {elapsed:>7.2f}s"
+                )
+
+
+if __name__ == "__main__":
+    main()
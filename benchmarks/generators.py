@@ -0,0 +1,148 @@
+import os
+import random
+from itertools import accumulate
+
+from palatable.course import Course
+
+
+def generate_courses(count: int, sections: int = 1):
+    """
+    Creates `count` courses with sequential keys.
+    """
+    return [
+        Course(f"{key:07d}", f"Course{key}", key % 5 + 1, sections)
+        for key in range(count)
+    ]
+
+
+def generate_schedules(courses, students: int, per_student: int = 5, seed: int = 0):
+    """
+    Yields one schedule (list of distinct courses) per student. Course
+    popularity follows a 1/rank distribution, so a few courses are taken by
+    most students, as in real enrollment data. The seed makes runs reproducible.
+    """
+    rng = random.Random(seed)
+    weights = [1 / rank for rank in range(1, len(courses) + 1)]
+    per_student = min(per_student, len(courses))
+
+    for _ in range(students):
+        # A dict keeps the draw order, which keeps the output reproducible.
+        schedule = {}
+        while len(schedule) < per_student:
+            schedule.update(dict.fromkeys(rng.choices(courses, weights, k=1)))
+
+        yield list(schedule)
+
+
+def register_students(schedules):
+    """
+    Creates one student per schedule and enrolls it in the schedule's courses,
+    as GraphBuilder._read_schedule does.
+    """
+    from palatable.student import Student
+
+    for key, schedule in enumerate(schedules):
+        student = Student(f"{key:07d}")
+
+        for course in schedule:
+            course.students.append(student)
+            student.add_course(course)
+
+
+def write_files(directory: str, courses, schedules):
+    """
+    Writes courses.txt and schedule.txt in the format GraphBuilder reads and
+    returns their paths.
+    """
+    courses_path = os.path.join(directory, "courses.txt")
+    schedule_path = os.path.join(directory, "schedule.txt")
+
+    with open(courses_path, "w") as file:
+        for course in courses:
+            file.write(f"{course.key} {course.name} {course.level} {course.sections}\n")
+
+    with open(schedule_path, "w") as file:
+        for key, schedule in enumerate(schedules):
+            keys = " ".join(course.key for course in schedule)
+            file.write(f"{key:07d} {keys}\n")
+
+    return courses_path, schedule_path
+
+
+def write_enrollment(
+    directory: str,
+    students: int,
+    courses: int = None,
+    per_student=(3, 7),
+    levels: int = 5,
+    same_level: float = 0.7,
+    exponent: float = 1.0,
+    seed: int = 0,
+):
+    """
+    Writes a synthetic courses.txt and schedule.txt, one student at a time,
+    so a million students take little memory, and returns their paths.
+
+    - Course popularity follows a power law: the course of popularity rank r
+      is drawn with weight 1 / r ** exponent. Popular courses get more
+      sections, from 1 to 3.
+    - Every student has a level and takes every course from their own level
+      with probability same_level, from the whole catalog otherwise, so
+      courses of the same level are co-enrolled more often.
+    - Students take per_student courses, between the two bounds.
+
+    By default there is one course per 100 students, at least 100. The seed
+    makes the files reproducible.
+    """
+    rng = random.Random(seed)
+
+    if courses is None:
+        courses = max(100, students // 100)
+
+    ranks = list(range(1, courses + 1))
+    rng.shuffle(ranks)
+
+    catalog = []
+    for key, rank in enumerate(ranks):
+        sections = 3 if rank <= courses // 100 else 2 if rank <= courses // 10 else 1
+        catalog.append((f"{key:07d}", key % levels + 1, sections, rank**-exponent))
+
+    by_level = {
+        level: [course for course in catalog if course[1] == level]
+        for level in range(1, levels + 1)
+    }
+    pools = {
+        level: (
+            [course[0] for course in pool],
+            list(accumulate(course[3] for course in pool)),
+        )
+        for level, pool in by_level.items()
+        if pool
+    }
+    everyone = (
+        [course[0] for course in catalog],
+        list(accumulate(course[3] for course in catalog)),
+    )
+
+    courses_path = os.path.join(directory, "courses.txt")
+    schedule_path = os.path.join(directory, "schedule.txt")
+
+    with open(courses_path, "w") as file:
+        for key, level, sections, _ in catalog:
+            file.write(f"{key} Course{key} {level} {sections}\n")
+
+    low, high = per_student
+    with open(schedule_path, "w") as file:
+        for student in range(students):
+            level = rng.choice(list(pools))
+            count = min(rng.randint(low, high), courses)
+
+            # A dict keeps the draw order, which keeps the output reproducible.
+            schedule = {}
+            while len(schedule) < count:
+                keys, weights = pools[level] if rng.random() < same_level else everyone
+                schedule[rng.choices(keys, cum_weights=weights)[0]] = None
+
+            file.write(f"{student:07d} {' '.join(schedule)}\n")
+
+    return courses_path, schedule_path
@@ -0,0 +1,266 @@
+"""
+Times GraphBuilder.build, GraphPainter.paint and the command line on
+synthetic enrollment files (see generators.write_enrollment) of growing size,
+and records the peak memory of every run.
+
+Every measurement runs in a fresh interpreter, so the peak resident set size
+is the run's own. The best of the repetitions is kept. Results are written as
+JSON, and compared against a previous results file when one is given: a
+benchmark more than --threshold slower, or using that much more memory, is
+flagged and the suite exits with status 1. Only compare results from the same
+machine.
+
+    python -m benchmarks.suite --sizes 10000 100000 --output results.json
+    python -m benchmarks.suite --sizes 10000 100000 --baseline results.json
+    python -m benchmarks.suite --sizes 1000000 --data /tmp/enrollment
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.generators import write_enrollment
+
+BENCHMARKS = ("build", "paint", "cli")
+
+
+def measure(benchmark, schedule_path, courses_path, days, slots, fairness):
+    """
+    Runs in the child interpreter: builds the graph, paints it when the
+    benchmark is paint, and prints the timed part in seconds as JSON.
+    """
+    from palatable.graphbuilder import GraphBuilder
+    from palatable.graphpainter import GraphPainter
+
+    builder = GraphBuilder(
+        slots, schedule_path, courses_path, keep_students=fairness > 0
+    )
+
+    start = time.perf_counter()
+    graph = builder.build()
+    seconds = time.perf_counter() - start
+
+    if benchmark == "paint":
+        painter = GraphPainter(graph, days, slots, fairness, catalog=builder.catalog)
+
+        start = time.perf_counter()
+        painter.paint()
+        seconds = time.perf_counter() - start
+
+    print(json.dumps({"seconds": seconds}))
+
+
+def run(command):
+    """
+    Runs the command and returns its output, wall time in seconds and peak
+    resident set size in MiB.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.PIPE)
+
+    with process.stdout:
+        output = process.stdout.read()
+
+    # wait4 returns the resource usage of this child alone
+    _, status, usage = os.wait4(process.pid, 0)
+    elapsed = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+
+    if process.returncode:
+        raise RuntimeError(f"{' '.join(command)} exited with {process.returncode}")
+
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    peak = usage.ru_maxrss / (1 << 20 if sys.platform == "darwin" else 1 << 10)
+
+    return output, elapsed, peak
+
+
+def run_benchmark(benchmark, schedule_path, courses_path, args):
+    """
+    Returns the best time in seconds and the smallest peak memory in MiB of
+    the repetitions.
+    """
+    parameters = [str(args.days), str(args.slots), str(args.fairness)]
+
+    if benchmark == "cli":
+        days, slots, fairness = parameters
+        command = [sys.executable, "-m", "palatable.scheduler"]
+        command += ["-d", schedule_path, "-c", courses_path]
+        command += ["-y", days, "-s", slots, "-f", fairness]
+    else:
+        command = [sys.executable, "-m", "benchmarks.suite", "--measure", benchmark]
+        command += [schedule_path, courses_path, *parameters]
+
+    times, peaks = [], []
+    for _ in range(args.repeat):
+        output, elapsed, peak = run(command)
+
+        times.append(elapsed if benchmark == "cli" else json.loads(output)["seconds"])
+        peaks.append(peak)
+
+    return min(times), min(peaks)
+
+
+def compare(results, baseline, threshold):
+    """
+    Adds the time and memory ratios to the baseline of every result found
+    in it, and whether either is a regression. Returns the regressions.
+    """
+    previous = {
+        (result["benchmark"], result["students"]): result
+        for result in baseline["results"]
+    }
+
+    regressions = []
+    for result in results:
+        old = previous.get((result["benchmark"], result["students"]))
+        if old is None:
+            continue
+
+        result["time_ratio"] = result["seconds"] / old["seconds"]
+        result["memory_ratio"] = result["peak_mib"] / old["peak_mib"]
+        result["regression"] = max(result["time_ratio"], result["memory_ratio"]) > (
+            1 + threshold
+        )
+
+        if result["regression"]:
+            regressions.append(result)
+
+    return regressions
+
+
+def print_results(results):
+    from tabulate import tabulate
+
+    table = [
+        [
+            result["benchmark"],
+            result["students"],
+            f"{result['seconds']:.3f}",
+            f"{result['peak_mib']:.1f}",
+            f"{result['time_ratio']:.2f}" if "time_ratio" in result else "",
+            f"{result['memory_ratio']:.2f}" if "memory_ratio" in result else "",
+            "REGRESSION" if result.get("regression") else "",
+        ]
+        for result in results
+    ]
+
+    headers = [
+        "benchmark",
+        "students",
+        "time (s)",
+        "peak (MiB)",
+        "time ratio",
+        "memory ratio",
+        "",
+    ]
+    print(tabulate(table, headers=headers, disable_numparse=True))
+
+
+def enrollment(directory, students, seed):
+    """
+    Returns the paths of the enrollment files for the size and seed, writing
+    them unless a previous run did.
+    """
+    directory = os.path.join(directory, f"enrollment-{students}-{seed}")
+    courses_path = os.path.join(directory, "courses.txt")
+    schedule_path = os.path.join(directory, "schedule.txt")
+
+    if not os.path.exists(schedule_path):
+        os.makedirs(directory, exist_ok=True)
+        write_enrollment(directory, students, seed=seed)
+
+    return courses_path, schedule_path
+
+
+def main():
+    if sys.argv[1:2] == ["--measure"]:
+        benchmark, schedule_path, courses_path, days, slots, fairness = sys.argv[2:]
+        return measure(
+            benchmark, schedule_path, courses_path, int(days), int(slots), int(fairness)
+        )
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument(
+        "--benchmarks", nargs="+", choices=BENCHMARKS, default=list(BENCHMARKS)
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--days", type=int, default=5)
+    parser.add_argument("--slots", type=int, default=5)
+    parser.add_argument("--fairness", type=int, default=2)
+    parser.add_argument(
+        "--data", help="Directory keeping the generated files between runs."
+    )
+    parser.add_argument("--output", help="Path of the JSON results file to write.")
+    parser.add_argument("--baseline", help="Path of previous JSON results.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown or memory growth flagged as a regression.",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        data = args.data or directory
+
+        results = []
+        for students in args.sizes:
+            courses_path, schedule_path = enrollment(data, students, args.seed)
+
+            for benchmark in args.benchmarks:
+                seconds, peak = run_benchmark(
+                    benchmark, schedule_path, courses_path, args
+                )
+                results.append(
+                    {
+                        "benchmark": benchmark,
+                        "students": students,
+                        "seconds": seconds,
+                        "peak_mib": peak,
+                    }
+                )
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(
+                {
+                    "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "cpus": os.cpu_count(),
+                    "seed": args.seed,
+                    "parameters": {
+                        "days": args.days,
+                        "slots": args.slots,
+                        "fairness": args.fairness,
+                        "repeat": args.repeat,
+                    },
+                    "results": results,
+                },
+                file,
+                indent=2,
+            )
+
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}.")
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
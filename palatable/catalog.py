@@ -0,0 +1,79 @@
+class Catalog(object):
+    """
+    The courses and students of one schedule, looked up by key in O(1).
+
+    Every GraphBuilder owns a catalog instead of sharing class-level
+    registries, so several schedules can be built in the same process, one
+    after the other or concurrently in threads.
+    """
+
+    def __init__(self) -> None:
+        self._courses = {}
+        self._students = {}
+
+    def add_course(self, course):
+        """
+        Registers the course under its key and returns it.
+        """
+        if course.key in self._courses:
+            raise AttributeError(
+                f"Course with the same key already exists: {course.key}"
+            )
+
+        self._courses[course.key] = course
+        return course
+
+    def has_course(self, key: str) -> bool:
+        return key in self._courses
+
+    def get_course(self, key: str):
+        """
+        Returns the course with the given key, None if it is not registered.
+        """
+        return self._courses.get(key)
+
+    def courses(self):
+        """
+        Returns a live view of the courses, in registration order.
+        """
+        return self._courses.values()
+
+    def add_student(self, student):
+        """
+        Registers the student under its key and returns it.
+        """
+        if student.key in self._students:
+            raise AttributeError(
+                f"Student with the same key already exists: {student.key}"
+            )
+
+        self._students[student.key] = student
+        return student
+
+    def has_student(self, key: str) -> bool:
+        return key in self._students
+
+    def get_student(self, key: str):
+        """
+        Returns the student with the given key, None if it is not registered.
+        """
+        return self._students.get(key)
+
+    def remove_student(self, key: str):
+        """
+        Frees the key of a student that left the schedule. Returns the student,
+        None if it was not registered.
+        """
+        return self._students.pop(key, None)
+
+    def students(self):
+        """
+        Returns a live view of the students, in registration order.
+        """
+        return self._students.values()
+
+    def __repr__(self) -> str:
+        return (
+            f"<Catalog: {id(self)} courses={len(self._courses)} "
+            f"students={len(self._students)}>"
+        )
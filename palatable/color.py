@@ -1,19 +1,25 @@
-from faker import Faker
-
-
 class Color(object):
     """
     A representation for node color. Implemented to simplify graph coloring.
     """
 
-    def __init__(self, key, day=0, slot=0, instances=0) -> None:
+    __slots__ = (
+        "key",
+        "name",
+        "day",
+        "slot",
+        "_weight",
+        "available_instances",
+        "colored_courses",
+    )
+
+    def __init__(self, key, day=0, slot=0, instances=0, name=None) -> None:
         """
-        Constructs a color with the specified key, day, and time slot
+        Constructs a color with the specified key, day, and time slot. The
+        name defaults to "D{day}S{slot}", unique per color of the matrix.
         """
-        fake = Faker()
-
         self.key = key
-        self.name = fake.unique.color_name()
+        self.name = name or f"D{day}S{slot}"
         self.day = day
         self.slot = slot
 
@@ -23,7 +23,19 @@ class Course(object):
         - degree.
     """
 
-    _all_courses = {}
+    __slots__ = (
+        "key",
+        "level",
+        "name",
+        "sections",
+        "color",
+        "concurrency_level",
+        "_students",
+        "weight_matrix",
+        "time_slot",
+        "degree",
+        "largest_weight",
+    )
 
     def __init__(self, key: str, name: str, level: int, sections: int) -> None:
         """
@@ -35,10 +47,6 @@ class Course(object):
         @param level    The course level
         @param sections Number of sections this course has
         """
-        if key in self._all_courses:
-            raise AttributeError(f"Course with the same key already exists: {key}")
-        self._all_courses[key] = self
-
         self.key = key
         self.level = level
         self.name = name
@@ -64,14 +72,6 @@ class Course(object):
         """
         return self.color is not None
 
-    @classmethod
-    def exists(cls, key: str):
-        return key in cls._all_courses
-
-    @classmethod
-    def get(cls, key: str):
-        return cls._all_courses.get(key)
-
     @property
     def students(self) -> List[Student]:
         return self._students
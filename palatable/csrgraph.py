@@ -0,0 +1,133 @@
+from array import array
+from bisect import bisect_left
+
+
+class CSRGraph(object):
+    """
+    A read-only, compressed sparse row (CSR) representation of a built Graph.
+
+    Courses are mapped to integer ids (0..n-1). The neighbours of course `i`
+    are the ids stored in indices[indptr[i]:indptr[i + 1]], and the weights of
+    the connecting edges sit at the same positions in `weights`. Every row is
+    sorted by neighbour id, so an edge lookup is a binary search. Every edge
+    costs 8 bytes (two 32-bit integers) instead of a dict entry per direction.
+
+    The graph exposes the same read API as Graph, so GraphPainter works on it
+    unchanged.
+    """
+
+    def __init__(self, courses, indptr, indices, weights, directed=False):
+        """
+        @param courses  The courses, positioned by their integer id
+        @param indptr   Row offsets, len(courses) + 1 items
+        @param indices  Neighbour ids of every row, concatenated
+        @param weights  Edge weights, aligned with indices
+        @param directed Whether the edges are directed
+        """
+        if len(indptr) != len(courses) + 1:
+            raise ValueError("indptr must have one more item than courses.")
+
+        if len(indices) != len(weights):
+            raise ValueError("indices and weights must have the same length.")
+
+        self.directed = directed
+        self.courses = list(courses)
+        self.ids = {course: idx for idx, course in enumerate(self.courses)}
+
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Freezes the given Graph into CSR arrays. Course ids follow the
+        iteration order of the graph.
+        """
+        courses = list(graph.nodes())
+        ids = {course: idx for idx, course in enumerate(courses)}
+
+        indptr = array("i", [0])
+        indices = array("i")
+        weights = array("i")
+
+        for course in courses:
+            row = sorted(
+                (ids[neighbor], weight)
+                for neighbor, weight in graph.get_adjacency_list(course)
+            )
+            indices.extend(neighbor for neighbor, _ in row)
+            weights.extend(weight for _, weight in row)
+            indptr.append(len(indices))
+
+        return cls(courses, indptr, indices, weights, directed=graph.directed)
+
+    def get_id(self, course):
+        """
+        Returns the integer id of the given course, None if it is not a node.
+        """
+        return self.ids.get(course)
+
+    def get_course(self, idx):
+        """
+        Returns the course with the given integer id.
+        """
+        return self.courses[idx]
+
+    def neighbors(self, idx):
+        """
+        Returns the ids and the weights of the neighbours of the course with
+        the given integer id.
+        """
+        start, end = self.indptr[idx], self.indptr[idx + 1]
+        return self.indices[start:end], self.weights[start:end]
+
+    def nodes(self):
+        return self.courses
+
+    def contains_edge(self, source, destination):
+        return self.get_weight(source, destination) is not None
+
+    def get_weight(self, source, destination):
+        idx, other = self.ids.get(source), self.ids.get(destination)
+        if idx is None or other is None:
+            return None
+
+        end = self.indptr[idx + 1]
+        position = bisect_left(self.indices, other, self.indptr[idx], end)
+        if position < end and self.indices[position] == other:
+            return self.weights[position]
+
+        return None
+
+    def get_degree(self, course):
+        idx = self.ids[course]
+        return self.indptr[idx + 1] - self.indptr[idx]
+
+    def get_largest_weight(self, course):
+        _, weights = self.neighbors(self.ids[course])
+        return max(weights, default=0)
+
+    def get_adjacency_list(self, course):
+        """
+        Returns the (course, weight) pairs of the given course's neighbours.
+        """
+        idx = self.ids.get(course)
+        if idx is None:
+            return []
+
+        indices, weights = self.neighbors(idx)
+        courses = self.courses
+
+        return [
+            (courses[neighbor], weight) for neighbor, weight in zip(indices, weights)
+        ]
+
+    def __repr__(self) -> str:
+        return f"<CSRGraph: {id(self)} courses={len(self)} edges={len(self.indices)}>"
+
+    def __len__(self):
+        return len(self.courses)
+
+    def __iter__(self):
+        return iter(self.courses)
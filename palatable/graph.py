@@ -1,5 +1,4 @@
 from collections import defaultdict
-from operator import itemgetter
 
 
 class GraphIterator(object):
@@ -7,6 +6,10 @@ class GraphIterator(object):
         self.idx = 0
         self.adj_list = adj_list
 
+        # Snapshot the keys once, indexing a fresh list on every step makes a
+        # full walk quadratic.
+        self._keys = list(adj_list)
+
     def __iter__(self):
         return self
 
@@ -17,12 +20,12 @@ class GraphIterator(object):
         """
         idx = self.idx
 
-        if idx is None or idx >= len(self.adj_list):
+        if idx is None or idx >= len(self._keys):
             # once we reach the end, all iteration is done, end of.
             self.idx = None
             raise StopIteration()
 
-        value = list(self.adj_list)[idx]
+        value = self._keys[idx]
         self.idx = idx + 1
         return value
 
@@ -32,6 +35,9 @@ class Graph(object):
     An adjacency list is the most efficient way to store a graph. It allows
     us to store only edges that are present in a graph.
 
+    Every course maps to a dict of its neighbours and the weights of the edges
+    connecting them, so looking up, adding and updating an edge is O(1).
+
     The adjacency list takes only n+e elements (n is the number of courses, e is the
     number of edges).
     The implementation becomes more space-efficient if a graph is not dense (has a
@@ -40,19 +46,97 @@ class Graph(object):
 
     def __init__(self, directed=True):
         self.directed = directed
-        self.adj_list = defaultdict(set)
+        self.adj_list = defaultdict(dict)
 
     def add_edge(self, source, destination, weight=1):
         if self.contains_edge(source, destination):
             raise ValueError(f"Edge between ({source}, {destination}) already exists")
 
-        self.adj_list[source].add((destination, weight))
+        self.adj_list[source][destination] = weight
 
         if not self.directed:
-            self.adj_list[destination].add((source, weight))
+            self.adj_list[destination][source] = weight
+
+        return weight
+
+    def increment_edge(self, source, destination, by=1):
+        """
+        Increments the weight of the edge between source and destination,
+        creating the edge when it does not exist yet. Returns the new weight.
+        """
+        neighbors = self.adj_list[source]
+        weight = neighbors.get(destination, 0) + by
+        neighbors[destination] = weight
+
+        if not self.directed and source != destination:
+            self.adj_list[destination][source] = weight
 
         return weight
 
+    def decrement_edge(self, source, destination, by=1):
+        """
+        Decrements the weight of the edge between source and destination.
+        The edge is removed when its weight drops to zero, and so is a course
+        left without neighbours. Returns the new weight.
+        """
+        if not self.contains_edge(source, destination):
+            raise ValueError(f"Edge between ({source}, {destination}) does not exist")
+
+        weight = self.adj_list[source][destination] - by
+        if weight < 0:
+            raise ValueError(
+                f"Edge between ({source}, {destination}) has a smaller weight than {by}"
+            )
+
+        self._set_or_remove(source, destination, weight)
+
+        if not self.directed and source != destination:
+            self._set_or_remove(destination, source, weight)
+
+        return weight
+
+    def _set_or_remove(self, source, destination, weight):
+        neighbors = self.adj_list[source]
+
+        if weight:
+            neighbors[destination] = weight
+            return
+
+        del neighbors[destination]
+        if not neighbors:
+            del self.adj_list[source]
+
+    def add_weighted_edges(self, edges):
+        """
+        Accumulates an iterable of (source, destination, weight) triplets into
+        the graph in one pass.
+        """
+        adj_list = self.adj_list
+        undirected = not self.directed
+
+        # Same as calling increment_edge per triplet, inlined for the hot loop.
+        for source, destination, weight in edges:
+            neighbors = adj_list[source]
+            weight += neighbors.get(destination, 0)
+            neighbors[destination] = weight
+
+            if undirected and source != destination:
+                adj_list[destination][source] = weight
+
+    def update_courses_degrees(self, courses=None):
+        """
+        Sets the degree and the largest weight of every course in one sweep
+        over the adjacency list, or of the given courses only. Courses that are
+        not nodes get zero for both.
+        """
+        if courses is None:
+            courses = self.adj_list.keys()
+
+        for course in courses:
+            neighbors = self.adj_list.get(course, {})
+            course.degree = len(neighbors)
+            course.largest_weight = max(neighbors.values(), default=0)
+
     def contains_edge(self, source, destination):
         # Instant lookup
         if source not in self.adj_list:
@@ -71,11 +155,11 @@ class Graph(object):
         return weight
 
     def _find_and_set_weight(self, source, destination, weight):
-        for course, old_weight in self.adj_list.get(source, set()):
-            if course == destination:
-                self.adj_list[source].remove((destination, old_weight))
-                self.adj_list[source].add((destination, weight))
-                return weight
+        neighbors = self.adj_list.get(source, {})
+
+        if destination in neighbors:
+            neighbors[destination] = weight
+            return weight
 
     def set_weight(self, source, destination, weight):
         if not self.contains_edge(source, destination):
@@ -98,23 +182,27 @@ class Graph(object):
         return len(self.adj_list[course])
 
     def get_largest_weight(self, course):
-        weight = 0
-        try:
-            weight = max(self.adj_list[course], key=itemgetter(1))[1]
-        except ValueError:
-            pass
+        return max(self.adj_list[course].values(), default=0)
 
-        return weight
+    def nodes(self):
+        """
+        Returns a live view of the courses in the graph without copying them.
+        """
+        return self.adj_list.keys()
 
     def get_adjacency_list(self, course):
-        return self.adj_list[course]
+        """
+        Returns a view of (course, weight) pairs for the given course.
+        """
+        return self.adj_list[course].items()
 
     def _get_info(self, source, destination):
-        for course, weight in self.adj_list.get(source):
-            if course == destination:
-                return (course, weight)
+        weight = self.adj_list.get(source).get(destination)
+
+        if weight is None:
+            return None
 
-        return None
+        return (destination, weight)
 
     def __str__(self):
         output = ""
@@ -1,56 +1,226 @@
-from collections import defaultdict
-from itertools import combinations
+import os
+import warnings
+from array import array
+from collections import Counter, defaultdict
+from itertools import combinations, repeat
+from operator import attrgetter
 
+from palatable import mmapreader
+from palatable.catalog import Catalog
 from palatable.course import Course
 from palatable.graph import Graph
 from palatable.helpers import read_file
 from palatable.student import Student
 
+ENGINES = ("python", "sparse")
+READERS = ("text", "mmap")
+
+
+def _shard_offsets(path: str, shards: int):
+    """
+    Splits the file into at most `shards` byte ranges of about the same size.
+    """
+    size = os.path.getsize(path)
+    step = max(size // shards, 1)
+    offsets = list(range(0, size, step))[:shards] + [size]
+
+    return list(zip(offsets, offsets[1:]))
+
+
+def _count_shard(path: str, start: int, end: int, keys):
+    """
+    Counts the co-enrolled course pairs of the students whose lines start in
+    the byte range [start, end) of the schedule file.
+
+    Courses are referred to by their position in `keys`, and a pair (a, b)
+    with a <= b is encoded as a * len(keys) + b, so only flat integer arrays
+    travel back to the parent process.
+
+    @returns The student ids, the offsets and the course indices of every
+             student's schedule (CSR style), the pair codes and their counts.
+    """
+    ids = mmapreader.intern_keys(keys)
+    size = len(keys)
+
+    pairs = Counter()
+    students = []
+    indptr = array("i", [0])
+    indices = array("i")
+
+    with open(path, "rb") as file:
+        if start:
+            # Skip to the first line starting inside the range, the previous
+            # shard owns the line crossing the boundary.
+            file.seek(start - 1)
+            file.readline()
+
+        while file.tell() < end:
+            line = file.readline()
+            if not line:
+                break
+
+            if line.startswith(b"#") or not line.strip():
+                continue
+
+            student_id, *courses_ids = line.split()
+            schedule = sorted(ids[key] for key in courses_ids if key in ids)
+
+            students.append(student_id.decode())
+            indices.extend(schedule)
+            indptr.append(len(indices))
+
+            pairs.update(
+                source * size + destination
+                for source, destination in combinations(schedule, 2)
+            )
+
+    return (
+        students,
+        indptr,
+        indices,
+        array("q", pairs.keys()),
+        array("q", pairs.values()),
+    )
+
 
 class GraphBuilder(object):
-    def __init__(self, slots: int, schedule_path: str, courses_path: str) -> None:
+    def __init__(
+        self,
+        slots: int,
+        schedule_path: str,
+        courses_path: str,
+        engine="python",
+        workers=1,
+        keep_students=True,
+        buffer_size=-1,
+        reader="text",
+        catalog=None,
+        profiler=None,
+    ) -> None:
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine}, expected one of {ENGINES}.")
+
+        if workers < 1:
+            raise ValueError("The number of workers must be at least 1.")
+
+        if reader not in READERS:
+            raise ValueError(f"Unknown reader {reader}, expected one of {READERS}.")
+
+        if workers > 1 and engine != "python":
+            raise ValueError("Parallel builds are only supported by the python engine.")
+
+        # 0 is unbuffered, which text files don't support, and 1 line buffering
+        if buffer_size != -1 and buffer_size < 2:
+            raise ValueError("The buffer size must be -1 or at least 2.")
+
         self.slots = slots
         self.schedule_path = schedule_path
         self.courses_path = courses_path
+        self.engine = engine
+        self.workers = workers
+
+        # Students are only needed by the fairness check, and the read buffer
+        # size is passed to read_file.
+        self.keep_students = keep_students
+        self.buffer_size = buffer_size
+        self.reader = reader
+
+        # The courses and students this builder registers, a fresh catalog
+        # unless one is passed in.
+        self.catalog = catalog if catalog is not None else Catalog()
 
         self.courses = []
         self.courses_ids = []
 
-    def _read_courses(self):
-        courses = defaultdict(list)
+        # A palatable.profiling.Profiler timing the build phases, if any
+        if profiler is not None:
+            profiler.instrument_builder(self)
+
+    def _iter_courses(self):
+        if self.reader == "mmap":
+            yield from mmapreader.read_courses(self.courses_path)
+            return
 
         for line in read_file(self.courses_path):
             key, name, level, sections = line.split()
-            level, sections = int(level), int(sections)
+            yield key, name, int(level), int(sections)
+
+    def _read_courses(self):
+        courses = defaultdict(list)
 
-            course = Course(key, name, level, sections)
+        for key, name, level, sections in self._iter_courses():
+            course = self.catalog.add_course(Course(key, name, level, sections))
             courses[level].append(course)
 
         return courses
 
-    def _read_schedule(self):
-        all_schedules = []
+    def _iter_students(self):
+        """
+        Yields the id and the list of known courses of every student in the
+        schedule file.
+        """
+        if self.reader == "mmap":
+            courses = list(self.catalog.courses())
+            ids = mmapreader.intern_keys(course.key for course in courses)
+
+            for student_id, indices in mmapreader.read_schedule(
+                self.schedule_path, ids
+            ):
+                yield student_id.decode(), [courses[idx] for idx in indices]
 
-        for line in read_file(self.schedule_path):
+            return
+
+        for line in read_file(self.schedule_path, buffering=self.buffer_size):
             student_id, *courses_ids = line.split()
 
-            student = Student(student_id)
-            schedule = []
+            # Only process courses that already been passed in the input. Student
+            # might be enrolled in courses that we don't want to schedule.
+            courses = map(self.catalog.get_course, courses_ids)
+            yield student_id, [course for course in courses if course]
 
-            for course_id in courses_ids:
-                course = Course.get(course_id)
+    def _iter_schedule(self):
+        """
+        Yields the schedule (list of courses) of every student in the schedule
+        file, one line at a time. Students are registered in their courses
+        unless keep_students is False.
+        """
+        for student_id, schedule in self._iter_students():
+            if self.keep_students:
+                student = self.catalog.add_student(Student(student_id))
 
-                # Only process courses that already been passed in the input. Student
-                # might be enrolled in courses that we don't want to schedule.
-                if course:
+                for course in schedule:
                     course.students.append(student)
                     student.add_course(course)
-                    schedule.append(course)
 
             if schedule:
-                all_schedules.append(schedule)
+                yield schedule
 
-        return all_schedules
+    def _read_schedule(self):
+        return list(self._iter_schedule())
+
+    def _stream_schedule(self):
+        """
+        Same as _read_schedule followed by _process_courses, without holding
+        the schedules: every student's course pairs are counted as the line is
+        read, then the line is dropped. Memory grows with the number of courses
+        and edges, and with the students only when keep_students is True.
+        """
+        graph = Graph(directed=False)
+        pairs = Counter()
+        key = attrgetter("key")
+
+        # The counter holds one entry per distinct pair of courses, whatever
+        # the number of students.
+        for schedule in self._iter_schedule():
+            pairs.update(combinations(sorted(schedule, key=key), 2))
+
+        graph.add_weighted_edges(
+            (source, destination, weight)
+            for (source, destination), weight in pairs.items()
+        )
+        graph.update_courses_degrees()
+
+        return graph
 
     def _process_courses(self, schedules):
         """
@@ -63,25 +233,217 @@ class GraphBuilder(object):
         registered by at least one student.
         """
         graph = Graph(directed=False)
+        pairs = Counter()
 
         for schedule in schedules:
-            courses_combinations = combinations(schedule, 2)
-            for source, destination in courses_combinations:
-                weight = graph.get_weight(source, destination)
-                if weight:
-                    graph.set_weight(source, destination, weight=weight + 1)
-                else:
-                    graph.add_edge(source, destination)
+            # Sorting gives every pair a canonical order, so (a, b) and (b, a)
+            # are counted under the same key.
+            schedule = sorted(schedule, key=attrgetter("key"))
+            pairs.update(combinations(schedule, 2))
+
+        graph.add_weighted_edges(
+            (source, destination, weight)
+            for (source, destination), weight in pairs.items()
+        )
 
         # Set the degree of the course
-        for course in graph:
-            course.degree = graph.get_degree(course)
-            course.largest_weight = graph.get_largest_weight(course)
+        graph.update_courses_degrees()
+
+        return graph
+
+    def _process_courses_sparse(self, schedules):
+        """
+        Same as _process_courses, computed as the product A^T A where A is the
+        students x courses enrollment matrix. Entry (i, j) of the product is
+        the number of students taking both courses i and j, that is the weight
+        of the edge between them.
+
+        Falls back to _process_courses when NumPy or SciPy is not installed.
+        """
+        try:
+            import numpy as np
+            from scipy import sparse
+        except ImportError:
+            warnings.warn(
+                "The sparse engine requires numpy and scipy, "
+                "falling back to the python engine."
+            )
+            return self._process_courses(schedules)
+
+        graph = Graph(directed=False)
+        if not schedules:
+            return graph
+
+        courses = list(
+            dict.fromkeys(course for schedule in schedules for course in schedule)
+        )
+        ids = {course: idx for idx, course in enumerate(courses)}
+
+        lengths = np.fromiter(map(len, schedules), dtype=np.int64, count=len(schedules))
+        rows = np.repeat(np.arange(len(schedules)), lengths)
+        columns = np.fromiter(
+            (ids[course] for schedule in schedules for course in schedule),
+            dtype=np.int64,
+            count=len(rows),
+        )
+
+        # Duplicated entries are summed, so a course listed twice by the same
+        # student counts twice, exactly as the pairs of _process_courses do.
+        enrollment = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int64), (rows, columns)),
+            shape=(len(schedules), len(courses)),
+        )
+        product = (enrollment.T @ enrollment).tocsr()
+
+        # The diagonal holds the sum of k^2 where k is how many times each
+        # student lists the course. The number of (course, course) pairs is
+        # the sum of k(k-1)/2, which is zero unless a course is duplicated.
+        listed = np.asarray(enrollment.sum(axis=0)).ravel()
+        product.setdiag((product.diagonal() - listed) // 2)
+        product.eliminate_zeros()
+
+        upper = sparse.triu(product).tocoo()
+        graph.add_weighted_edges(
+            (courses[row], courses[column], weight)
+            for row, column, weight in zip(
+                upper.row.tolist(), upper.col.tolist(), upper.data.tolist()
+            )
+        )
+
+        degrees = np.diff(product.indptr).tolist()
+        largest_weights = product.max(axis=1).toarray().ravel().tolist()
+        for course, degree, largest_weight in zip(courses, degrees, largest_weights):
+            course.degree = degree
+            course.largest_weight = largest_weight
 
         return graph
 
+    def _build_parallel(self):
+        """
+        Same as reading the schedule and processing the courses, with the
+        schedule file split into byte-range shards that are counted in a
+        process pool. The partial pair counts are merged into one graph.
+        """
+        # Imported here, a sequential build never pays for multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        courses = [
+            course for level in self._read_courses().values() for course in level
+        ]
+        keys = [course.key for course in courses]
+        size = len(keys)
+
+        shards = _shard_offsets(self.schedule_path, self.workers)
+        starts = [start for start, _ in shards]
+        ends = [end for _, end in shards]
+
+        pairs = Counter()
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            results = executor.map(
+                _count_shard, repeat(self.schedule_path), starts, ends, repeat(keys)
+            )
+
+            # Shards come back in file order, so students are registered in the
+            # same order as a sequential read.
+            for students, indptr, indices, codes, counts in results:
+                if not self.keep_students:
+                    students = []
+
+                for position, student_id in enumerate(students):
+                    student = self.catalog.add_student(Student(student_id))
+                    start, end = indptr[position], indptr[position + 1]
+
+                    for idx in indices[start:end]:
+                        course = courses[idx]
+                        course.students.append(student)
+                        student.add_course(course)
+
+                pairs.update(dict(zip(codes, counts)))
+
+        graph = Graph(directed=False)
+        graph.add_weighted_edges(
+            (courses[code // size], courses[code % size], weight)
+            for code, weight in pairs.items()
+        )
+        graph.update_courses_degrees()
+
+        return graph
+
+    def update(self, graph, diff):
+        """
+        Applies a ScheduleDiff to a graph this builder built, in place, instead
+        of rebuilding it from the new schedule file. The pairs of every student
+        in the diff are netted first, then every edge is incremented or
+        decremented once, and only the courses the diff touches get their
+        degree and largest weight updated. The result is the graph build()
+        would return for the new file.
+
+        The graph must be a Graph, not a read-only CSRGraph.
+        """
+        pairs = Counter()
+        touched = set()
+        key = attrgetter("key")
+
+        for student_id, old, new in diff:
+            old = self._get_courses(old)
+            new = self._get_courses(new)
+
+            pairs.subtract(combinations(sorted(old, key=key), 2))
+            pairs.update(combinations(sorted(new, key=key), 2))
+            touched.update(old)
+            touched.update(new)
+
+            if self.keep_students:
+                removed = student_id in diff.removed
+                self._reenroll(student_id, new, removed=removed)
+
+        for (source, destination), weight in pairs.items():
+            if weight > 0:
+                graph.increment_edge(source, destination, by=weight)
+            elif weight < 0:
+                graph.decrement_edge(source, destination, by=-weight)
+
+        graph.update_courses_degrees(touched)
+
+        return graph
+
+    def _get_courses(self, keys):
+        """
+        Returns the known courses of the given keys, if any.
+        """
+        courses = map(self.catalog.get_course, keys or ())
+        return [course for course in courses if course]
+
+    def _reenroll(self, student_id, new, removed=False):
+        """
+        Moves the student from their courses to the new ones, registering or
+        unregistering them the way a full rebuild would.
+        """
+        student = self.catalog.get_student(student_id)
+
+        if student is not None:
+            for course in student.courses:
+                course.students.remove(student)
+                student.remove_course(course)
+
+        if removed:
+            self.catalog.remove_student(student_id)
+            return
+
+        if student is None:
+            student = self.catalog.add_student(Student(student_id))
+
+        for course in new:
+            course.students.append(student)
+            student.add_course(course)
+
     def build(self):
+        if self.workers > 1:
+            return self._build_parallel()
+
         self._read_courses()
-        schedules = self._read_schedule()
 
-        return self._process_courses(schedules)
+        if self.engine == "sparse":
+            return self._process_courses_sparse(self._read_schedule())
+
+        return self._stream_schedule()
@@ -0,0 +1,250 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from contextlib import suppress
+
+from palatable.course import Course
+from palatable.csrgraph import CSRGraph
+from palatable.student import Student
+
+MAGIC = b"PALGRAPH"
+VERSION = 1
+
+# Magic, version and the length of the JSON metadata that follows
+HEADER = struct.Struct("<8sII")
+
+# The integer arrays stored after the metadata, in this order
+ARRAYS = ("indptr", "indices", "weights", "students_indptr", "students_courses")
+
+# The keys of the JSON metadata
+METADATA = (
+    "schedule_hash",
+    "courses_hash",
+    "byteorder",
+    "directed",
+    "nodes",
+    "courses",
+    "students",
+    "lengths",
+)
+
+
+def file_hash(path: str) -> str:
+    """
+    Returns the SHA-256 digest of the file contents.
+    """
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def save_graph(path: str, graph, catalog, schedule_path: str, courses_path: str):
+    """
+    Writes the graph, the courses of the catalog and the students enrolled in
+    them to a binary cache file, keyed by the content hashes of the input
+    files.
+
+    The file holds a header, JSON metadata (input hashes, courses and
+    students keys, array lengths), then the CSR arrays of the graph and of
+    the students' courses as native 32-bit integers.
+    """
+    frozen = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+
+    # Graph nodes first, so course ids match the CSR rows, then the courses
+    # that have students but no edges.
+    courses = list(frozen.nodes())
+    courses.extend(course for course in catalog.courses() if course not in frozen.ids)
+    ids = {course: idx for idx, course in enumerate(courses)}
+
+    students = list(
+        dict.fromkeys(student for course in courses for student in course.students)
+    )
+    students_indptr = array("i", [0])
+    students_courses = array("i")
+    for student in students:
+        students_courses.extend(
+            sorted(ids[course] for course in student.courses if course in ids)
+        )
+        students_indptr.append(len(students_courses))
+
+    arrays = {
+        "indptr": array("i", frozen.indptr),
+        "indices": array("i", frozen.indices),
+        "weights": array("i", frozen.weights),
+        "students_indptr": students_indptr,
+        "students_courses": students_courses,
+    }
+
+    metadata = json.dumps(
+        {
+            "schedule_hash": file_hash(schedule_path),
+            "courses_hash": file_hash(courses_path),
+            "byteorder": sys.byteorder,
+            "directed": frozen.directed,
+            "nodes": len(frozen),
+            "courses": [
+                [c.key, c.name, c.level, c.sections, c.degree, c.largest_weight]
+                for c in courses
+            ],
+            "students": [student.key for student in students],
+            "lengths": {name: len(arrays[name]) for name in ARRAYS},
+        }
+    ).encode()
+
+    # Written next to the cache and moved over it, so an interrupted run never
+    # leaves a partial cache behind.
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, len(metadata)))
+            file.write(metadata)
+            # Keep the arrays aligned for the zero-copy casts in load_graph
+            file.write(b"\0" * (-file.tell() % 4))
+
+            for name in ARRAYS:
+                arrays[name].tofile(file)
+
+        os.replace(temporary_path, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(temporary_path)
+        raise
+
+
+def _read_metadata(file):
+    """
+    Reads the header and the metadata, and checks they describe the whole
+    file.
+
+    @returns The metadata and the offset of the arrays, or None when the file
+             is not a cache of this version or is malformed, truncated for
+             instance.
+    """
+    header = file.read(HEADER.size)
+    if len(header) != HEADER.size:
+        return None
+
+    magic, version, length = HEADER.unpack(header)
+    if magic != MAGIC or version != VERSION:
+        return None
+
+    try:
+        metadata = json.loads(file.read(length))
+
+        offset = HEADER.size + length
+        offset += -offset % 4
+
+        lengths = metadata["lengths"]
+        size = offset + 4 * sum(lengths[name] for name in ARRAYS)
+
+        if (
+            any(key not in metadata for key in METADATA)
+            or size != os.fstat(file.fileno()).st_size
+            or lengths["students_indptr"] != len(metadata["students"]) + 1
+            or metadata["nodes"] > len(metadata["courses"])
+        ):
+            return None
+    except (ValueError, KeyError, TypeError):
+        return None
+
+    return metadata, offset
+
+
+def _is_current(metadata, schedule_path: str, courses_path: str) -> bool:
+    """
+    Returns True if the cache was written on this platform from the given
+    input files.
+    """
+    return (
+        metadata["byteorder"] == sys.byteorder
+        and metadata["schedule_hash"] == file_hash(schedule_path)
+        and metadata["courses_hash"] == file_hash(courses_path)
+    )
+
+
+def read_metadata(path: str, schedule_path: str, courses_path: str):
+    """
+    Reads the metadata of a cache written by save_graph, without loading the
+    graph: the number of graph nodes under "nodes", the course and student
+    keys under "courses" and "students".
+
+    @returns The metadata dict, or None when load_graph would return None.
+    """
+    try:
+        file = open(path, "rb")
+    except OSError:
+        return None
+
+    with file:
+        read = _read_metadata(file)
+
+    if read is None or not _is_current(read[0], schedule_path, courses_path):
+        return None
+
+    return read[0]
+
+
+def load_graph(path: str, catalog, schedule_path: str, courses_path: str):
+    """
+    Loads a graph written by save_graph. The CSR arrays are memory-mapped,
+    not copied. The courses and students are registered in the catalog as
+    GraphBuilder would register them.
+
+    @returns The CSRGraph, or None when the cache is missing, unreadable,
+             malformed or was built from different input files.
+    """
+    try:
+        file = open(path, "rb")
+    except OSError:
+        return None
+
+    with file:
+        read = _read_metadata(file)
+        if read is None:
+            return None
+
+        metadata, offset = read
+        if not _is_current(metadata, schedule_path, courses_path):
+            return None
+
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(mapped)
+    arrays = {}
+    for name in ARRAYS:
+        end = offset + metadata["lengths"][name] * 4
+        arrays[name] = view[offset:end].cast("i")
+        offset = end
+
+    courses = []
+    for key, name, level, sections, degree, largest_weight in metadata["courses"]:
+        course = catalog.add_course(Course(key, name, level, sections))
+        course.degree = degree
+        course.largest_weight = largest_weight
+        courses.append(course)
+
+    indptr, indices = arrays["students_indptr"], arrays["students_courses"]
+    for position, key in enumerate(metadata["students"]):
+        student = catalog.add_student(Student(key))
+        start, end = indptr[position], indptr[position + 1]
+
+        for idx in indices[start:end]:
+            course = courses[idx]
+            course.students.append(student)
+            student.add_course(course)
+
+    return CSRGraph(
+        courses[: metadata["nodes"]],
+        arrays["indptr"],
+        arrays["indices"],
+        arrays["weights"],
+        directed=metadata["directed"],
+    )
@@ -1,22 +1,139 @@
+import heapq
+import random
+import time
+from collections import defaultdict, namedtuple
 from typing import List
 
 from palatable.color import Color
 from palatable.course import Course
 from palatable.graph import Graph
-from palatable.helpers import calculate_distance
+from palatable.studentload import StudentLoadIndex
+
+STRATEGIES = ("greedy", "dsatur")
+
+# What GraphPainter.repair did: the number of colored courses, the courses
+# that lost or changed their previous color, and the time it took in seconds.
+RepairReport = namedtuple("RepairReport", ["colored_courses", "moved", "elapsed"])
+
+# One painting of GraphPainter.minimize_days: the number of days, the colored
+# courses, whether every course got colored, and the time it took in seconds.
+Probe = namedtuple("Probe", ["days", "colored_courses", "feasible", "elapsed"])
+
+# What GraphPainter.minimize_days found: the smallest number of days that
+# colors every course, None if there is none, and the probes in order.
+MinimizeReport = namedtuple("MinimizeReport", ["days", "probes"])
+
+
+class _PaintingFailed(Exception):
+    """
+    Stops a painting at the first course that cannot be colored.
+    """
 
 
 class GraphPainter(object):
-    def __init__(self, graph: Graph, days: int, slots: int, fairness: int) -> None:
+    def __init__(
+        self,
+        graph: Graph,
+        days: int,
+        slots: int,
+        fairness: int,
+        strategy: str = "greedy",
+        catalog=None,
+        profiler=None,
+        seed=None,
+    ) -> None:
+        if strategy not in STRATEGIES:
+            raise ValueError(
+                f"Unknown strategy {strategy}, expected one of {STRATEGIES}."
+            )
+
         self.graph = graph
-        self.current_courses = self.graph.adj_list
+        self.current_courses = self.graph.nodes()
 
         self.days = days
         self.slots = slots
         self.fairness = fairness
+        self.strategy = strategy
+
+        # The catalog the graph was built with, resolves courses by key
+        self.catalog = catalog
 
+        # Ties in degree and largest weight are broken at random with this
+        # seed, by course key when it is None.
+        self.seed = seed
+
+        # The courses sorted by degree, largest weight then key, and the rank
+        # of every course in that order, computed once and kept by the probes
+        # of minimize_days.
+        self._sorted_courses = None
+        self._ranks = None
+        self._stop_on_failure = False
+
+        self._reset_state()
+
+        # Called for every candidate color a color search examines, set by a
+        # profiler counting them
+        self._count_candidate = None
+
+        # A palatable.profiling.Profiler timing the painting phases, if any
+        if profiler is not None:
+            profiler.instrument_painter(self)
+
+    def _reset_state(self):
         self.colors = self._generate_colors_matrix()
 
+        self.loads = StudentLoadIndex(self.days, self.slots)
+
+        # Per course, the colors its colored neighbors rule out as a bitmask over
+        # the days * slots colors (bit day * slots + slot), how many neighbors
+        # rule out each of them, and how many of its neighbors are colored.
+        self._forbidden_masks = defaultdict(int)
+        self._forbidden_counts = defaultdict(dict)
+        self._colored_neighbors = defaultdict(int)
+
+    def reset(self, days=None):
+        """
+        Uncolors every course and clears the colors and the student loads, so
+        the graph can be painted again, over `days` days when it is given. The
+        course order is computed again, the graph may have changed since, by
+        GraphBuilder.update for instance.
+        """
+        self._reset(days, keep_order=False)
+
+    def _reset(self, days=None, keep_order=True):
+        for course in self.graph.nodes():
+            course.color = None
+
+        if days is not None:
+            self.days = days
+
+        if not keep_order:
+            self._sorted_courses = None
+            self._ranks = None
+
+        self._reset_state()
+
+    def _get_sorted_courses(self):
+        if self._sorted_courses is None:
+            if self.seed is None:
+                courses = sorted(self.graph.nodes(), reverse=True)
+            else:
+                rng = random.Random(self.seed)
+                courses = sorted(
+                    self.graph.nodes(),
+                    key=lambda course: (
+                        course.degree,
+                        course.largest_weight,
+                        rng.random(),
+                    ),
+                    reverse=True,
+                )
+
+            self._sorted_courses = courses
+            self._ranks = {course: rank for rank, course in enumerate(courses)}
+
+        return self._sorted_courses
+
     def _generate_colors_matrix(self):
         """
         Responsible of initializing the color matrix with empty
@@ -37,26 +154,23 @@ class GraphPainter(object):
         """
         Determines fairness of the scheduling for each student in the course.
         Fairness means that a student doesn't get a number of exams in the same
-        day that equals or exceeds the fairness parameter determined by faculty.
+        day that equals or exceeds the fairness parameter determined by faculty,
+        nor two exams in the same slot. Both are read from the student load
+        index, so the check is O(class size).
 
         @params course The course we want to check its check enrolled students.
         @params day The day to schedule the exams in.
 
         @returns True if all students get fair assignment, False otherwise.
         """
-        for student in course.students:
-            counter = 0
-            for slot in range(self.slots):
-                colored_courses = self.colors[day][slot].colored_courses
-                booked = False
+        loads = self.loads
 
-                for colored_course in colored_courses:
-                    if student in colored_course.students:
-                        counter += 1
-                        if counter == self.fairness or booked:
-                            return False
+        for student in course.students:
+            if loads.is_double_booked(student, day):
+                return False
 
-                        booked = True
+            if 0 < self.fairness <= loads.get_day_load(student, day):
+                return False
 
         return True
 
@@ -76,71 +190,75 @@ class GraphPainter(object):
                 if color.available_instances >= course.sections:
                     return color
 
-    def _is_color_valid(self, potential_color, neighbor_color, course):
+    def _get_smallest_available_color(self, course: Course):
         """
-        Determines whether a color is for the given course is valid or not.
+        Responsible for fetching the course color. A color is valid when:
+
+        - No colored neighbor has the same color, or a color in an adjacent
+          slot of the same day (the forbidden colors of the course).
+        - The color's available instances are more than the course sections.
+        - The scheduling is fair for all the course's students on that day.
 
-        - If the potential color (exam potential date and time) is in the same
-          day as its neighbor, and the potential color's slot is super close to
-          its neighber then this is not a valid scheduling.
-        - If potential color's available instances is less than or equals to the
-          course section, then this is not a valid scheduling.
-        - If the scheduling is not fair for one of the students, then this is
-          not a valid scheduling.
+        The first color that is not forbidden and passes the other checks is
+        returned. A course without colored neighbors gets the first color.
+        If no color is valid we will return None, which means course cannot be
+        scheduled.
 
-        Otherwise, all seems right and the color is okay to be assigned to the
-        given course.
+        @params course The first course in the scheduling process.
+        @returns The color assigned to the give course or None.
         """
-        # Same day
-        if calculate_distance(neighbor_color.day, potential_color.day) == 0:
-            if calculate_distance(neighbor_color.slot, potential_color.slot) <= 1:
-                return False
+        if not self._colored_neighbors[course]:
+            return self.colors[0][0] if self.days and self.slots else None
 
-        if potential_color.available_instances <= course.sections:
-            return False
+        free = ~self._forbidden_masks[course] & ((1 << self.days * self.slots) - 1)
+        fair_days = {}
+        count_candidate = self._count_candidate
 
-        if not self._is_fair_to_schedule(course, potential_color.day):
-            return False
+        while free:
+            lowest = free & -free
+            free ^= lowest
 
-        return True
+            if count_candidate is not None:
+                count_candidate()
 
-    def _get_smallest_available_color(self, course: Course):
-        """
-        Responsible for fetching the course color. The color be checked against
-        _is_color_valid for validity check. If this condition fails we will return
-        None, which means course cannot be scheduled.
+            day, slot = divmod(lowest.bit_length() - 1, self.slots)
+            color = self.colors[day][slot]
 
-        @params course The first course in the scheduling process.
-        @returns The color assigned to the give course or None.
-        """
-        adjacency_list = self.graph.get_adjacency_list(course)
+            if color.available_instances <= course.sections:
+                continue
 
-        for day in range(self.days):
-            for slot in range(self.slots):
-                valid = True
-                potential_color = self.colors[day][slot]
+            if day not in fair_days:
+                fair_days[day] = self._is_fair_to_schedule(course, day)
 
-                for neighbor, _ in adjacency_list:
-                    neighbor_color = neighbor.color
-                    if not neighbor.is_colored:
-                        continue
+            if fair_days[day]:
+                return color
 
-                    color_day = neighbor_color.day
-                    color_slot = neighbor_color.slot
+    def _update_forbidden_colors(self, course, day, slot, step):
+        """
+        Adds (step=1) or removes (step=-1) the colors around (day, slot) from
+        the forbidden colors of every neighbor of the given course.
 
-                    not_same_day_and_time = color_day != day or color_slot != slot
+        Each neighbor keeps a count per forbidden color, so a color is allowed
+        again only once no colored neighbor forbids it.
+        """
+        first = day * self.slots
+        conflicts = range(first + max(slot - 1, 0), first + min(slot + 2, self.slots))
 
-                    valid = (
-                        self._is_color_valid(potential_color, neighbor_color, course)
-                        if not_same_day_and_time
-                        else False
-                    )
+        for neighbor, _ in self.graph.get_adjacency_list(course):
+            self._colored_neighbors[neighbor] += step
+            counts = self._forbidden_counts[neighbor]
+            mask = self._forbidden_masks[neighbor]
 
-                    if not valid:
-                        break
+            for idx in conflicts:
+                count = counts.get(idx, 0) + step
+                if count:
+                    counts[idx] = count
+                    mask |= 1 << idx
+                else:
+                    counts.pop(idx, None)
+                    mask &= ~(1 << idx)
 
-                if valid:
-                    return potential_color
+            self._forbidden_masks[neighbor] = mask
 
     def _set_course_color(self, course, new_color, day, slot):
         """
@@ -157,6 +275,25 @@ class GraphPainter(object):
         course.color = new_color
         self.colors[day][slot].colored_courses.append(course)
         self.colors[day][slot].available_instances = available_instances
+        self.loads.add(course.students, day, slot)
+        self._update_forbidden_colors(course, day, slot, 1)
+
+    def _unset_course_color(self, course):
+        """
+        Reverts _set_course_color: releases the color instances the course took
+        and removes its exams from the student load index.
+        """
+        color = course.color
+        if not color:
+            raise ValueError(f"Course {course} is not colored.")
+
+        day, slot = color.day, color.slot
+
+        self.colors[day][slot].colored_courses.remove(course)
+        self.colors[day][slot].available_instances += course.sections
+        self.loads.remove(course.students, day, slot)
+        self._update_forbidden_colors(course, day, slot, -1)
+        course.color = None
 
     def _attempt_course_color(self, course, colored_courses, color=None):
         """
@@ -167,14 +304,317 @@ class GraphPainter(object):
         if color and color.key:
             self._set_course_color(course, color, color.day, color.slot)
             colored_courses += 1
+        elif self._stop_on_failure:
+            raise _PaintingFailed()
+
+        return colored_courses
+
+    def _get_saturation(self, course):
+        """
+        The saturation degree of a course, the number of colors its colored
+        neighbors rule out.
+        """
+        return bin(self._forbidden_masks[course]).count("1")
+
+    def paint(self, stop_on_failure=False):
+        """
+        The main logic of coloring the courses, following the painter strategy.
+
+        @params stop_on_failure Stop at the first course that cannot be
+                                colored, when only a full coloring matters.
+        @returns The number of colored courses.
+        """
+        self._stop_on_failure = stop_on_failure
+
+        try:
+            if self.strategy == "dsatur":
+                return self._paint_dsatur()
+
+            return self._paint_greedy()
+        except _PaintingFailed:
+            return sum(
+                len(color.colored_courses) for row in self.colors for color in row
+            )
+        finally:
+            self._stop_on_failure = False
+
+    def minimize_days(self, max_days=None):
+        """
+        Finds the smallest number of days, for the painter's slots, that colors
+        every course. The number of days doubles from 1 until a probe colors
+        every course, then a binary search narrows the range down. A probe
+        stops at the first course it cannot color.
+
+        The painter is left painted with the smallest number of days found.
+
+        @params max_days The largest number of days to try. By default, the
+                         number of courses, so every course can get a day of
+                         its own, or one more than the largest number of
+                         sections, since a color has one instance per day,
+                         whichever is larger.
+        @returns A MinimizeReport.
+        """
+        if max_days is None:
+            max_days = max(
+                len(self.graph),
+                max((course.sections for course in self.graph.nodes()), default=0) + 1,
+            )
+
+        probes = []
+
+        def probe(days):
+            start = time.perf_counter()
+            self._reset(days)
+
+            try:
+                colored_courses = self.paint(stop_on_failure=True)
+            except (RuntimeError, ValueError):
+                # No color fits the first course, or its sections
+                colored_courses = 0
+
+            feasible = colored_courses == len(self.graph)
+            probes.append(
+                Probe(days, colored_courses, feasible, time.perf_counter() - start)
+            )
+            return feasible
+
+        low, high = 0, 1
+        while not probe(high):
+            if high >= max_days:
+                self._reset()
+                return MinimizeReport(None, probes)
+
+            low, high = high, min(high * 2, max_days)
+
+        # low days fail and high days color every course
+        while high - low > 1:
+            middle = (low + high) // 2
+            if probe(middle):
+                high = middle
+            else:
+                low = middle
+
+        if probes[-1].days != high:
+            probe(high)
+
+        return MinimizeReport(high, probes)
+
+    def get_coloring(self, by_key=False):
+        """
+        Returns the (day, slot) of every colored course in the graph, the
+        previous coloring repair expects. With by_key, the coloring is keyed
+        by course key, so it outlives the course objects (a rebuild).
+        """
+        return {
+            course.key if by_key else course: (course.color.day, course.color.slot)
+            for course in self.graph.nodes()
+            if course.is_colored
+        }
+
+    def repair(self, previous=None):
+        """
+        Re-paints the graph after a small change, such as an enrollment update,
+        moving as few courses as possible.
+
+        Every course gets its previous color back. Then, from the least to the
+        most constrained course, the ones that conflict with a colored neighbor
+        or are unfair to their students are uncolored, which releases their
+        color instances. Those courses, and the courses without a previous
+        color, are colored again with the smallest available color.
+
+        @params previous The (day, slot) of every course, as get_coloring
+                         returns it. Course keys are looked up in the
+                         catalog. Read from the courses' current colors
+                         when omitted.
+        @returns A RepairReport.
+        """
+        start = time.perf_counter()
+
+        if previous is None:
+            previous = self.get_coloring()
+
+        sorted_courses: List[Course] = sorted(self.graph.nodes())
+        previous = self._resolve_coloring(previous)
+        previous = {
+            course: previous[course] for course in sorted_courses if course in previous
+        }
+
+        # The painter may hold a coloring already, paint's or the previous
+        # repair's, and previous is applied from scratch.
+        for course in sorted_courses:
+            course.color = None
+
+        self._reset_state()
+        self._restore_coloring(previous)
+
+        for course in sorted_courses:
+            if course.is_colored and self._violates(course):
+                self._unset_course_color(course)
+
+        colored_courses = self._recolor(reversed(sorted_courses))
+
+        coloring = self.get_coloring()
+        moved = [
+            course
+            for course, position in previous.items()
+            if coloring.get(course) != position
+        ]
+
+        return RepairReport(colored_courses, moved, time.perf_counter() - start)
+
+    def apply_coloring(self, coloring):
+        """
+        Colors the courses as in the given coloring, as get_coloring returns
+        it, on a painter that has not painted yet. Courses whose color does
+        not exist or is full are left uncolored.
+
+        @returns The number of colored courses.
+        """
+        self._restore_coloring(self._resolve_coloring(coloring))
+
+        return sum(course.is_colored for course in self.graph.nodes())
+
+    def _resolve_coloring(self, previous):
+        """
+        Replaces the course keys of a coloring with the catalog's courses.
+        """
+        resolved = {}
+
+        for course, position in previous.items():
+            if isinstance(course, str):
+                if self.catalog is None:
+                    raise ValueError("A coloring by course key needs a catalog.")
+
+                course = self.catalog.get_course(course)
+
+            if course is not None:
+                resolved[course] = position
+
+        return resolved
+
+    def _restore_coloring(self, previous):
+        """
+        Gives every course its previous color back, as long as the color still
+        exists and has enough instances left.
+        """
+        for course, (day, slot) in previous.items():
+            if day >= self.days or slot >= self.slots:
+                continue
+
+            color = self.colors[day][slot]
+            if color.available_instances >= course.sections:
+                self._set_course_color(course, color, day, slot)
+
+    def _recolor(self, courses):
+        """
+        Colors the uncolored courses, in the given order, with the smallest
+        available color. Returns the number of colored courses.
+        """
+        colored_courses = 0
+
+        for course in courses:
+            if course.is_colored:
+                colored_courses += 1
+                continue
+
+            if self._colored_neighbors[course]:
+                color = self._get_smallest_available_color(course)
+            else:
+                color = self._get_first_course_color(course)
+
+            if color:
+                colored_courses = self._attempt_course_color(
+                    course, colored_courses, color=color
+                )
+
+        return colored_courses
+
+    def _violates(self, course):
+        """
+        Returns True if the color of the given course conflicts with a colored
+        neighbor, or would not be fair to its students given the other exams.
+        """
+        day, slot = course.color.day, course.color.slot
+
+        if self._forbidden_masks[course] >> (day * self.slots + slot) & 1:
+            return True
+
+        # Check fairness as if the course was being colored now
+        self.loads.remove(course.students, day, slot)
+        fair = self._is_fair_to_schedule(course, day)
+        self.loads.add(course.students, day, slot)
+
+        return not fair
+
+    def _paint_dsatur(self):
+        """
+        Colors the courses in DSATUR order: the next course is always the one
+        whose colored neighbors rule out the most colors. Ties are broken by
+        the static course order (degree, largest weight, then key).
+
+        A heap holds (-saturation, rank, course) entries. Coloring a course
+        pushes fresh entries for its neighbors, and entries whose saturation
+        is out of date are skipped when popped.
+        """
+        sorted_courses: List[Course] = self._get_sorted_courses()
+        ranks = self._ranks
+        colored_courses = 0
+
+        heap = [
+            (-self._get_saturation(course), rank, course)
+            for rank, course in enumerate(sorted_courses)
+            if not course.is_colored
+        ]
+        heapq.heapify(heap)
+
+        # Colors only get harder to find as the painting goes on, so a course
+        # that could not be colored once is never tried again.
+        failed = set()
+
+        while heap:
+            saturation, _, course = heapq.heappop(heap)
+
+            if course.is_colored or course in failed:
+                continue
+
+            if -saturation != self._get_saturation(course):
+                continue
+
+            if self._colored_neighbors[course]:
+                color = self._get_smallest_available_color(course)
+            else:
+                color = self._get_first_course_color(course)
+
+                if not color and not colored_courses:
+                    raise RuntimeError("No schedule is possible.")
+
+            if not color:
+                if self._stop_on_failure:
+                    raise _PaintingFailed()
+
+                failed.add(course)
+                continue
+
+            colored_courses = self._attempt_course_color(
+                course, colored_courses, color=color
+            )
+
+            for neighbor, _ in self.graph.get_adjacency_list(course):
+                if not neighbor.is_colored:
+                    heapq.heappush(
+                        heap,
+                        (-self._get_saturation(neighbor), ranks[neighbor], neighbor),
+                    )
 
         return colored_courses
 
-    def paint(self):
+    def _paint_greedy(self):
         """
-        The main logic of coloring the courses.
+        Colors the courses in a static order, sorted by degree, largest weight
+        then key, coloring the adjacency list of every course after it.
         """
-        sorted_courses: List[Course] = sorted(self.graph, reverse=True)
+        sorted_courses: List[Course] = self._get_sorted_courses()
+        ranks = self._ranks
         colored_courses = 0
 
         if not len(sorted_courses):
@@ -197,12 +637,12 @@ class GraphPainter(object):
             if not course.is_colored:
                 colored_courses = self._attempt_course_color(course, colored_courses)
 
-            # Process adjacent courses
+            # Process adjacent courses, in the order of sorted_courses
             sorted_adjacency_courses = sorted(
-                self.graph.get_adjacency_list(course), reverse=True
+                self.graph.get_adjacency_list(course), key=lambda pair: ranks[pair[0]]
             )
 
-            for (adj_course, _) in sorted_adjacency_courses:
+            for adj_course, _ in sorted_adjacency_courses:
                 if not adj_course.is_colored:
                     colored_courses = self._attempt_course_color(
                         adj_course, colored_courses
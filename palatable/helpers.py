@@ -1,13 +1,17 @@
-def read_file(path: str):
+def read_file(path: str, buffering: int = -1):
     """
     A helper function that opens a fiel for read-only and yeilds
-    the lines one by one. It filters comments out.
+    the lines one by one. It filters comments out. The file is closed once
+    all the lines are consumed.
+
+    @param buffering The read buffer size in bytes, -1 for the default.
     """
-    for line in open(path, "r"):
-        if line.startswith("#"):
-            continue
+    with open(path, "r", buffering=buffering) as file:
+        for line in file:
+            if line.startswith("#"):
+                continue
 
-        yield line
+            yield line
 
 
 def calculate_distance(first: int, second: int) -> int:
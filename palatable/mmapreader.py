@@ -0,0 +1,56 @@
+import mmap
+
+
+def iter_lines(path: str):
+    """
+    A memory-mapped counterpart of helpers.read_file. Yields the lines of the
+    file as bytes, without decoding them, and filters comments out.
+    """
+    with open(path, "rb") as file:
+        # An empty file cannot be mapped
+        if not file.seek(0, 2):
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for line in iter(mapped.readline, b""):
+                if line.startswith(b"#"):
+                    continue
+
+                yield line
+
+
+def read_courses(path: str):
+    """
+    Yields a (key, name, level, sections) tuple for every line of the
+    courses file.
+    """
+    for line in iter_lines(path):
+        key, name, level, sections = line.split()
+        yield key.decode(), name.decode(), int(level), int(sections)
+
+
+def read_schedule(path: str, ids):
+    """
+    Yields a (student_id, indices) tuple for every student in the schedule
+    file. The lines are split as bytes and the course keys are looked up in
+    `ids`, a dict from encoded course key to integer index, so no token is
+    decoded. Courses missing from `ids` are skipped, and the student id is
+    left as bytes.
+    """
+    get = ids.get
+
+    for line in iter_lines(path):
+        tokens = line.split()
+        if not tokens:
+            continue
+
+        indices = [idx for idx in map(get, tokens[1:]) if idx is not None]
+        yield tokens[0], indices
+
+
+def intern_keys(keys):
+    """
+    Returns the dict read_schedule expects: every key encoded once and mapped
+    to its position in `keys`.
+    """
+    return {key.encode(): idx for idx, key in enumerate(keys)}
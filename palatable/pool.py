@@ -0,0 +1,93 @@
+"""
+Worker processes that paint one shared conflict graph with many parameters.
+
+Every worker loads the graph from the same graph cache. The CSR arrays are
+memory-mapped, so the graph is shared read-only between the processes, while
+the courses' colors and the painter state stay private to each worker.
+"""
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from palatable import graphcache
+from palatable.catalog import Catalog
+from palatable.graphpainter import GraphPainter
+
+# The graph and catalog a worker process paints, set by init_worker
+_worker = {}
+
+
+def init_worker(cache_path: str, schedule_path: str, courses_path: str):
+    catalog = Catalog()
+    graph = graphcache.load_graph(cache_path, catalog, schedule_path, courses_path)
+
+    if graph is None:
+        raise RuntimeError(f"The graph cache {cache_path} could not be loaded.")
+
+    _worker["graph"] = graph
+    _worker["catalog"] = catalog
+
+
+def painter_pool(
+    cache_path: str, schedule_path: str, courses_path: str, processes: int
+) -> ProcessPoolExecutor:
+    """
+    Returns a pool of `processes` workers painting the graph of the cache.
+    """
+    # Spawned, not forked: a forked worker would inherit the sockets and files
+    # the parent has open at that time and keep them from ever closing.
+    return ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+        initargs=(cache_path, schedule_path, courses_path),
+    )
+
+
+def paint(days: int, slots: int, fairness: int, strategy: str = "greedy", seed=None):
+    """
+    Paints the graph of this worker process, see paint_graph.
+    """
+    return paint_graph(
+        _worker["graph"], _worker["catalog"], days, slots, fairness, strategy, seed
+    )
+
+
+def paint_graph(
+    graph,
+    catalog,
+    days: int,
+    slots: int,
+    fairness: int,
+    strategy: str = "greedy",
+    seed=None,
+):
+    """
+    Paints the graph with the given parameters, see GraphPainter.
+
+    @returns A JSON-ready dict: the number of colored courses, the largest
+             number of exams a student has in a day, the painting time, and
+             the keys of the courses in every day and slot.
+    """
+    # The previous call left its colors on the courses
+    for course in catalog.courses():
+        course.color = None
+
+    start = time.perf_counter()
+    painter = GraphPainter(
+        graph, days, slots, fairness, strategy=strategy, catalog=catalog, seed=seed
+    )
+    colored_courses = painter.paint()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "colored_courses": colored_courses,
+        "courses": len(graph),
+        "max_load": max(map(painter.loads.get_max_load, range(days)), default=0),
+        "elapsed": elapsed,
+        "schedule": [
+            [[course.key for course in color.colored_courses] for color in row]
+            for row in painter.colors
+        ],
+    }
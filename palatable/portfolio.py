@@ -0,0 +1,216 @@
+"""
+Portfolio painting: `palatable --portfolio N`.
+
+The coloring a painter finds depends on the order it colors courses in. A
+portfolio runs several painters on the same graph in parallel worker
+processes, with different strategies and seeded random tie-breaks, and keeps
+the best coloring: the most colored courses, then the lowest student load.
+"""
+
+import multiprocessing
+import os
+import tempfile
+from collections import namedtuple
+
+from palatable import graphcache, pool
+from palatable.graphpainter import STRATEGIES
+
+# A painter of the portfolio: its strategy, and the seed breaking ties in the
+# course order at random, None to break them by course key.
+Member = namedtuple("Member", ["strategy", "seed"])
+
+# What a member found. max_load is the largest number of exams a student has
+# in a day, coloring the (day, slot) of every colored course key, and error
+# the reason the painter failed, None when it did not.
+MemberResult = namedtuple(
+    "MemberResult",
+    [
+        "index",
+        "member",
+        "colored_courses",
+        "courses",
+        "max_load",
+        "elapsed",
+        "coloring",
+        "error",
+    ],
+)
+
+# The best result, the results of the members that finished in member order,
+# and the members cancelled once a result met the target.
+PortfolioReport = namedtuple("PortfolioReport", ["best", "results", "cancelled"])
+
+
+def portfolio_members(count: int, strategy: str = "greedy"):
+    """
+    Returns `count` members: every strategy with ties broken by key, the
+    given strategy first, then the strategies in turn with seeded random
+    tie-breaks.
+    """
+    strategies = [strategy] + [other for other in STRATEGIES if other != strategy]
+
+    return [
+        Member(
+            strategies[index % len(strategies)],
+            None if index < len(strategies) else index,
+        )
+        for index in range(count)
+    ]
+
+
+def _paint_member(task):
+    index, days, slots, fairness, member = task
+
+    try:
+        result = pool.paint(days, slots, fairness, member.strategy, member.seed)
+    except (RuntimeError, ValueError) as error:
+        return MemberResult(index, member, 0, None, None, None, {}, str(error))
+
+    coloring = {
+        key: (day, slot)
+        for day, row in enumerate(result["schedule"])
+        for slot, keys in enumerate(row)
+        for key in keys
+    }
+
+    return MemberResult(
+        index,
+        member,
+        result["colored_courses"],
+        result["courses"],
+        result["max_load"],
+        result["elapsed"],
+        coloring,
+        None,
+    )
+
+
+def _score(result):
+    """
+    Orders results from worst to best: by colored courses, then by lowest
+    student load, then by earliest member.
+    """
+    load = float("inf") if result.max_load is None else result.max_load
+    return (result.colored_courses, -load, -result.index)
+
+
+def _meets_target(result, target_load):
+    return (
+        result.error is None
+        and result.colored_courses == result.courses
+        and result.max_load <= target_load
+    )
+
+
+def paint_portfolio(
+    cache_path: str,
+    schedule_path: str,
+    courses_path: str,
+    days: int,
+    slots: int,
+    fairness: int,
+    members,
+    processes: int = None,
+    target_load: int = None,
+):
+    """
+    Paints the graph of the cache once per member, in parallel worker
+    processes.
+
+    With a target load, the portfolio stops at the first result that colors
+    every course with no student having more exams in a day than the
+    target, and the painters still running are terminated.
+
+    @returns A PortfolioReport.
+    """
+    if not members:
+        raise ValueError("A portfolio needs at least one member.")
+
+    processes = min(len(members), processes or os.cpu_count() or 1)
+    tasks = [
+        (index, days, slots, fairness, member) for index, member in enumerate(members)
+    ]
+
+    results = []
+
+    # Spawned for the same reason as pool.painter_pool. A multiprocessing
+    # pool, unlike an executor, terminates its running workers on exit.
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(
+        processes,
+        initializer=pool.init_worker,
+        initargs=(cache_path, schedule_path, courses_path),
+    ) as workers:
+        for result in workers.imap_unordered(_paint_member, tasks):
+            results.append(result)
+
+            if target_load is not None and _meets_target(result, target_load):
+                break
+
+    results.sort(key=lambda result: result.index)
+    finished = {result.index for result in results}
+
+    return PortfolioReport(
+        max(results, key=_score),
+        results,
+        [member for index, member in enumerate(members) if index not in finished],
+    )
+
+
+def run_portfolio(args, painter):
+    """
+    Paints with a portfolio of args.portfolio members and gives the painter
+    the best coloring. The workers load the painter's graph from the graph
+    cache, a temporary one unless --graph-cache is given.
+
+    @returns A PortfolioReport.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        cache_path = args.graph_cache
+
+        if not cache_path:
+            cache_path = os.path.join(directory, "graph.bin")
+            graphcache.save_graph(
+                cache_path, painter.graph, painter.catalog, args.schedule, args.courses
+            )
+
+        report = paint_portfolio(
+            cache_path,
+            args.schedule,
+            args.courses,
+            args.days,
+            args.slots,
+            args.fairness,
+            portfolio_members(args.portfolio, args.strategy),
+            target_load=args.target_load,
+        )
+
+    painter.apply_coloring(report.best.coloring)
+
+    return report
+
+
+def print_portfolio(report):
+    """
+    Prints the results of the portfolio members and which one won.
+    """
+    from tabulate import tabulate
+
+    table = [
+        [
+            result.index,
+            result.member.strategy,
+            "" if result.member.seed is None else result.member.seed,
+            result.error or result.colored_courses,
+            "" if result.max_load is None else result.max_load,
+            "" if result.elapsed is None else f"{result.elapsed:.4f}",
+            "*" if result is report.best else "",
+        ]
+        for result in report.results
+    ]
+
+    headers = ["member", "strategy", "seed", "colored", "max load", "time (s)", "best"]
+    print(tabulate(table, headers=headers, tablefmt="fancy_grid"))
+
+    if report.cancelled:
+        print(f"Cancelled {len(report.cancelled)} member(s) once the target was met.")
@@ -0,0 +1,201 @@
+"""
+Per-phase timings and hot-path counters of a scheduling run.
+
+A Profiler is passed to GraphBuilder and GraphPainter, which let it wrap some
+of their methods on the instance. Nothing is wrapped, and nothing is paid,
+when no profiler is given.
+
+    profiler = Profiler()
+    graph = GraphBuilder(slots, schedule, courses, profiler=profiler).build()
+    GraphPainter(graph, days, slots, fairness, profiler=profiler).paint()
+    print(profiler.to_json())
+
+Phases nest: the time of a phase includes the phases it calls, build includes
+read_courses for instance.
+"""
+
+import inspect
+import json
+import sys
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from functools import partial, wraps
+from time import perf_counter
+
+# The GraphBuilder methods timed, and the phases they are recorded under.
+# Generators are timed per item, so read_schedule counts the students read.
+BUILDER_PHASES = {
+    "build": "build",
+    "_read_courses": "read_courses",
+    "_iter_students": "read_schedule",
+    "_stream_schedule": "stream_schedule",
+    "_process_courses": "process_courses",
+    "_process_courses_sparse": "process_courses_sparse",
+    "_build_parallel": "build_parallel",
+}
+
+# Same for GraphPainter
+PAINTER_PHASES = {
+    "paint": "paint",
+    "minimize_days": "minimize_days",
+    "_reset": "reset",
+    "_get_sorted_courses": "sort_courses",
+    "_get_smallest_available_color": "color_search",
+    "_is_fair_to_schedule": "fairness_check",
+    "_set_course_color": "set_color",
+    "_update_forbidden_colors": "update_forbidden_colors",
+}
+
+# Counters of the hot inner operations, per wrapped method a list of the
+# counter names and the functions computing how much a call adds from its
+# arguments. validity_checks, the candidate colors the color searches examine,
+# is counted by the search itself, see instrument_painter.
+PAINTER_COUNTERS = {
+    "_is_fair_to_schedule": [
+        ("fairness_checks", lambda course, day: 1),
+        ("students_checked", lambda course, day: len(course.students)),
+    ],
+    "_update_forbidden_colors": [
+        ("neighbors_scanned", lambda course, day, slot, step: course.degree),
+    ],
+}
+
+
+class Profiler(object):
+    """
+    Records the wall time and the number of calls of every phase, and named
+    counters. Hooks registered with add_hook are called with the phase name
+    and the elapsed seconds every time a phase ends.
+    """
+
+    def __init__(self) -> None:
+        # Phase name -> [calls, seconds], in the order phases first end
+        self.phases = {}
+        self.counters = Counter()
+        self.hooks = []
+
+    def add_hook(self, hook):
+        """
+        Registers hook(phase, elapsed), called every time a phase ends.
+        """
+        self.hooks.append(hook)
+
+    def record(self, phase: str, elapsed: float, calls: int = 1):
+        stats = self.phases.get(phase)
+        if stats is None:
+            stats = self.phases[phase] = [0, 0.0]
+
+        stats[0] += calls
+        stats[1] += elapsed
+
+        for hook in self.hooks:
+            hook(phase, elapsed)
+
+    def count(self, counter: str, by: int = 1):
+        self.counters[counter] += by
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Times the body of the with statement as one call of the phase.
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, perf_counter() - start)
+
+    def wrap(self, obj, method: str, phase: str, counters=()):
+        """
+        Replaces the method of the given object, the instance only, with one
+        that records its calls under the phase. counters are (name, function)
+        pairs, the function returns how much a call adds to the counter from
+        the call arguments.
+        """
+        function = getattr(obj, method)
+        record = self.record
+        totals = self.counters
+
+        if inspect.isgeneratorfunction(function):
+
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                iterator = function(*args, **kwargs)
+
+                while True:
+                    start = perf_counter()
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        record(phase, perf_counter() - start, calls=0)
+                        return
+
+                    record(phase, perf_counter() - start)
+                    yield item
+
+        else:
+
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                for name, amount in counters:
+                    totals[name] += amount(*args, **kwargs)
+
+                start = perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    record(phase, perf_counter() - start)
+
+        setattr(obj, method, wrapper)
+
+    def instrument_builder(self, builder):
+        for method, phase in BUILDER_PHASES.items():
+            self.wrap(builder, method, phase)
+
+    def instrument_painter(self, painter):
+        for method, phase in PAINTER_PHASES.items():
+            self.wrap(painter, method, phase, PAINTER_COUNTERS.get(method, ()))
+
+        painter._count_candidate = partial(self.count, "validity_checks")
+
+    def as_dict(self):
+        return {
+            "phases": {
+                phase: {"calls": calls, "seconds": seconds}
+                for phase, (calls, seconds) in self.phases.items()
+            },
+            "counters": dict(self.counters),
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def print_table(self, file=None):
+        """
+        Prints the phases and the counters as tables, to stderr by default.
+        """
+        from tabulate import tabulate
+
+        file = sys.stderr if file is None else file
+
+        table = [
+            [phase, calls, seconds] for phase, (calls, seconds) in self.phases.items()
+        ]
+        print(
+            tabulate(table, headers=["phase", "calls", "time (s)"], floatfmt=".6f"),
+            file=file,
+        )
+
+        if self.counters:
+            print(file=file)
+            print(
+                tabulate(sorted(self.counters.items()), headers=["counter", "count"]),
+                file=file,
+            )
+
+
+def phase(profiler, name: str):
+    """
+    profiler.phase(name), or a no-op without a profiler.
+    """
+    return nullcontext() if profiler is None else profiler.phase(name)
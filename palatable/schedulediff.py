@@ -0,0 +1,78 @@
+from palatable.helpers import read_file
+
+
+class ScheduleDiff(object):
+    """
+    The difference between two versions of the schedule (enrollment) file,
+    as the course keys of the students that were added, removed or changed.
+
+    Removed and changed students carry their old course keys, so the diff can
+    be applied to a graph built without keeping the students.
+    """
+
+    def __init__(self, added=None, removed=None, changed=None) -> None:
+        """
+        @param added   A dict from student id to the keys of their courses
+        @param removed A dict from student id to the keys of their old courses
+        @param changed A dict from student id to an (old keys, new keys) tuple
+        """
+        self.added = added or {}
+        self.removed = removed or {}
+        self.changed = changed or {}
+
+    @classmethod
+    def from_files(cls, old_path: str, new_path: str):
+        """
+        Compares two schedule files line by line, by student id. Students whose
+        courses are the same in any order are left out.
+        """
+        old = cls._read(old_path)
+        new = cls._read(new_path)
+
+        diff = cls()
+        for student_id, courses in new.items():
+            if student_id not in old:
+                diff.added[student_id] = courses
+            elif sorted(old[student_id]) != sorted(courses):
+                diff.changed[student_id] = (old[student_id], courses)
+
+        for student_id, courses in old.items():
+            if student_id not in new:
+                diff.removed[student_id] = courses
+
+        return diff
+
+    @staticmethod
+    def _read(path: str):
+        schedules = {}
+
+        for line in read_file(path):
+            tokens = line.split()
+            if tokens:
+                schedules[tokens[0]] = tokens[1:]
+
+        return schedules
+
+    def __iter__(self):
+        """
+        Yields a (student_id, old keys, new keys) tuple for every student in the
+        diff. The old keys are None for added students and the new keys are
+        None for removed ones.
+        """
+        for student_id, courses in self.removed.items():
+            yield student_id, courses, None
+
+        for student_id, (old, new) in self.changed.items():
+            yield student_id, old, new
+
+        for student_id, courses in self.added.items():
+            yield student_id, None, courses
+
+    def __len__(self):
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ScheduleDiff: added={len(self.added)} removed={len(self.removed)} "
+            f"changed={len(self.changed)}>"
+        )
@@ -1,17 +1,124 @@
 import argparse
+import importlib
+import sys
 
-from tabulate import tabulate
+# Only what parsing the arguments needs is imported at the module level, so
+# `palatable -h` stays fast. The rest is imported where it is used.
+from palatable.catalog import Catalog
+from palatable.graphbuilder import ENGINES, READERS, GraphBuilder
+from palatable.graphpainter import STRATEGIES, GraphPainter
 
-from palatable.graphbuilder import GraphBuilder
-from palatable.graphpainter import GraphPainter
+# The subcommands and the modules implementing their main()
+COMMANDS = {
+    "serve": "palatable.server",
+    "sweep": "palatable.sweep",
+}
 
 
-def parse_arguments():
+def add_input_arguments(parser):
+    """
+    Adds the arguments that locate the input files and build the conflict
+    graph, shared by the commands.
+    """
+    parser.add_argument(
+        "--schedule",
+        "-d",
+        type=str,
+        required=True,
+        help="The path of the file for students' enrollments.",
+    )
+
+    parser.add_argument(
+        "--courses",
+        "-c",
+        type=str,
+        required=True,
+        help="The path of the file that hosts courses' data.",
+    )
+
+    parser.add_argument(
+        "--engine",
+        "-e",
+        type=str,
+        required=False,
+        default="python",
+        choices=ENGINES,
+        help=(
+            "The engine that builds the conflict graph. The sparse engine needs "
+            "numpy and scipy, and falls back to python when they are missing."
+        ),
+    )
+
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        required=False,
+        default=1,
+        help=(
+            "Number of processes that build the conflict graph in parallel. "
+            "Only supported by the python engine."
+        ),
+    )
+
+    parser.add_argument(
+        "--buffer-size",
+        type=int,
+        required=False,
+        default=-1,
+        help="Read buffer size in bytes for the input files, -1 for the default.",
+    )
+
+    parser.add_argument(
+        "--reader",
+        type=str,
+        required=False,
+        default="text",
+        choices=READERS,
+        help=(
+            "How the input files are parsed. mmap memory-maps the files and "
+            "tokenizes bytes without decoding them, which is faster on big files."
+        ),
+    )
+
+    parser.add_argument(
+        "--graph-cache",
+        type=str,
+        required=False,
+        default=None,
+        help=(
+            "Path of a binary cache of the conflict graph. It is reused while the "
+            "schedule and courses files are unchanged, and rebuilt otherwise."
+        ),
+    )
+
+
+def check_input_arguments(parser, args):
+    """
+    Exits with a usage error when the arguments added by add_input_arguments
+    can't build a graph.
+    """
+    if args.workers < 1:
+        parser.error("--workers must be at least 1.")
+
+    if args.workers > 1 and args.engine != "python":
+        parser.error("--workers is only supported by the python engine.")
+
+    if args.buffer_size != -1 and args.buffer_size < 2:
+        parser.error("--buffer-size must be -1 or at least 2.")
+
+
+def parse_arguments(argv=None):
     """
     Command line arguments parser.
     """
     # Create the parser
-    parser = argparse.ArgumentParser()
+    parser = argparse.ArgumentParser(
+        epilog=(
+            "Run `palatable serve -h` for the long-lived scheduling service, and "
+            "`palatable sweep -h` to try many days, slots and fairness values."
+        )
+    )
 
     # Add an argument
     parser.add_argument(
@@ -50,29 +157,85 @@ def parse_arguments():
         ),
     )
 
+    add_input_arguments(parser)
+
     parser.add_argument(
-        "--schedule",
-        "-d",
+        "--strategy",
+        "-t",
         type=str,
-        required=True,
-        help="The path of the file for students' enrollments.",
+        required=False,
+        default="greedy",
+        choices=STRATEGIES,
+        help=(
+            "The order courses are colored in. greedy follows a static order by "
+            "degree, dsatur colors the most constrained course first."
+        ),
     )
 
     parser.add_argument(
-        "--courses",
-        "-c",
-        type=str,
-        required=True,
-        help="The path of the file that hosts courses' data.",
+        "--minimize-days",
+        action="store_true",
+        help=(
+            "Search for the smallest number of days that colors every course with "
+            "the given slots, instead of using --days, and print the time of "
+            "every probe."
+        ),
+    )
+
+    parser.add_argument(
+        "--portfolio",
+        type=int,
+        metavar="N",
+        help=(
+            "Run N painters in parallel worker processes, with different "
+            "strategies and seeded random tie-breaks, and keep the schedule "
+            "coloring the most courses with the lowest student load."
+        ),
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "--target-load",
+        type=int,
+        metavar="L",
+        help=(
+            "With --portfolio, stop at the first schedule coloring every course "
+            "where no student has more than L exams in a day, and cancel the "
+            "other painters."
+        ),
+    )
+
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="table",
+        choices=("table", "json"),
+        default=None,
+        help=(
+            "Print the wall time and calls of every phase, and counters of the hot "
+            "operations, to stderr as a table (the default) or as JSON."
+        ),
+    )
+
+    args = parser.parse_args(argv)
+    check_input_arguments(parser, args)
+
+    if args.portfolio is not None:
+        if args.portfolio < 1:
+            parser.error("--portfolio needs at least one painter.")
+        if args.minimize_days:
+            parser.error("--portfolio and --minimize-days can't be combined.")
+    elif args.target_load is not None:
+        parser.error("--target-load needs --portfolio.")
+
+    return args
 
 
 def print_schedule(colors, days, slots):
     """
     Prints the final exam schedule.
     """
+    from tabulate import tabulate
+
     table = []
     for day in range(days):
         row = []
@@ -87,16 +250,144 @@ def print_schedule(colors, days, slots):
     print(tabulate(table, headers=headers, showindex="always", tablefmt="fancy_grid"))
 
 
-def main():
+def print_probes(report):
+    """
+    Prints the probes of a days minimization and its outcome.
+    """
+    from tabulate import tabulate
+
+    table = [
+        [probe.days, probe.colored_courses, probe.feasible, f"{probe.elapsed:.4f}"]
+        for probe in report.probes
+    ]
+
+    headers = ["days", "colored", "feasible", "time (s)"]
+    print(tabulate(table, headers=headers, tablefmt="fancy_grid"))
+
+    if report.days is None:
+        print("No number of days colors every course.")
+    else:
+        print(f"Minimum days: {report.days}")
+
+
+def print_profile(profiler, output):
+    """
+    Prints the profiler report to stderr, as JSON or as a table.
+    """
+    if output == "json":
+        print(profiler.to_json(indent=2), file=sys.stderr)
+    else:
+        profiler.print_table()
+
+
+def get_graph(args, keep_students=True, profiler=None):
+    """
+    Loads the conflict graph from the cache when it is given and valid, builds
+    it (and saves the cache) otherwise.
+
+    @returns The graph and the catalog of its courses and students.
+    """
+    graph = None
+    catalog = Catalog()
+    if args.graph_cache:
+        from palatable import graphcache, profiling
+
+        with profiling.phase(profiler, "load_graph_cache"):
+            graph = graphcache.load_graph(
+                args.graph_cache, catalog, args.schedule, args.courses
+            )
+
+    if graph is None:
+        builder = GraphBuilder(
+            args.slots,
+            args.schedule,
+            args.courses,
+            engine=args.engine,
+            workers=args.workers,
+            keep_students=keep_students,
+            buffer_size=args.buffer_size,
+            reader=args.reader,
+            catalog=catalog,
+            profiler=profiler,
+        )
+        graph = builder.build()
+
+        if args.graph_cache:
+            with profiling.phase(profiler, "save_graph_cache"):
+                graphcache.save_graph(
+                    args.graph_cache, graph, catalog, args.schedule, args.courses
+                )
+
+    return graph, catalog
+
+
+def main(argv=None):
     # Remove 1st argument from the list of command line arguments
-    args = parse_arguments()
+    argv = sys.argv[1:] if argv is None else argv
+
+    if argv and argv[0] in COMMANDS:
+        return importlib.import_module(COMMANDS[argv[0]]).main(argv[1:])
+
+    args = parse_arguments(argv)
+
+    profiler = None
+    if args.profile:
+        from palatable.profiling import Profiler
+
+        profiler = Profiler()
+
+    graph, catalog = get_graph(
+        args,
+        # Students are only needed to check fairness, a cached graph might be
+        # reused with a different fairness though. Portfolio members are scored
+        # by student load.
+        keep_students=args.fairness > 0
+        or bool(args.graph_cache)
+        or bool(args.portfolio),
+        profiler=profiler,
+    )
+
+    painter = GraphPainter(
+        graph,
+        args.days,
+        args.slots,
+        fairness=args.fairness,
+        strategy=args.strategy,
+        catalog=catalog,
+        profiler=profiler,
+    )
+
+    report = None
+    days = args.days
+
+    if args.minimize_days:
+        report = painter.minimize_days()
+        days = report.days
+    elif args.portfolio:
+        from palatable.portfolio import run_portfolio
+
+        report = run_portfolio(args, painter)
+    else:
+        painter.paint()
+
+    if days is not None:
+        if profiler is None:
+            print_schedule(painter.colors, days, args.slots)
+        else:
+            with profiler.phase("print_schedule"):
+                print_schedule(painter.colors, days, args.slots)
+
+    if args.minimize_days:
+        print_probes(report)
+    elif args.portfolio:
+        from palatable.portfolio import print_portfolio
 
-    graph = GraphBuilder(args.slots, args.schedule, args.courses).build()
+        print_portfolio(report)
 
-    painter = GraphPainter(graph, args.days, args.slots, fairness=args.fairness)
-    painter.paint()
+    if profiler is not None:
+        print_profile(profiler, args.profile)
 
-    print_schedule(painter.colors, args.days, args.slots)
+    return 1 if days is None else 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,387 @@
+"""
+A long-lived scheduling service: `palatable serve`.
+
+The conflict graph is built (or loaded from the graph cache) once, then every
+painting request is answered from memory with its own days, slots, fairness
+and strategy. Requests are painted in a pool of worker processes sharing the
+graph read-only, see palatable.pool, so concurrent requests never see each
+other's colors.
+
+The protocol is plain HTTP/1.1 with JSON bodies, over TCP or a Unix socket:
+
+    GET  /health                           Graph and catalog sizes, pool restarts
+    GET  /paint?days=5&slots=5&fairness=2  Paints with the given parameters
+    POST /paint {"days": 5, "slots": 5}    Same, with a JSON body
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import parse_qsl, urlsplit
+
+from palatable import graphcache
+from palatable.graphpainter import STRATEGIES
+from palatable.pool import paint, painter_pool
+from palatable.scheduler import add_input_arguments, check_input_arguments, get_graph
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    422: "Unprocessable Entity",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class ScheduleServer(object):
+    """
+    Answers painting requests from a graph cache, see the module docstring.
+    """
+
+    def __init__(
+        self,
+        cache_path: str,
+        schedule_path: str,
+        courses_path: str,
+        processes: int = 1,
+        days: int = 5,
+        slots: int = 5,
+        fairness: int = 2,
+        strategy: str = "greedy",
+    ) -> None:
+        """
+        @param cache_path The graph cache written by graphcache.save_graph
+        @param processes  Number of worker processes painting requests
+        @param days, slots, fairness, strategy
+                          Defaults of the requests that leave them out
+        """
+        if processes < 1:
+            raise ValueError("The number of processes must be at least 1.")
+
+        self.cache_path = cache_path
+        self.schedule_path = schedule_path
+        self.courses_path = courses_path
+        self.processes = processes
+        self.defaults = {
+            "days": days,
+            "slots": slots,
+            "fairness": fairness,
+            "strategy": strategy,
+        }
+
+        self.executor = None
+        self.health = {}
+
+    async def start(self, host="127.0.0.1", port=8080, path=None):
+        """
+        Starts the worker processes and listens on the TCP address, or on the
+        Unix socket at `path` when it is given.
+
+        @returns The asyncio server.
+        """
+        # Only the workers load the graph, the sizes are in the metadata
+        metadata = graphcache.read_metadata(
+            self.cache_path, self.schedule_path, self.courses_path
+        )
+        if metadata is None:
+            raise RuntimeError(f"The graph cache {self.cache_path} is not valid.")
+
+        self.health = {
+            "status": "ok",
+            "courses": metadata["nodes"],
+            "students": len(metadata["students"]),
+            "processes": self.processes,
+            # Pools replaced after a worker died
+            "restarts": 0,
+        }
+
+        self.executor = self._painter_pool()
+
+        if path:
+            return await asyncio.start_unix_server(self._handle, path=path)
+
+        return await asyncio.start_server(self._handle, host, port)
+
+    def _painter_pool(self):
+        return painter_pool(
+            self.cache_path, self.schedule_path, self.courses_path, self.processes
+        )
+
+    def _replace_pool(self, broken):
+        """
+        Replaces the broken pool with a new one, unless a request that failed
+        with it already did.
+        """
+        if self.executor is broken:
+            broken.shutdown(wait=False, cancel_futures=True)
+            self.executor = self._painter_pool()
+            self.health["restarts"] += 1
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    async def _handle(self, reader, writer):
+        try:
+            status, body = await self._respond(reader)
+        except Exception as error:  # pragma: no cover, a last resort
+            status, body = 500, {"error": str(error)}
+
+        payload = json.dumps(body).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            "Connection: close\r\n\r\n".encode() + payload
+        )
+
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _respond(self, reader):
+        """
+        Reads one request and returns the status code and the JSON body of the
+        response.
+        """
+        try:
+            method, target, params = await self._read_request(reader)
+        except ValueError as error:
+            return 400, {"error": str(error)}
+
+        path = urlsplit(target).path
+
+        if path == "/health":
+            if method != "GET":
+                return 405, {"error": f"{method} is not allowed on {path}."}
+
+            return 200, self.health
+
+        if path == "/paint":
+            if method not in ("GET", "POST"):
+                return 405, {"error": f"{method} is not allowed on {path}."}
+
+            return await self._paint(params)
+
+        return 404, {"error": f"Unknown path {path}."}
+
+    async def _paint(self, params):
+        """
+        Paints in a worker process, 400 for invalid parameters and 422 when
+        the painter cannot schedule with them. 503 when a worker died, the
+        pool is replaced for the next requests.
+        """
+        try:
+            arguments = self._paint_arguments(params)
+        except (TypeError, ValueError) as error:
+            return 400, {"error": str(error)}
+
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        try:
+            result = await loop.run_in_executor(executor, paint, *arguments)
+        except BrokenProcessPool as error:
+            # A RuntimeError too, but the request was not at fault
+            self._replace_pool(executor)
+            return 503, {"error": str(error)}
+        except (RuntimeError, ValueError) as error:
+            return 422, {"error": str(error)}
+
+        return 200, result
+
+    @staticmethod
+    async def _read_request(reader):
+        """
+        Parses the request line, the headers and the body of a request. The
+        query string and the JSON body are merged into the parameters.
+        """
+        request_line = (await reader.readline()).decode("latin-1")
+
+        try:
+            method, target, _ = request_line.split(" ", 2)
+        except ValueError:
+            raise ValueError("Malformed request line.")
+
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1")
+            if line in ("\r\n", "\n", ""):
+                break
+
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        params = dict(parse_qsl(urlsplit(target).query))
+
+        length = int(headers.get("content-length", 0))
+        if length:
+            body = json.loads(await reader.readexactly(length))
+            if not isinstance(body, dict):
+                raise ValueError("The request body must be a JSON object.")
+
+            params.update(body)
+
+        return method, target, params
+
+    def _paint_arguments(self, params):
+        """
+        Validates the painting parameters, missing ones take the defaults.
+        """
+        unknown = set(params) - set(self.defaults)
+        if unknown:
+            raise ValueError(f"Unknown parameters: {', '.join(sorted(unknown))}.")
+
+        values = dict(self.defaults, **params)
+        days = int(values["days"])
+        slots = int(values["slots"])
+        fairness = int(values["fairness"])
+        strategy = values["strategy"]
+
+        if days < 1 or slots < 1:
+            raise ValueError("days and slots must be at least 1.")
+
+        if fairness < 0:
+            raise ValueError("fairness must not be negative.")
+
+        if strategy not in STRATEGIES:
+            raise ValueError(
+                f"Unknown strategy {strategy}, expected one of {STRATEGIES}."
+            )
+
+        return days, slots, fairness, strategy
+
+    async def serve_forever(self, host="127.0.0.1", port=8080, path=None):
+        server = await self.start(host, port, path)
+
+        address = path or "http://{}:{}".format(*server.sockets[0].getsockname()[:2])
+        print(f"Serving on {address}", flush=True)
+
+        async with server:
+            await server.serve_forever()
+
+
+def parse_arguments(argv=None):
+    """
+    Command line arguments parser of `palatable serve`.
+    """
+    parser = argparse.ArgumentParser(prog="palatable serve")
+
+    parser.add_argument(
+        "--slots",
+        "-s",
+        type=int,
+        required=False,
+        default=5,
+        help="Number of exam time slots in a day, for requests that leave it out.",
+    )
+
+    parser.add_argument(
+        "--days",
+        "-y",
+        type=int,
+        required=False,
+        default=5,
+        help="Number of exam days, for requests that leave it out.",
+    )
+
+    parser.add_argument(
+        "--fairness",
+        "-f",
+        type=int,
+        required=False,
+        default=2,
+        help="The fairness parameter, for requests that leave it out.",
+    )
+
+    parser.add_argument(
+        "--strategy",
+        "-t",
+        type=str,
+        required=False,
+        default="greedy",
+        choices=STRATEGIES,
+        help="The painting strategy, for requests that leave it out.",
+    )
+
+    add_input_arguments(parser)
+
+    parser.add_argument(
+        "--host",
+        type=str,
+        required=False,
+        default="127.0.0.1",
+        help="The address to listen on.",
+    )
+
+    parser.add_argument(
+        "--port",
+        type=int,
+        required=False,
+        default=8080,
+        help="The TCP port to listen on.",
+    )
+
+    parser.add_argument(
+        "--socket",
+        type=str,
+        required=False,
+        default=None,
+        help="Listen on a Unix socket at this path instead of TCP.",
+    )
+
+    parser.add_argument(
+        "--processes",
+        "-p",
+        type=int,
+        required=False,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes painting requests concurrently.",
+    )
+
+    args = parser.parse_args(argv)
+    check_input_arguments(parser, args)
+
+    return args
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        # The workers load the graph from the cache, a temporary one unless
+        # --graph-cache is given.
+        if not args.graph_cache:
+            args.graph_cache = os.path.join(directory, "graph.bin")
+
+        # Built (and cached) only when the cache is missing or out of date,
+        # the graph itself is not kept.
+        metadata = graphcache.read_metadata(
+            args.graph_cache, args.schedule, args.courses
+        )
+        if metadata is None:
+            get_graph(args)
+
+        server = ScheduleServer(
+            args.graph_cache,
+            args.schedule,
+            args.courses,
+            processes=args.processes,
+            days=args.days,
+            slots=args.slots,
+            fairness=args.fairness,
+            strategy=args.strategy,
+        )
+
+        try:
+            asyncio.run(server.serve_forever(args.host, args.port, args.socket))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
@@ -5,19 +5,23 @@ class Student(object):
     and courses enrolled in.
     """
 
-    _all_students = set()
+    # No per-instance __dict__, there can be hundreds of thousands of students
+    __slots__ = ("key", "_registered_courses")
 
     def __init__(self, key: str) -> None:
-        if key in self._all_students:
-            raise AttributeError(f"Student with the same key already exists: {key}")
-
-        self._all_students.add(key)
-
         self.key = key  # A student unique key
-        self._registered_courses = set()  # Courses Schedule for this student
+
+        # Courses Schedule for this student. A tuple, not a set: a student takes
+        # a handful of courses, and a small set costs ten times more memory.
+        self._registered_courses = ()
 
     def add_course(self, course):
-        self._registered_courses.add(course)
+        if course not in self._registered_courses:
+            self._registered_courses += (course,)
+
+    def remove_course(self, course):
+        courses = self._registered_courses
+        self._registered_courses = tuple(c for c in courses if c is not course)
 
     @property
     def courses(self):
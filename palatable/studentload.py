@@ -0,0 +1,106 @@
+from collections import Counter
+
+
+class StudentLoadIndex(object):
+    """
+    Keeps how many exams every student has per day and per (day, slot) while
+    courses get colored and uncolored.
+
+    All queries are O(1): the exams of a student in a day or a slot, whether a
+    student has two exams in the same slot of a day, and the largest number of
+    exams any student has in a day.
+    """
+
+    def __init__(self, days: int, slots: int) -> None:
+        self.days = days
+        self.slots = slots
+
+        self._day_load = [Counter() for _ in range(days)]
+        self._slot_load = [[Counter() for _ in range(slots)] for _ in range(days)]
+
+        # Number of slots of a day in which the student has two exams or more
+        self._double_booked = [Counter() for _ in range(days)]
+
+        # Per day, how many students have exactly n exams, and the largest n
+        self._histogram = [Counter() for _ in range(days)]
+        self._max_load = [0] * days
+
+    def add(self, students, day: int, slot: int):
+        """
+        Records an exam on the given day and slot for every student.
+        """
+        day_load = self._day_load[day]
+        slot_load = self._slot_load[day][slot]
+        histogram = self._histogram[day]
+
+        for student in students:
+            load = day_load[student] + 1
+            day_load[student] = load
+
+            if load > 1:
+                self._decrement(histogram, load - 1)
+            histogram[load] += 1
+            if load > self._max_load[day]:
+                self._max_load[day] = load
+
+            slot_load[student] += 1
+            if slot_load[student] == 2:
+                self._double_booked[day][student] += 1
+
+    def remove(self, students, day: int, slot: int):
+        """
+        Removes an exam on the given day and slot for every student.
+        """
+        day_load = self._day_load[day]
+        slot_load = self._slot_load[day][slot]
+        histogram = self._histogram[day]
+
+        for student in students:
+            if not slot_load[student]:
+                raise ValueError(
+                    f"Student {student} has no exam on day {day}, slot {slot}."
+                )
+
+            if slot_load[student] == 2:
+                self._decrement(self._double_booked[day], student)
+            self._decrement(slot_load, student)
+
+            load = day_load[student] - 1
+            self._decrement(day_load, student)
+
+            self._decrement(histogram, load + 1)
+            if load:
+                histogram[load] += 1
+
+        while self._max_load[day] and not histogram[self._max_load[day]]:
+            self._max_load[day] -= 1
+
+    @staticmethod
+    def _decrement(counter: Counter, key):
+        counter[key] -= 1
+        if counter[key] <= 0:
+            del counter[key]
+
+    def get_day_load(self, student, day: int) -> int:
+        """
+        Returns the number of exams the student has on the given day.
+        """
+        return self._day_load[day][student]
+
+    def get_slot_load(self, student, day: int, slot: int) -> int:
+        """
+        Returns the number of exams the student has on the given day and slot.
+        """
+        return self._slot_load[day][slot][student]
+
+    def is_double_booked(self, student, day: int) -> bool:
+        """
+        Returns True if the student has two exams in the same slot of the day.
+        """
+        return student in self._double_booked[day]
+
+    def get_max_load(self, day: int) -> int:
+        """
+        Returns the largest number of exams any student has on the given day.
+        """
+        return self._max_load[day]
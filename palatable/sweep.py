@@ -0,0 +1,261 @@
+"""
+What-if sweeps: `palatable sweep`.
+
+The conflict graph is built once, then painted for every combination of the
+given days, slots and fairness values, in parallel across a pool of worker
+processes sharing the graph read-only, see palatable.pool.
+"""
+
+import argparse
+import os
+import tempfile
+from collections import namedtuple
+from functools import partial
+from itertools import product
+
+from palatable import graphcache, pool
+from palatable.catalog import Catalog
+from palatable.graphbuilder import GraphBuilder
+from palatable.graphpainter import STRATEGIES
+from palatable.scheduler import add_input_arguments, check_input_arguments
+
+# The outcome of one configuration of a sweep. max_load is the largest number
+# of exams a student has in a day, elapsed the painting time in seconds, and
+# error the reason the painter failed, None when it did not.
+SweepResult = namedtuple(
+    "SweepResult",
+    [
+        "days",
+        "slots",
+        "fairness",
+        "colored_courses",
+        "courses",
+        "max_load",
+        "elapsed",
+        "error",
+    ],
+)
+
+
+def _paint_configuration(paint, days: int, slots: int, fairness: int, strategy: str):
+    try:
+        result = paint(days, slots, fairness, strategy)
+    except (RuntimeError, ValueError) as error:
+        return SweepResult(days, slots, fairness, None, None, None, None, str(error))
+
+    return SweepResult(
+        days,
+        slots,
+        fairness,
+        result["colored_courses"],
+        result["courses"],
+        result["max_load"],
+        result["elapsed"],
+        None,
+    )
+
+
+def sweep(
+    schedule_path: str,
+    courses_path: str,
+    days,
+    slots,
+    fairness,
+    strategy: str = "greedy",
+    processes: int = 1,
+    graph_cache: str = None,
+    **options,
+):
+    """
+    Paints the schedule once for every combination of the days, slots and
+    fairness values.
+
+    The graph is built once by GraphBuilder, with the extra options (engine,
+    workers, buffer_size, reader), or loaded from graph_cache when it is
+    valid. With more than one process, the configurations are painted in a
+    process pool that loads the graph from the cache, a temporary one unless
+    graph_cache is given.
+
+    @returns A SweepResult per configuration, in the order of
+             itertools.product(days, slots, fairness).
+    """
+    if processes < 1:
+        raise ValueError("The number of processes must be at least 1.")
+
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy {strategy}, expected one of {STRATEGIES}.")
+
+    configurations = list(product(days, slots, fairness))
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache_path = graph_cache or os.path.join(directory, "graph.bin")
+
+        catalog = Catalog()
+        graph = graphcache.load_graph(cache_path, catalog, schedule_path, courses_path)
+
+        if graph is None:
+            builder = GraphBuilder(
+                max(slots, default=1),
+                schedule_path,
+                courses_path,
+                catalog=catalog,
+                **options,
+            )
+            graph = builder.build()
+
+            if graph_cache or processes > 1:
+                graphcache.save_graph(
+                    cache_path, graph, catalog, schedule_path, courses_path
+                )
+
+        if processes == 1:
+            paint = partial(pool.paint_graph, graph, catalog)
+            return [
+                _paint_configuration(paint, *configuration, strategy)
+                for configuration in configurations
+            ]
+
+        with pool.painter_pool(
+            cache_path, schedule_path, courses_path, processes
+        ) as executor:
+            return list(
+                executor.map(
+                    _paint_configuration,
+                    [pool.paint] * len(configurations),
+                    *zip(*configurations),
+                    [strategy] * len(configurations),
+                )
+            )
+
+
+def shortest_complete(results):
+    """
+    Returns the result of the shortest exam period, fewest days then fewest
+    slots, that colors every course. None if no configuration does.
+    """
+    complete = [
+        result
+        for result in results
+        if result.error is None and result.colored_courses == result.courses
+    ]
+
+    return min(
+        complete,
+        key=lambda result: (result.days * result.slots, result.days, result.slots),
+        default=None,
+    )
+
+
+def print_results(results):
+    """
+    Prints the summary table of a sweep.
+    """
+    from tabulate import tabulate
+
+    table = [
+        [
+            result.days,
+            result.slots,
+            result.fairness,
+            result.error or f"{result.colored_courses}/{result.courses}",
+            "" if result.max_load is None else result.max_load,
+            "" if result.elapsed is None else f"{result.elapsed:.4f}",
+        ]
+        for result in results
+    ]
+
+    headers = ["days", "slots", "fairness", "colored", "max load", "time (s)"]
+    print(tabulate(table, headers=headers, tablefmt="fancy_grid"))
+
+    best = shortest_complete(results)
+    if best is None:
+        print("No configuration colors every course.")
+    else:
+        print(
+            f"Shortest complete schedule: {best.days} days x {best.slots} slots, "
+            f"fairness {best.fairness}."
+        )
+
+
+def parse_arguments(argv=None):
+    """
+    Command line arguments parser of `palatable sweep`.
+    """
+    parser = argparse.ArgumentParser(prog="palatable sweep")
+
+    parser.add_argument(
+        "--slots",
+        "-s",
+        type=int,
+        nargs="+",
+        required=False,
+        default=[5],
+        help="The numbers of exam time slots in a day to try.",
+    )
+
+    parser.add_argument(
+        "--days",
+        "-y",
+        type=int,
+        nargs="+",
+        required=False,
+        default=[5],
+        help="The numbers of exam days to try.",
+    )
+
+    parser.add_argument(
+        "--fairness",
+        "-f",
+        type=int,
+        nargs="+",
+        required=False,
+        default=[2],
+        help="The fairness values to try.",
+    )
+
+    parser.add_argument(
+        "--strategy",
+        "-t",
+        type=str,
+        required=False,
+        default="greedy",
+        choices=STRATEGIES,
+        help="The painting strategy of every configuration.",
+    )
+
+    add_input_arguments(parser)
+
+    parser.add_argument(
+        "--processes",
+        "-p",
+        type=int,
+        required=False,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes painting configurations concurrently.",
+    )
+
+    args = parser.parse_args(argv)
+    check_input_arguments(parser, args)
+
+    return args
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+
+    results = sweep(
+        args.schedule,
+        args.courses,
+        args.days,
+        args.slots,
+        args.fairness,
+        strategy=args.strategy,
+        processes=args.processes,
+        graph_cache=args.graph_cache,
+        engine=args.engine,
+        workers=args.workers,
+        buffer_size=args.buffer_size,
+        reader=args.reader,
+    )
+
+    print_results(results)
@@ -10,7 +10,11 @@ setup(
     name="palatable",
     version="0.1.2",
     packages=["palatable"],
-    install_requires=["Faker==13.11.1", "tabulate==0.8.9"],
+    install_requires=["tabulate==0.8.9"],
+    extras_require={
+        "sparse": ["numpy", "scipy"],
+        "test": ["Faker==13.11.1", "ddt"],
+    },
     entry_points={
         "console_scripts": [
             "palatable = palatable.scheduler:main",
@@ -1,21 +1,40 @@
+import os
+import tempfile
 from unittest import TestCase as UnittestTestCase
 
 from faker import Faker
 
 from palatable.course import Course
 from palatable.graph import Graph
+from palatable.graphbuilder import GraphBuilder
+from palatable.graphcache import save_graph
 from palatable.graphpainter import GraphPainter
-from palatable.student import Student
+
+# Input files of FilesTestCase. Ethics shares no student with another course,
+# and 9999999 is not in the courses file.
+COURSES = """# key name level sections
+1901204 LogicDesign 2 1
+1901351 Numerical 3 1
+1904232 MIS 2 1
+1921411 Networks 4 1
+1921412 Security 4 1
+1921413 Ethics 4 1
+"""
+
+SCHEDULE = """# student courses
+0125897 1901204 1901351 1904232
+0325887 1901204 1901351
+0325888 1921411 1921412
+0325889 1904232 1901351 1921412
+0325890 1904232 1901204
+0325891 1921413 9999999
+"""
 
 
 class TestCase(UnittestTestCase):
     def setUp(self) -> None:
         self.fake = Faker()
 
-    def tearDown(self) -> None:
-        Student._all_students = set()
-        Course._all_courses = {}
-
 
 class GraphTestCase(TestCase):
     def setUp(self) -> None:
@@ -53,3 +72,40 @@ class GraphTestCase(TestCase):
         sections = 3
 
         return Course(key, name, level, sections)
+
+
+class FilesTestCase(TestCase):
+    """
+    Writes COURSES and SCHEDULE to a temporary directory.
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.courses_path = self._write("courses.txt", COURSES)
+        self.schedule_path = self._write("schedule.txt", SCHEDULE)
+        self.cache_path = os.path.join(self.directory.name, "graph.bin")
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.directory.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as file:
+            file.write(content)
+
+        return path
+
+    def _save_graph(self, slots=1):
+        """
+        Builds the graph of the files and saves it to the graph cache.
+        """
+        gb = GraphBuilder(slots, self.schedule_path, self.courses_path)
+        graph = gb.build()
+        save_graph(
+            self.cache_path, graph, gb.catalog, self.schedule_path, self.courses_path
+        )
+
+        return graph
@@ -0,0 +1,118 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from palatable.catalog import Catalog
+from palatable.course import Course
+from palatable.student import Student
+from tests.case import TestCase
+
+
+class TestCatalogCourses(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.catalog = Catalog()
+        self.key = self.fake.bothify(text="#######")
+        self.name = self.fake.word()
+        self.level = self.fake.random_digit_not_null()
+        self.sections = self.fake.random_digit_not_null()
+
+    def _course(self, key=None):
+        return Course(key or self.key, self.name, self.level, self.sections)
+
+    def test_add_course(self):
+        course = self._course()
+
+        self.assertIs(course, self.catalog.add_course(course))
+        self.assertTrue(self.catalog.has_course(self.key))
+        self.assertIs(course, self.catalog.get_course(self.key))
+
+    def test_add_course_same_key(self):
+        self.catalog.add_course(self._course())
+
+        with self.assertRaises(AttributeError):
+            self.catalog.add_course(self._course())
+
+        self.assertEqual(1, len(self.catalog.courses()))
+
+    def test_courses(self):
+        self.assertListEqual([], list(self.catalog.courses()))
+
+        first = self.catalog.add_course(self._course("1"))
+        second = self.catalog.add_course(self._course("2"))
+
+        self.assertListEqual([first, second], list(self.catalog.courses()))
+
+    def test_course_does_not_exist(self):
+        self.catalog.add_course(self._course())
+
+        self.assertFalse(self.catalog.has_course("should-not-exist"))
+        self.assertIsNone(self.catalog.get_course("should-not-exist"))
+
+    def test_catalogs_are_independent(self):
+        other = Catalog()
+
+        self.catalog.add_course(self._course())
+        other.add_course(self._course())
+
+        self.assertIsNot(self.catalog.get_course(self.key), other.get_course(self.key))
+
+
+class TestCatalogStudents(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.catalog = Catalog()
+
+    def test_add_student(self):
+        student = Student("test-key-1")
+
+        self.assertIs(student, self.catalog.add_student(student))
+        self.assertTrue(self.catalog.has_student("test-key-1"))
+        self.assertIs(student, self.catalog.get_student("test-key-1"))
+
+    def test_add_student_same_key(self):
+        self.catalog.add_student(Student("test-key-1"))
+
+        with self.assertRaises(AttributeError):
+            self.catalog.add_student(Student("test-key-1"))
+
+        self.assertEqual(1, len(self.catalog.students()))
+
+    def test_students(self):
+        first = self.catalog.add_student(Student("test-key-1"))
+        second = self.catalog.add_student(Student("test-key-2"))
+
+        self.assertListEqual([first, second], list(self.catalog.students()))
+
+    def test_remove_student(self):
+        student = self.catalog.add_student(Student("test-key-1"))
+
+        self.assertIs(student, self.catalog.remove_student("test-key-1"))
+        self.assertFalse(self.catalog.has_student("test-key-1"))
+        self.assertIsNone(self.catalog.remove_student("test-key-1"))
+
+        # The key can be taken again
+        self.catalog.add_student(Student("test-key-1"))
+
+    def test_student_does_not_exist(self):
+        self.assertFalse(self.catalog.has_student("should-not-exist"))
+        self.assertIsNone(self.catalog.get_student("should-not-exist"))
+
+    def test_add_students_from_threads(self):
+        catalogs = [Catalog() for _ in range(4)]
+
+        def fill(catalog):
+            for key in range(1000):
+                catalog.add_student(Student(str(key)))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(fill, catalogs))
+
+        for catalog in catalogs:
+            self.assertEqual(1000, len(catalog.students()))
+
+    def test_repr(self):
+        self.catalog.add_student(Student("test-key-1"))
+
+        self.assertEqual(
+            f"<Catalog: {id(self.catalog)} courses=0 students=1>", repr(self.catalog)
+        )
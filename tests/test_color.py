@@ -12,7 +12,7 @@ class TestColorInit(TestCase):
         color = Color(key, day=day, slot=slot, instances=instances)
 
         self.assertEqual(key, color.key)
-        self.assertIsInstance(color.name, str)
+        self.assertEqual(f"D{day}S{slot}", color.name)
 
         self.assertEqual(day, color.day)
         self.assertEqual(slot, color.slot)
@@ -26,7 +26,7 @@ class TestColorInit(TestCase):
         color = Color(key)
 
         self.assertEqual(key, color.key)
-        self.assertIsInstance(color.name, str)
+        self.assertEqual("D0S0", color.name)
 
         self.assertEqual(0, color.day)
         self.assertEqual(0, color.slot)
@@ -35,6 +35,22 @@ class TestColorInit(TestCase):
         self.assertListEqual([], color.colored_courses)
         self.assertEqual(0, color.available_instances)
 
+    def test_init_name(self):
+        color = Color(self.fake.random_int(), name="Red")
+
+        self.assertEqual("Red", color.name)
+
+    def test_init_names_unique(self):
+        # Far more colors than a palette of color names has
+        names = {
+            Color(key, day=day, slot=slot).name
+            for key, (day, slot) in enumerate(
+                (day, slot) for day in range(40) for slot in range(10)
+            )
+        }
+
+        self.assertEqual(400, len(names))
+
 
 class TestCalculateWeight(TestCase):
     def test_calculate_weight_formula(self):
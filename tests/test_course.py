@@ -30,30 +30,6 @@ class TestCourseInit(TestCase):
         self.assertIsNone(course.color)
         self.assertIsNone(course.time_slot)
 
-    def test_course_same_key(self):
-        Course(self.key, self.name, self.level, self.sections)
-
-        with self.assertRaises(AttributeError):
-            Course(self.key, self.name, self.level, self.sections)
-
-        self.assertIn(self.key, Course._all_courses)
-        self.assertEqual(1, len(Course._all_courses))
-
-    def test_all_courses(self):
-        self.assertEqual(0, len(Course._all_courses))
-
-        key_1 = self.fake.bothify(text="#######")
-        Course(key_1, self.name, self.level, self.sections)
-
-        self.assertIn(key_1, Course._all_courses)
-        self.assertEqual(1, len(Course._all_courses))
-
-        key_2 = self.fake.bothify(text="#######")
-        Course(key_2, self.name, self.level, self.sections)
-
-        self.assertIn(key_2, Course._all_courses)
-        self.assertEqual(2, len(Course._all_courses))
-
 
 class TestCourseIsColored(TestCase):
     def setUp(self) -> None:
@@ -77,49 +53,6 @@ class TestCourseIsColored(TestCase):
         self.assertTrue(self.course.is_colored)
 
 
-class TestCourseExistsGet(TestCase):
-    def test_exists(self):
-        key = self.fake.bothify(text="#######")
-        name = self.fake.random_digit_not_null()
-        level = self.fake.random_digit_not_null()
-        sections = self.fake.random_digit_not_null()
-
-        Course(key, name, level, sections)
-
-        self.assertTrue(Course.exists(key))
-
-    def test_get(self):
-        key = self.fake.bothify(text="#######")
-        name = self.fake.random_digit_not_null()
-        level = self.fake.random_digit_not_null()
-        sections = self.fake.random_digit_not_null()
-
-        actual = Course(key, name, level, sections)
-        retrieved = Course.get(key)
-
-        self.assertEqual(actual, retrieved)
-
-    def test_does_not_exists(self):
-        key = self.fake.bothify(text="#######")
-        name = self.fake.random_digit_not_null()
-        level = self.fake.random_digit_not_null()
-        sections = self.fake.random_digit_not_null()
-
-        Course(key, name, level, sections)
-
-        self.assertFalse(Course.exists("should-not-exist"))
-
-    def test_get_does_not_exists(self):
-        key = self.fake.bothify(text="#######")
-        name = self.fake.random_digit_not_null()
-        level = self.fake.random_digit_not_null()
-        sections = self.fake.random_digit_not_null()
-
-        Course(key, name, level, sections)
-
-        self.assertIsNone(Course.get("should-not-exist"))
-
-
 class TestCourseStudents(TestCase):
     def setUp(self) -> None:
         super().setUp()
@@ -0,0 +1,103 @@
+from array import array
+
+from palatable.csrgraph import CSRGraph
+from palatable.graph import Graph
+from palatable.graphpainter import GraphPainter
+from tests.case import GraphTestCase as TestCase
+
+
+class TestCSRGraphInit(TestCase):
+    def test_init_bad_indptr(self):
+        with self.assertRaises(ValueError):
+            CSRGraph(["a", "b"], array("i", [0, 1]), array("i"), array("i"))
+
+    def test_init_bad_weights(self):
+        with self.assertRaises(ValueError):
+            CSRGraph(["a"], array("i", [0, 1]), array("i", [0]), array("i"))
+
+    def test_init_ids(self):
+        g = CSRGraph(["a", "b"], array("i", [0, 0, 0]), array("i"), array("i"))
+
+        self.assertEqual(0, g.get_id("a"))
+        self.assertEqual(1, g.get_id("b"))
+        self.assertIsNone(g.get_id("c"))
+        self.assertEqual("b", g.get_course(1))
+
+
+class TestCSRGraphFromGraph(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.source = Graph(directed=False)
+        self.source.add_edge("a", "b")
+        self.source.add_edge("a", "c", weight=3)
+        self.source.add_edge("b", "d", weight=2)
+
+        self.g = CSRGraph.from_graph(self.source)
+
+    def test_from_graph_arrays(self):
+        self.assertFalse(self.g.directed)
+        self.assertEqual(4, len(self.g))
+        self.assertEqual(len(self.g) + 1, len(self.g.indptr))
+
+        # Every undirected edge is stored in both rows
+        self.assertEqual(6, len(self.g.indices))
+        self.assertEqual("i", self.g.indices.typecode)
+        self.assertEqual("i", self.g.weights.typecode)
+
+    def test_from_graph_rows_sorted(self):
+        for idx in range(len(self.g)):
+            indices, _ = self.g.neighbors(idx)
+            self.assertListEqual(sorted(indices), list(indices))
+
+    def test_iter(self):
+        self.assertListEqual(list(self.source), list(self.g))
+        self.assertListEqual(list(self.source.nodes()), self.g.nodes())
+
+    def test_get_weight(self):
+        for course in self.source:
+            for neighbor, weight in self.source.get_adjacency_list(course):
+                self.assertEqual(weight, self.g.get_weight(course, neighbor))
+                self.assertTrue(self.g.contains_edge(course, neighbor))
+
+    def test_get_weight_no_edge(self):
+        self.assertIsNone(self.g.get_weight("c", "d"))
+        self.assertIsNone(self.g.get_weight("a", "z"))
+        self.assertFalse(self.g.contains_edge("z", "a"))
+
+    def test_get_degree_and_largest_weight(self):
+        for course in self.source:
+            self.assertEqual(self.source.get_degree(course), self.g.get_degree(course))
+            self.assertEqual(
+                self.source.get_largest_weight(course),
+                self.g.get_largest_weight(course),
+            )
+
+    def test_get_adjacency_list(self):
+        for course in self.source:
+            self.assertSetEqual(
+                set(self.source.get_adjacency_list(course)),
+                set(self.g.get_adjacency_list(course)),
+            )
+
+        self.assertListEqual([], self.g.get_adjacency_list("z"))
+
+    def test_repr(self):
+        self.assertEqual(f"<CSRGraph: {id(self.g)} courses=4 edges=6>", repr(self.g))
+
+
+class TestCSRGraphPaint(TestCase):
+    def test_paint_same_as_graph(self):
+        expected = self.gp.paint()
+        colors = {course: course.color.key for course in self.graph}
+
+        for course in self.graph:
+            course.color = None
+
+        gp = GraphPainter(
+            CSRGraph.from_graph(self.graph), self.days, self.slots, self.fairness
+        )
+        self.assertEqual(expected, gp.paint())
+
+        for course in self.graph:
+            self.assertEqual(colors[course], course.color.key)
@@ -1,6 +1,7 @@
 from collections import defaultdict
 from unittest.mock import patch
 
+from palatable.course import Course
 from palatable.graph import Graph, GraphIterator
 from tests.case import TestCase
 
@@ -11,14 +12,14 @@ class TestGraphInit(TestCase):
 
         self.assertFalse(g.directed)
         self.assertEqual(0, len(g.adj_list))
-        self.assertEqual(g.adj_list, defaultdict(set))
+        self.assertEqual(g.adj_list, defaultdict(dict))
 
     def test_graph_init_directed(self):
         g = Graph(directed=True)
 
         self.assertTrue(g.directed)
         self.assertEqual(0, len(g.adj_list))
-        self.assertEqual(g.adj_list, defaultdict(set))
+        self.assertEqual(g.adj_list, defaultdict(dict))
 
 
 class TestGraphDunderMethods(TestCase):
@@ -41,9 +42,20 @@ class TestGraphDunderMethods(TestCase):
         self.assertIsInstance(iter(g), GraphIterator)
         self.assertEqual(iter(g).adj_list, g.adj_list)
 
+    def test_nodes(self):
+        g = Graph(directed=False)
+        g.add_edge("a", "b")
+
+        nodes = g.nodes()
+        self.assertSetEqual({"a", "b"}, set(nodes))
+
+        # The view follows the graph as it grows
+        g.add_edge("b", "c")
+        self.assertSetEqual({"a", "b", "c"}, set(nodes))
+
     def test_str(self):
         g = Graph()
-        g.adj_list = defaultdict(set)
+        g.adj_list = defaultdict(dict)
 
         for i in range(self.fake.random_digit_not_null()):
             g.adj_list[f"key-{i}"] = [
@@ -62,38 +74,53 @@ class TestGetAdjacencyList(TestCase):
         super().setUp()
 
         self.g = Graph()
-        self.g.adj_list = defaultdict(set)
+        self.g.adj_list = defaultdict(dict)
 
         for i in range(self.fake.random_digit_not_null()):
-            self.g.adj_list[f"key-{i}"] = [
-                f"value-{j}" for j in range(self.fake.random_digit_not_null())
-            ]
+            self.g.adj_list[f"key-{i}"] = {
+                f"value-{j}": j for j in range(self.fake.random_digit_not_null())
+            }
 
     def test_get_adjacency_list(self):
         key = "key-0"
 
-        self.assertEqual(self.g.adj_list[key], self.g.get_adjacency_list(key))
+        self.assertSetEqual(
+            set(self.g.adj_list[key].items()), set(self.g.get_adjacency_list(key))
+        )
+
+    def test_get_adjacency_list_pairs(self):
+        g = Graph(directed=False)
+        g.add_edge("a", "b")
+        g.add_edge("a", "c", weight=2)
+
+        self.assertSetEqual({("b", 1), ("c", 2)}, set(g.get_adjacency_list("a")))
+        self.assertSetEqual({("a", 1)}, set(g.get_adjacency_list("b")))
 
 
 class TestCourseWeight(TestCase):
     def test_get_largest_weight(self):
         g = Graph()
         g.adj_list = {
-            "a": {("b", 1), ("c", 2), ("d", 3)},
-            "b": {("a", 6), ("c", 5), ("d", 4)},
-            "d": {("a", 7), ("c", 9), ("b", 8)},
+            "a": {"b": 1, "c": 2, "d": 3},
+            "b": {"a": 6, "c": 5, "d": 4},
+            "d": {"a": 7, "c": 9, "b": 8},
         }
 
         self.assertEqual(3, g.get_largest_weight("a"))
         self.assertEqual(6, g.get_largest_weight("b"))
         self.assertEqual(9, g.get_largest_weight("d"))
 
+    def test_get_largest_weight_no_neighbors(self):
+        g = Graph()
+
+        self.assertEqual(0, g.get_largest_weight("a"))
+
     def test_directed_get_weight_success(self):
         g = Graph(directed=True)
         g.adj_list = {
-            "a": {("b", 1), ("c", 2)},
-            "b": {("a", 6), ("c", 5), ("d", 4)},
-            "d": {("a", 7)},
+            "a": {"b": 1, "c": 2},
+            "b": {"a": 6, "c": 5, "d": 4},
+            "d": {"a": 7},
         }
 
         self.assertEqual(1, g.get_weight("a", "b"))
@@ -104,9 +131,9 @@ class TestCourseWeight(TestCase):
     def test_not_directed_get_weight_success(self):
         g = Graph(directed=False)
         g.adj_list = {
-            "a": {("b", 1), ("c", 2)},
-            "b": {("a", 1)},
-            "c": {("a", 2)},
+            "a": {"b": 1, "c": 2},
+            "b": {"a": 1},
+            "c": {"a": 2},
         }
 
         self.assertEqual(1, g.get_weight("a", "b"))
@@ -118,9 +145,9 @@ class TestCourseWeight(TestCase):
     def test_directed_get_weight_no_edge_courses_exist(self):
         g = Graph(directed=True)
         g.adj_list = {
-            "a": {("b", 1), ("c", 2)},
-            "b": {("a", 6), ("c", 5), ("d", 4)},
-            "d": {("a", 7)},
+            "a": {"b": 1, "c": 2},
+            "b": {"a": 6, "c": 5, "d": 4},
+            "d": {"a": 7},
         }
 
         self.assertEqual(7, g.get_weight("d", "a"))
@@ -132,9 +159,9 @@ class TestCourseWeight(TestCase):
     def test_directed_get_weight_no_courses(self):
         g = Graph(directed=True)
         g.adj_list = {
-            "a": {("b", 1), ("c", 2)},
-            "b": {("a", 6), ("c", 5), ("d", 4)},
-            "d": {("a", 7)},
+            "a": {"b": 1, "c": 2},
+            "b": {"a": 6, "c": 5, "d": 4},
+            "d": {"a": 7},
         }
 
         self.assertIsNone(g.get_weight("f", "a"))
@@ -144,9 +171,9 @@ class TestCourseWeight(TestCase):
     def test_not_directed_get_weight_no_edge_courses_exist(self):
         g = Graph(directed=False)
         g.adj_list = {
-            "a": {("b", 1), ("c", 2)},
-            "b": {("a", 1)},
-            "c": {("a", 2)},
+            "a": {"b": 1, "c": 2},
+            "b": {"a": 1},
+            "c": {"a": 2},
         }
 
         self.assertIsNone(g.get_weight("b", "c"))
@@ -155,9 +182,9 @@ class TestCourseWeight(TestCase):
     def test_not_directed_get_weight_no_courses(self):
         g = Graph(directed=False)
         g.adj_list = {
-            "a": {("b", 1), ("c", 2)},
-            "b": {("a", 1)},
-            "c": {("a", 2)},
+            "a": {"b": 1, "c": 2},
+            "b": {"a": 1},
+            "c": {"a": 2},
         }
 
         self.assertIsNone(g.get_weight("b", "d"))
@@ -171,7 +198,7 @@ class TestCourseWeight(TestCase):
             g.set_weight("a", "b", 3)
 
         with self.assertRaises(ValueError):
-            g.adj_list = {"a": {("b", 1)}}
+            g.adj_list = {"a": {"b": 1}}
             g.set_weight("b", "a", 3)
 
     def test_set_weight_not_directed_graph_no_courses(self):
@@ -182,8 +209,8 @@ class TestCourseWeight(TestCase):
 
         # This should pass
         g.adj_list = {
-            "a": {("b", 1)},
-            "b": {("a", 1)},
+            "a": {"b": 1},
+            "b": {"a": 1},
         }
         weight = g.set_weight("b", "a", 3)
         self.assertEqual(weight, 3)
@@ -191,18 +218,18 @@ class TestCourseWeight(TestCase):
     def test_set_weight_not_directed_graph(self):
         g = Graph(directed=False)
         g.adj_list = {
-            "a": {("b", 1), ("c", 2)},
-            "b": {("a", 1)},
-            "c": {("a", 2)},
+            "a": {"b": 1, "c": 2},
+            "b": {"a": 1},
+            "c": {"a": 2},
         }
 
         weight = g.set_weight("a", "b", 3)
         self.assertEqual(weight, 3)
         self.assertDictEqual(
             {
-                "a": {("b", 3), ("c", 2)},
-                "b": {("a", 3)},
-                "c": {("a", 2)},
+                "a": {"b": 3, "c": 2},
+                "b": {"a": 3},
+                "c": {"a": 2},
             },
             g.adj_list,
         )
@@ -211,9 +238,9 @@ class TestCourseWeight(TestCase):
         self.assertEqual(weight, 4)
         self.assertDictEqual(
             {
-                "a": {("b", 4), ("c", 2)},
-                "b": {("a", 4)},
-                "c": {("a", 2)},
+                "a": {"b": 4, "c": 2},
+                "b": {"a": 4},
+                "c": {"a": 2},
             },
             g.adj_list,
         )
@@ -221,18 +248,18 @@ class TestCourseWeight(TestCase):
     def test_set_weight_directed_graph(self):
         g = Graph(directed=True)
         g.adj_list = {
-            "a": {("b", 1), ("c", 2)},
-            "b": {("a", 3)},
-            "c": {("a", 4)},
+            "a": {"b": 1, "c": 2},
+            "b": {"a": 3},
+            "c": {"a": 4},
         }
 
         weight = g.set_weight("a", "b", 3)
         self.assertEqual(weight, 3)
         self.assertDictEqual(
             {
-                "a": {("b", 3), ("c", 2)},
-                "b": {("a", 3)},
-                "c": {("a", 4)},
+                "a": {"b": 3, "c": 2},
+                "b": {"a": 3},
+                "c": {"a": 4},
             },
             g.adj_list,
         )
@@ -241,9 +268,9 @@ class TestCourseWeight(TestCase):
         self.assertEqual(weight, 5)
         self.assertDictEqual(
             {
-                "a": {("b", 3), ("c", 2)},
-                "b": {("a", 5)},
-                "c": {("a", 4)},
+                "a": {"b": 3, "c": 2},
+                "b": {"a": 5},
+                "c": {"a": 4},
             },
             g.adj_list,
         )
@@ -252,9 +279,9 @@ class TestCourseWeight(TestCase):
     def test_set_weight_not_directed_mismatch(self, mock_find_and_set_weight):
         g = Graph(directed=False)
         g.adj_list = {
-            "a": {("b", 1), ("c", 2)},
-            "b": {("a", 3)},
-            "c": {("a", 4)},
+            "a": {"b": 1, "c": 2},
+            "b": {"a": 3},
+            "c": {"a": 4},
         }
 
         with self.assertRaises(RuntimeError):
@@ -266,9 +293,9 @@ class TestCourseWeight(TestCase):
     def test_set_weight_directed_called_once(self, mock_find_and_set_weight):
         g = Graph(directed=True)
         g.adj_list = {
-            "a": {("b", 1), ("c", 2)},
-            "b": {("a", 3)},
-            "c": {("a", 4)},
+            "a": {"b": 1, "c": 2},
+            "b": {"a": 3},
+            "c": {"a": 4},
         }
 
         g.set_weight("a", "b", 3)
@@ -280,22 +307,22 @@ class TestCourseWeight(TestCase):
 
         g = Graph(directed=True)
         g.adj_list = {
-            "b": {("a", 3)},
+            "b": {"a": 3},
         }
         self.assertIsNone(g._find_and_set_weight("a", "b", 2))
 
     def test_find_and_set_weight_exists(self):
         g = Graph()
         g.adj_list = {
-            "a": {("b", 3)},
-            "b": {("a", 3)},
+            "a": {"b": 3},
+            "b": {"a": 3},
         }
         self.assertEqual(2, g._find_and_set_weight("a", "b", 2))
         self.assertDictEqual(
             g.adj_list,
             {
-                "a": {("b", 2)},
-                "b": {("a", 3)},
+                "a": {"b": 2},
+                "b": {"a": 3},
             },
         )
 
@@ -304,9 +331,9 @@ class TestCourseDegree(TestCase):
     def test_get_degree(self):
         g = Graph()
         g.adj_list = {
-            "a": {("b", 1), ("c", 2)},
-            "b": {("a", 6), ("c", 5), ("d", 4)},
-            "d": {("a", 7)},
+            "a": {"b": 1, "c": 2},
+            "b": {"a": 6, "c": 5, "d": 4},
+            "d": {"a": 7},
         }
 
         self.assertEqual(2, g.get_degree("a"))
@@ -318,9 +345,9 @@ class TestEdge(TestCase):
     def test_directed_contains_edge(self):
         g = Graph(directed=True)
         g.adj_list = {
-            "a": {("b", 1), ("c", 2)},
-            "b": {("a", 6), ("c", 5), ("d", 4)},
-            "d": {("a", 7)},
+            "a": {"b": 1, "c": 2},
+            "b": {"a": 6, "c": 5, "d": 4},
+            "d": {"a": 7},
         }
 
         self.assertTrue(g.contains_edge("a", "b"))
@@ -331,9 +358,9 @@ class TestEdge(TestCase):
     def test_not_directed_contains_edge(self):
         g = Graph(directed=False)
         g.adj_list = {
-            "a": {("b", 1), ("c", 2)},
-            "b": {("a", 1)},
-            "c": {("a", 2)},
+            "a": {"b": 1, "c": 2},
+            "b": {"a": 1},
+            "c": {"a": 2},
         }
 
         self.assertTrue(g.contains_edge("a", "b"))
@@ -343,9 +370,9 @@ class TestEdge(TestCase):
     def test_directed_does_not_contain_edge(self):
         g = Graph(directed=True)
         g.adj_list = {
-            "a": {("b", 1), ("c", 2)},
-            "b": {("a", 6), ("c", 5), ("d", 4)},
-            "d": {("a", 7)},
+            "a": {"b": 1, "c": 2},
+            "b": {"a": 6, "c": 5, "d": 4},
+            "d": {"a": 7},
         }
 
         self.assertFalse(g.contains_edge("a", "d"))
@@ -356,9 +383,9 @@ class TestEdge(TestCase):
     def test_not_directed_does_not_contain_edge(self):
         g = Graph(directed=False)
         g.adj_list = {
-            "a": {("b", 1), ("c", 2)},
-            "b": {("a", 1)},
-            "c": {("a", 2)},
+            "a": {"b": 1, "c": 2},
+            "b": {"a": 1},
+            "c": {"a": 2},
         }
 
         self.assertFalse(g.contains_edge("b", "c"))
@@ -372,12 +399,12 @@ class TestEdge(TestCase):
 
         weight = g.add_edge("a", "b")
         self.assertEqual(weight, 1)
-        expected = {"a": {("b", weight)}}
+        expected = {"a": {"b": weight}}
         self.assertDictEqual(expected, g.adj_list)
 
         weight = g.add_edge("b", "a", weight=3)
         self.assertEqual(weight, weight)
-        expected = {"a": {("b", 1)}, "b": {("a", 3)}}
+        expected = {"a": {"b": 1}, "b": {"a": 3}}
         self.assertDictEqual(expected, g.adj_list)
 
     def test_add_edge_not_directed(self):
@@ -385,12 +412,12 @@ class TestEdge(TestCase):
 
         weight = g.add_edge("a", "b")
         self.assertEqual(weight, 1)
-        expected = {"a": {("b", weight)}, "b": {("a", weight)}}
+        expected = {"a": {"b": weight}, "b": {"a": weight}}
         self.assertDictEqual(expected, g.adj_list)
 
         weight = g.add_edge("b", "c", weight=3)
         self.assertEqual(weight, 3)
-        expected = {"a": {("b", 1)}, "b": {("c", 3), ("a", 1)}, "c": {("b", 3)}}
+        expected = {"a": {"b": 1}, "b": {"c": 3, "a": 1}, "c": {"b": 3}}
         self.assertDictEqual(expected, g.adj_list)
 
     def test_add_edge_directed_exists(self):
@@ -404,7 +431,7 @@ class TestEdge(TestCase):
         # (b, a) can be added as it's a directed graph
         weight = g.add_edge("b", "a", weight=3)
         self.assertEqual(weight, weight)
-        expected = {"a": {("b", 1)}, "b": {("a", 3)}}
+        expected = {"a": {"b": 1}, "b": {"a": 3}}
         self.assertDictEqual(expected, g.adj_list)
 
     def test_add_edge_not_directed_exists(self):
@@ -417,3 +444,130 @@ class TestEdge(TestCase):
 
         with self.assertRaises(ValueError):
             g.add_edge("b", "a", weight=3)
+
+
+class TestIncrementEdge(TestCase):
+    def test_increment_edge_new_edge_not_directed(self):
+        g = Graph(directed=False)
+
+        weight = g.increment_edge("a", "b")
+        self.assertEqual(1, weight)
+        self.assertDictEqual({"a": {"b": 1}, "b": {"a": 1}}, g.adj_list)
+
+    def test_increment_edge_existing_edge_not_directed(self):
+        g = Graph(directed=False)
+        g.add_edge("a", "b", weight=2)
+
+        weight = g.increment_edge("b", "a", by=3)
+        self.assertEqual(5, weight)
+        self.assertDictEqual({"a": {"b": 5}, "b": {"a": 5}}, g.adj_list)
+
+    def test_increment_edge_directed(self):
+        g = Graph(directed=True)
+
+        g.increment_edge("a", "b")
+        g.increment_edge("a", "b")
+        g.increment_edge("b", "a")
+
+        self.assertDictEqual({"a": {"b": 2}, "b": {"a": 1}}, g.adj_list)
+
+    def test_add_weighted_edges(self):
+        g = Graph(directed=False)
+
+        g.add_weighted_edges([("a", "b", 1), ("b", "c", 3), ("b", "a", 2)])
+
+        self.assertEqual(3, g.get_weight("a", "b"))
+        self.assertEqual(3, g.get_weight("c", "b"))
+        self.assertDictEqual(
+            {"a": {"b": 3}, "b": {"a": 3, "c": 3}, "c": {"b": 3}}, g.adj_list
+        )
+
+    def test_add_weighted_edges_empty(self):
+        g = Graph(directed=False)
+        g.add_weighted_edges([])
+
+        self.assertEqual(0, len(g))
+
+
+class TestDecrementEdge(TestCase):
+    def test_decrement_edge_not_directed(self):
+        g = Graph(directed=False)
+        g.add_edge("a", "b", weight=3)
+
+        weight = g.decrement_edge("b", "a")
+        self.assertEqual(2, weight)
+        self.assertDictEqual({"a": {"b": 2}, "b": {"a": 2}}, g.adj_list)
+
+    def test_decrement_edge_removes_edge_and_lonely_courses(self):
+        g = Graph(directed=False)
+        g.add_edge("a", "b", weight=2)
+        g.add_edge("a", "c")
+
+        self.assertEqual(0, g.decrement_edge("a", "b", by=2))
+        self.assertDictEqual({"a": {"c": 1}, "c": {"a": 1}}, g.adj_list)
+        self.assertFalse(g.contains_edge("a", "b"))
+
+        self.assertEqual(0, g.decrement_edge("a", "c"))
+        self.assertEqual(0, len(g))
+
+    def test_decrement_edge_below_zero(self):
+        g = Graph(directed=False)
+        g.add_edge("a", "b", weight=2)
+
+        with self.assertRaises(ValueError):
+            g.decrement_edge("a", "b", by=3)
+
+        self.assertDictEqual({"a": {"b": 2}, "b": {"a": 2}}, g.adj_list)
+
+    def test_decrement_edge_directed(self):
+        g = Graph(directed=True)
+        g.add_edge("a", "b")
+        g.add_edge("b", "a", weight=2)
+
+        g.decrement_edge("a", "b")
+
+        self.assertDictEqual({"b": {"a": 2}}, g.adj_list)
+
+    def test_decrement_edge_no_edge(self):
+        g = Graph(directed=False)
+        g.add_edge("a", "b")
+
+        with self.assertRaises(ValueError):
+            g.decrement_edge("a", "c")
+
+        self.assertDictEqual({"a": {"b": 1}, "b": {"a": 1}}, g.adj_list)
+
+
+class TestUpdateCoursesDegrees(TestCase):
+    def test_update_courses_degrees(self):
+        a = Course("a", "A", 1, 1)
+        b = Course("b", "B", 1, 1)
+        c = Course("c", "C", 1, 1)
+
+        g = Graph(directed=False)
+        g.add_weighted_edges([(a, b, 1), (a, c, 4)])
+        g.update_courses_degrees()
+
+        self.assertEqual(2, a.degree)
+        self.assertEqual(4, a.largest_weight)
+        self.assertEqual(1, b.degree)
+        self.assertEqual(1, b.largest_weight)
+        self.assertEqual(1, c.degree)
+        self.assertEqual(4, c.largest_weight)
+
+    def test_update_courses_degrees_given_courses(self):
+        a = Course("a", "A", 1, 1)
+        b = Course("b", "B", 1, 1)
+        c = Course("c", "C", 1, 1)
+
+        g = Graph(directed=False)
+        g.add_weighted_edges([(a, b, 1), (a, c, 4)])
+        g.update_courses_degrees()
+
+        g.decrement_edge(a, c, by=4)
+        g.update_courses_degrees([a, c])
+
+        self.assertEqual(1, a.degree)
+        self.assertEqual(1, a.largest_weight)
+        self.assertEqual(0, c.degree)
+        self.assertEqual(0, c.largest_weight)
@@ -1,3 +1,4 @@
+import time
 from collections import defaultdict
 
 from palatable.graph import GraphIterator
@@ -57,3 +58,19 @@ class TestGraphIteratorNext(TestCase):
             next(gi)
 
         self.assertIsNone(gi.idx)
+
+
+class TestGraphIteratorPerformance(TestCase):
+    def test_iter_large_graph_linear_time(self):
+        """
+        Walking 50k keys used to take O(n^2) time since every step copied the
+        keys to a list. A linear walk finishes well inside this budget.
+        """
+        adj_list = {key: {} for key in range(50_000)}
+
+        start = time.perf_counter()
+        keys = list(GraphIterator(adj_list))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(adj_list), len(keys))
+        self.assertLess(elapsed, 1.0)
@@ -1,12 +1,27 @@
+import os
+import random
+import sys
+import tempfile
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from unittest import skipUnless
 from unittest.mock import patch
 
 from ddt import data, ddt, unpack
 
+from palatable.catalog import Catalog
 from palatable.course import Course
-from palatable.graphbuilder import GraphBuilder
+from palatable.graphbuilder import GraphBuilder, _count_shard, _shard_offsets
+from palatable.schedulediff import ScheduleDiff
 from tests.case import TestCase
 
+try:
+    import scipy  # noqa: F401
+
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
 
 class TestGraphBuilderInit(TestCase):
     def test_graphbuilder_init(self):
@@ -22,6 +37,29 @@ class TestGraphBuilderInit(TestCase):
 
         self.assertListEqual(gb.courses, [])
         self.assertListEqual(gb.courses_ids, [])
+        self.assertEqual("python", gb.engine)
+
+    def test_graphbuilder_init_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            GraphBuilder(1, "schedule.txt", "courses.txt", engine="unknown")
+
+    def test_graphbuilder_init_workers(self):
+        gb = GraphBuilder(1, "schedule.txt", "courses.txt", workers=4)
+        self.assertEqual(4, gb.workers)
+
+        with self.assertRaises(ValueError):
+            GraphBuilder(1, "schedule.txt", "courses.txt", workers=0)
+
+        with self.assertRaises(ValueError):
+            GraphBuilder(1, "schedule.txt", "courses.txt", engine="sparse", workers=2)
+
+    def test_graphbuilder_init_buffer_size(self):
+        gb = GraphBuilder(1, "schedule.txt", "courses.txt", buffer_size=2)
+        self.assertEqual(2, gb.buffer_size)
+
+        for buffer_size in (0, 1, -2):
+            with self.assertRaises(ValueError):
+                GraphBuilder(1, "schedule.txt", "courses.txt", buffer_size=buffer_size)
 
 
 class TestGraphBuilderReadCourses(TestCase):
@@ -96,12 +134,13 @@ class TestGraphBuilderReadSchedule(TestCase):
         }
 
         for key in keys:
-            Course(
+            course = Course(
                 key,
                 self.fake.random_digit_not_null(),
                 self.fake.random_digit_not_null(),
                 self.fake.random_digit_not_null(),
             )
+            self.gb.catalog.add_course(course)
 
     @patch("palatable.graphbuilder.read_file", return_value=[])
     def test_read_schedule_no_lines(self, *args):
@@ -116,12 +155,12 @@ class TestGraphBuilderReadSchedule(TestCase):
             "0125897         1921425     1921411     1901472",
         ]
 
-        self.assertEqual(0, len(Course._all_courses))
+        self.assertEqual(0, len(self.gb.catalog.courses()))
         schedules = self.gb._read_schedule()
 
         # One schedule has been processed
         self.assertEqual(0, len(schedules))
-        self.assertEqual(0, len(Course._all_courses))
+        self.assertEqual(0, len(self.gb.catalog.courses()))
 
     @patch("palatable.graphbuilder.read_file")
     def test_read_schedule_one_line(self, mock_read_file):
@@ -193,13 +232,13 @@ class TestGraphBuilderProcessCoruses(TestCase):
         self._add_courses()
         self.schedules = [
             [
-                Course.get("1921425"),
-                Course.get("1901472"),
-                Course.get("1921422"),
+                self.gb.catalog.get_course("1921425"),
+                self.gb.catalog.get_course("1901472"),
+                self.gb.catalog.get_course("1921422"),
             ],
             [
-                Course.get("1921411"),
-                Course.get("1901472"),
+                self.gb.catalog.get_course("1921411"),
+                self.gb.catalog.get_course("1901472"),
             ],
         ]
 
@@ -212,12 +251,13 @@ class TestGraphBuilderProcessCoruses(TestCase):
         }
 
         for key in keys:
-            Course(
+            course = Course(
                 key,
                 self.fake.random_digit_not_null(),
                 self.fake.random_digit_not_null(),
                 self.fake.random_digit_not_null(),
             )
+            self.gb.catalog.add_course(course)
 
     def test_process_courses_undirected_graph(self):
         graph = self.gb._process_courses(self.schedules)
@@ -235,7 +275,11 @@ class TestGraphBuilderProcessCoruses(TestCase):
         graph = self.gb._process_courses(self.schedules)
 
         # First schedule edges
-        self.assertTrue(graph.contains_edge(Course.get(key1), Course.get(key2)))
+        self.assertTrue(
+            graph.contains_edge(
+                self.gb.catalog.get_course(key1), self.gb.catalog.get_course(key2)
+            )
+        )
 
     @data(
         {"key1": "1921425", "key2": "1901472"},  # First schedule
@@ -248,28 +292,62 @@ class TestGraphBuilderProcessCoruses(TestCase):
     def test_process_courses_weights_ones(self, key1, key2):
         graph = self.gb._process_courses(self.schedules)
 
-        self.assertEqual(1, graph.get_weight(Course.get(key1), Course.get(key2)))
+        self.assertEqual(
+            1,
+            graph.get_weight(
+                self.gb.catalog.get_course(key1), self.gb.catalog.get_course(key2)
+            ),
+        )
 
     def test_process_courses_weights_more_than_one(self):
         graph = self.gb._process_courses(
             [
                 [
-                    Course.get("1921425"),
-                    Course.get("1901472"),
-                    Course.get("1921422"),
+                    self.gb.catalog.get_course("1921425"),
+                    self.gb.catalog.get_course("1901472"),
+                    self.gb.catalog.get_course("1921422"),
                 ],
                 [
-                    Course.get("1921425"),
-                    Course.get("1901472"),
+                    self.gb.catalog.get_course("1921425"),
+                    self.gb.catalog.get_course("1901472"),
                 ],
             ]
         )
 
         # Weight must be two since it appears in two schedules
         self.assertEqual(
-            2, graph.get_weight(Course.get("1921425"), Course.get("1901472"))
+            2,
+            graph.get_weight(
+                self.gb.catalog.get_course("1921425"),
+                self.gb.catalog.get_course("1901472"),
+            ),
         )
 
+    def test_process_courses_weights_reversed_order(self):
+        graph = self.gb._process_courses(
+            [
+                [
+                    self.gb.catalog.get_course("1921425"),
+                    self.gb.catalog.get_course("1901472"),
+                ],
+                [
+                    self.gb.catalog.get_course("1901472"),
+                    self.gb.catalog.get_course("1921425"),
+                ],
+            ]
+        )
+
+        # Both orders count towards the same edge
+        self.assertEqual(
+            2,
+            graph.get_weight(
+                self.gb.catalog.get_course("1901472"),
+                self.gb.catalog.get_course("1921425"),
+            ),
+        )
+        self.assertEqual(1, self.gb.catalog.get_course("1921425").degree)
+        self.assertEqual(2, self.gb.catalog.get_course("1921425").largest_weight)
+
     @data(
         {"key": "1921425", "degree": 2},  # Connected to two different courses
         {"key": "1901472", "degree": 3},  # Connected to three different courses
@@ -280,8 +358,8 @@ class TestGraphBuilderProcessCoruses(TestCase):
     def test_process_courses_degree(self, key, degree):
         graph = self.gb._process_courses(self.schedules)
 
-        self.assertEqual(degree, graph.get_degree(Course.get(key)))
-        self.assertEqual(degree, Course.get(key).degree)
+        self.assertEqual(degree, graph.get_degree(self.gb.catalog.get_course(key)))
+        self.assertEqual(degree, self.gb.catalog.get_course(key).degree)
 
     @data(
         {"key": "1921425"},  # Appears in one schedule
@@ -293,8 +371,8 @@ class TestGraphBuilderProcessCoruses(TestCase):
     def test_process_courses_largest_weight_ones(self, key):
         graph = self.gb._process_courses(self.schedules)
 
-        self.assertEqual(1, graph.get_largest_weight(Course.get(key)))
-        self.assertEqual(1, Course.get(key).largest_weight)
+        self.assertEqual(1, graph.get_largest_weight(self.gb.catalog.get_course(key)))
+        self.assertEqual(1, self.gb.catalog.get_course(key).largest_weight)
 
     @data(
         {"key": "1921425", "weight": 2},  # Connected to 1901472 twice
@@ -307,26 +385,27 @@ class TestGraphBuilderProcessCoruses(TestCase):
         graph = self.gb._process_courses(
             [
                 [
-                    Course.get("1921425"),
-                    Course.get("1901472"),
-                    Course.get("1921422"),
+                    self.gb.catalog.get_course("1921425"),
+                    self.gb.catalog.get_course("1901472"),
+                    self.gb.catalog.get_course("1921422"),
                 ],
                 [
-                    Course.get("1921425"),
-                    Course.get("1901472"),
+                    self.gb.catalog.get_course("1921425"),
+                    self.gb.catalog.get_course("1901472"),
                 ],
             ]
         )
 
-        self.assertEqual(weight, graph.get_largest_weight(Course.get(key)))
-        self.assertEqual(weight, Course.get(key).largest_weight)
+        self.assertEqual(
+            weight, graph.get_largest_weight(self.gb.catalog.get_course(key))
+        )
+        self.assertEqual(weight, self.gb.catalog.get_course(key).largest_weight)
 
 
 class TestGraphBuilderBuild(TestCase):
     @patch.object(GraphBuilder, "_read_courses")
-    @patch.object(GraphBuilder, "_read_schedule")
-    @patch.object(GraphBuilder, "_process_courses")
-    def test_build(self, mock_process_courses, mock_read_schedule, mock_read_courses):
+    @patch.object(GraphBuilder, "_stream_schedule")
+    def test_build(self, mock_stream_schedule, mock_read_courses):
         slots = self.fake.random_int()
         schedule_path = self.fake.file_path(depth=3)
         courses_path = self.fake.file_path(depth=3)
@@ -335,7 +414,373 @@ class TestGraphBuilderBuild(TestCase):
         expected = gb.build()
 
         mock_read_courses.assert_called_once_with()
-        mock_read_schedule.assert_called_once_with()
-        mock_process_courses.assert_called_once_with(mock_read_schedule.return_value)
+        mock_stream_schedule.assert_called_once_with()
+
+        self.assertEqual(expected, mock_stream_schedule.return_value)
+
+
+class TestGraphBuilderProcessCoursesSparse(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.gb = GraphBuilder(1, "schedule.txt", "courses.txt", engine="sparse")
+        self.courses = [Course(f"{key:07d}", "name", 1, 1) for key in range(30)]
+
+        rng = random.Random(0)
+        self.schedules = [
+            rng.sample(self.courses, rng.randint(1, 6)) for _ in range(200)
+        ]
+        # A course listed twice by the same student
+        self.schedules.append([self.courses[0], self.courses[0], self.courses[1]])
+
+    def _snapshot(self, graph):
+        return (
+            {course: dict(graph.adj_list[course]) for course in graph},
+            {course: (course.degree, course.largest_weight) for course in graph},
+        )
+
+    @skipUnless(HAS_SCIPY, "scipy is not installed")
+    def test_process_courses_sparse_same_as_python(self):
+        expected = self._snapshot(self.gb._process_courses(self.schedules))
+        actual = self._snapshot(self.gb._process_courses_sparse(self.schedules))
+
+        self.assertDictEqual(expected[0], actual[0])
+        self.assertDictEqual(expected[1], actual[1])
+
+    @skipUnless(HAS_SCIPY, "scipy is not installed")
+    def test_process_courses_sparse_empty(self):
+        graph = self.gb._process_courses_sparse([])
+
+        self.assertEqual(0, len(graph))
+
+    def test_process_courses_sparse_fallback(self):
+        with patch.dict(sys.modules, {"scipy": None}):
+            with self.assertWarns(UserWarning):
+                graph = self.gb._process_courses_sparse(self.schedules)
+
+        expected = self._snapshot(self.gb._process_courses(self.schedules))
+        self.assertDictEqual(expected[0], self._snapshot(graph)[0])
+
+    @patch.object(GraphBuilder, "_read_courses")
+    @patch.object(GraphBuilder, "_read_schedule")
+    @patch.object(GraphBuilder, "_process_courses_sparse")
+    def test_build_sparse(self, mock_process_courses_sparse, mock_read_schedule, _):
+        self.assertEqual(mock_process_courses_sparse.return_value, self.gb.build())
+        mock_process_courses_sparse.assert_called_once_with(
+            mock_read_schedule.return_value
+        )
+
+
+class GraphBuilderFilesTestCase(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.courses_path = os.path.join(self.directory.name, "courses.txt")
+        self.schedule_path = os.path.join(self.directory.name, "schedule.txt")
+
+        rng = random.Random(0)
+        keys = [f"{key:07d}" for key in range(20)]
+
+        with open(self.courses_path, "w") as file:
+            file.write("# key name level sections\n")
+            for key in keys:
+                file.write(f"{key} Course{key} {rng.randint(1, 4)} 1\n")
+
+        with open(self.schedule_path, "w") as file:
+            file.write("# student courses\n")
+            for student in range(300):
+                # Unknown courses must be skipped as in the sequential build
+                courses = rng.sample(keys + ["9999999"], rng.randint(1, 5))
+                file.write(f"{student:07d} {' '.join(courses)}\n")
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.directory.cleanup()
+
+
+class TestGraphBuilderStreamSchedule(GraphBuilderFilesTestCase):
+    def _snapshot(self, graph):
+        return {
+            course: (dict(graph.adj_list[course]), course.degree, course.largest_weight)
+            for course in graph
+        }
+
+    def test_stream_schedule_same_as_read_and_process(self):
+        gb = GraphBuilder(1, self.schedule_path, self.courses_path)
+        gb._read_courses()
+
+        streamed = self._snapshot(gb._stream_schedule())
+        students = {course: list(course.students) for course in streamed}
+
+        for course in streamed:
+            course._students = []
+        for student in list(gb.catalog.students()):
+            gb.catalog.remove_student(student.key)
+
+        processed = self._snapshot(gb._process_courses(gb._read_schedule()))
+
+        self.assertDictEqual(processed, streamed)
+        for course in streamed:
+            self.assertListEqual(
+                [student.key for student in students[course]],
+                [student.key for student in course.students],
+            )
+
+    def test_stream_schedule_without_students(self):
+        gb = GraphBuilder(1, self.schedule_path, self.courses_path, keep_students=False)
+        graph = gb.build()
+
+        self.assertGreater(len(graph), 0)
+        self.assertEqual(0, len(gb.catalog.students()))
+        for course in graph:
+            self.assertListEqual([], course.students)
+
+    def test_stream_schedule_mmap_reader_same_as_text(self):
+        text = GraphBuilder(1, self.schedule_path, self.courses_path)
+        text._read_courses()
+        expected = self._snapshot(text._stream_schedule())
+        expected = {course.key: value for course, value in expected.items()}
+        students = sorted(student.key for student in text.catalog.students())
+
+        mmap = GraphBuilder(1, self.schedule_path, self.courses_path, reader="mmap")
+        mmap._read_courses()
+        actual = self._snapshot(mmap._stream_schedule())
+        actual = {course.key: value for course, value in actual.items()}
+
+        def by_key(snapshot):
+            return {
+                key: ({c.key: w for c, w in edges.items()}, degree, largest)
+                for key, (edges, degree, largest) in snapshot.items()
+            }
+
+        self.assertDictEqual(by_key(expected), by_key(actual))
+        self.assertListEqual(
+            students, sorted(student.key for student in mmap.catalog.students())
+        )
+
+    def test_unknown_reader(self):
+        with self.assertRaises(ValueError):
+            GraphBuilder(1, self.schedule_path, self.courses_path, reader="unknown")
+
+    @patch("palatable.graphbuilder.read_file", return_value=[])
+    def test_stream_schedule_buffer_size(self, mock_read_file):
+        gb = GraphBuilder(1, self.schedule_path, self.courses_path, buffer_size=4096)
+        gb._stream_schedule()
+
+        mock_read_file.assert_called_once_with(self.schedule_path, buffering=4096)
+
+
+class TestGraphBuilderCatalog(GraphBuilderFilesTestCase):
+    def _snapshot(self, graph):
+        return {
+            course.key: (
+                {other.key: weight for other, weight in graph.adj_list[course].items()},
+                course.degree,
+                course.largest_weight,
+                [student.key for student in course.students],
+            )
+            for course in graph
+        }
+
+    def _build(self):
+        return GraphBuilder(1, self.schedule_path, self.courses_path).build()
+
+    def test_init_catalog(self):
+        catalog = Catalog()
+        gb = GraphBuilder(1, self.schedule_path, self.courses_path, catalog=catalog)
+
+        self.assertIs(catalog, gb.catalog)
+        self.assertIsNot(gb.catalog, GraphBuilder(1, None, None).catalog)
+
+    def test_build_registers_in_catalog(self):
+        gb = GraphBuilder(1, self.schedule_path, self.courses_path)
+        graph = gb.build()
+
+        self.assertEqual(20, len(gb.catalog.courses()))
+        self.assertEqual(300, len(gb.catalog.students()))
+        for course in graph:
+            self.assertIs(course, gb.catalog.get_course(course.key))
+
+    def test_build_twice(self):
+        first, second = self._build(), self._build()
+
+        self.assertDictEqual(self._snapshot(first), self._snapshot(second))
+        for course in first:
+            self.assertNotIn(course, second.adj_list)
+
+    def test_build_concurrently(self):
+        expected = self._snapshot(self._build())
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            graphs = list(executor.map(lambda _: self._build(), range(8)))
+
+        for graph in graphs:
+            self.assertDictEqual(expected, self._snapshot(graph))
+
+
+class TestGraphBuilderParallel(GraphBuilderFilesTestCase):
+    def _build(self, workers):
+        graph = GraphBuilder(
+            1, self.schedule_path, self.courses_path, workers=workers
+        ).build()
+
+        snapshot = {
+            course.key: (
+                {other.key: weight for other, weight in graph.adj_list[course].items()},
+                course.degree,
+                course.largest_weight,
+                [student.key for student in course.students],
+            )
+            for course in graph
+        }
+
+        return snapshot
+
+    def test_shard_offsets(self):
+        size = os.path.getsize(self.schedule_path)
+        shards = _shard_offsets(self.schedule_path, 3)
+
+        self.assertEqual(3, len(shards))
+        self.assertEqual(0, shards[0][0])
+        self.assertEqual(size, shards[-1][1])
+
+        for (_, end), (start, _) in zip(shards, shards[1:]):
+            self.assertEqual(end, start)
+
+    def test_shard_offsets_empty_file(self):
+        open(self.schedule_path, "w").close()
+
+        self.assertListEqual([], _shard_offsets(self.schedule_path, 3))
+
+    def test_count_shard_every_line_once(self):
+        keys = [f"{key:07d}" for key in range(20)]
+        students = []
+
+        for start, end in _shard_offsets(self.schedule_path, 7):
+            students.extend(_count_shard(self.schedule_path, start, end, keys)[0])
+
+        self.assertListEqual([f"{student:07d}" for student in range(300)], students)
+
+    def test_build_parallel_same_as_sequential(self):
+        expected = self._build(workers=1)
+
+        for workers in (2, 3):
+            self.assertDictEqual(expected, self._build(workers=workers))
+
+    def test_build_parallel_without_students(self):
+        gb = GraphBuilder(
+            1, self.schedule_path, self.courses_path, workers=2, keep_students=False
+        )
+        gb.build()
+
+        self.assertEqual(0, len(gb.catalog.students()))
+
+
+class TestGraphBuilderUpdate(GraphBuilderFilesTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        # A student with no known course, who enrolls in known ones later
+        with open(self.schedule_path, "a") as file:
+            file.write("0000999 9999999\n")
+
+        rng = random.Random(1)
+        keys = [f"{key:07d}" for key in range(20)]
+        self.new_path = os.path.join(self.directory.name, "new.txt")
+
+        with open(self.schedule_path) as old, open(self.new_path, "w") as new:
+            for line in old:
+                student_id, *courses = line.split()
+
+                if student_id.startswith("#") or student_id < "0000030":
+                    # Dropped out
+                    continue
+
+                if student_id < "0000080" or student_id == "0000999":
+                    courses = rng.sample(keys, rng.randint(1, 5))
+
+                new.write(f"{student_id} {' '.join(courses)}\n")
+
+            for student in range(300, 340):
+                courses = rng.sample(keys + ["9999999"], rng.randint(1, 5))
+                new.write(f"{student:07d} {' '.join(courses)}\n")
+
+    def _snapshot(self, graph, catalog):
+        snapshot = {
+            course.key: (
+                {other.key: weight for other, weight in graph.adj_list[course].items()},
+                course.degree,
+                course.largest_weight,
+                sorted(student.key for student in course.students),
+            )
+            for course in graph
+        }
+
+        for course in catalog.courses():
+            if course not in graph.adj_list:
+                snapshot[course.key] = (course.degree, course.largest_weight)
+
+        return snapshot
+
+    def _rebuild(self, keep_students=True):
+        gb = GraphBuilder(
+            1, self.new_path, self.courses_path, keep_students=keep_students
+        )
+        graph = gb.build()
+
+        return self._snapshot(graph, gb.catalog), self._students(gb.catalog)
+
+    def _update(self, keep_students=True):
+        gb = GraphBuilder(
+            1, self.schedule_path, self.courses_path, keep_students=keep_students
+        )
+        graph = gb.build()
+        diff = ScheduleDiff.from_files(self.schedule_path, self.new_path)
+
+        self.assertIs(graph, gb.update(graph, diff))
+
+        return self._snapshot(graph, gb.catalog), self._students(gb.catalog)
+
+    def _students(self, catalog):
+        return {student.key for student in catalog.students()}
+
+    def test_update_same_as_rebuild(self):
+        updated = self._update()
+        expected = self._rebuild()
+
+        self.assertDictEqual(expected[0], updated[0])
+        self.assertSetEqual(expected[1], updated[1])
+
+    def test_update_same_as_rebuild_without_students(self):
+        updated = self._update(keep_students=False)
+        expected = self._rebuild(keep_students=False)
+
+        self.assertDictEqual(expected[0], updated[0])
+        self.assertSetEqual(set(), updated[1])
+
+    def test_update_empty_diff(self):
+        gb = GraphBuilder(1, self.schedule_path, self.courses_path)
+        graph = gb.build()
+        expected = self._snapshot(graph, gb.catalog)
+
+        gb.update(graph, ScheduleDiff())
+
+        self.assertDictEqual(expected, self._snapshot(graph, gb.catalog))
+
+    def test_update_stale_diff(self):
+        gb = GraphBuilder(1, self.schedule_path, self.courses_path)
+        graph = gb.build()
+
+        # Removing more students than took the pair together
+        source = next(iter(graph))
+        destination, weight = next(iter(graph.get_adjacency_list(source)))
+        diff = ScheduleDiff(
+            removed={
+                f"gone{student}": [source.key, destination.key]
+                for student in range(weight + 1)
+            }
+        )
 
-        self.assertEqual(expected, mock_process_courses.return_value)
+        with self.assertRaises(ValueError):
+            gb.update(graph, diff)
@@ -0,0 +1,140 @@
+import os
+
+from palatable.catalog import Catalog
+from palatable.csrgraph import CSRGraph
+from palatable.graphcache import (
+    HEADER,
+    MAGIC,
+    VERSION,
+    file_hash,
+    load_graph,
+    read_metadata,
+)
+from palatable.graphpainter import GraphPainter
+from tests.case import COURSES, SCHEDULE, FilesTestCase
+
+
+class TestGraphCache(FilesTestCase):
+    def _load(self):
+        self.catalog = Catalog()
+        return load_graph(
+            self.cache_path, self.catalog, self.schedule_path, self.courses_path
+        )
+
+    def _snapshot(self, graph):
+        return {
+            course.key: (
+                sorted((n.key, w) for n, w in graph.get_adjacency_list(course)),
+                course.degree,
+                course.largest_weight,
+                sorted(student.key for student in course.students),
+            )
+            for course in graph
+        }
+
+    def test_file_hash(self):
+        self.assertEqual(file_hash(self.courses_path), file_hash(self.courses_path))
+        self.assertNotEqual(file_hash(self.courses_path), file_hash(self.schedule_path))
+
+    def test_load_graph_same_as_built(self):
+        expected = self._snapshot(self._save_graph())
+
+        graph = self._load()
+
+        self.assertIsInstance(graph, CSRGraph)
+        self.assertDictEqual(expected, self._snapshot(graph))
+
+    def test_load_graph_registers_courses_without_edges(self):
+        self._save_graph()
+        self._load()
+
+        course = self.catalog.get_course("1921413")
+        self.assertIsNotNone(course)
+        self.assertListEqual(["0325891"], [s.key for s in course.students])
+
+    def test_load_graph_paints_same_schedule(self):
+        graph = self._save_graph()
+        GraphPainter(graph, 3, 3, 2).paint()
+        expected = {course.key: course.color.key for course in graph}
+
+        graph = self._load()
+        GraphPainter(graph, 3, 3, 2).paint()
+
+        self.assertDictEqual(
+            expected, {course.key: course.color.key for course in graph}
+        )
+
+    def test_read_metadata(self):
+        self._save_graph()
+
+        metadata = read_metadata(self.cache_path, self.schedule_path, self.courses_path)
+
+        self.assertEqual(5, metadata["nodes"])
+        self.assertEqual(6, len(metadata["courses"]))
+        self.assertEqual(6, len(metadata["students"]))
+
+    def test_read_metadata_invalid(self):
+        self.assertIsNone(
+            read_metadata(self.cache_path, self.schedule_path, self.courses_path)
+        )
+
+        self._save_graph()
+        self._write("schedule.txt", SCHEDULE + "0325892 1901204 1921411\n")
+
+        self.assertIsNone(
+            read_metadata(self.cache_path, self.schedule_path, self.courses_path)
+        )
+
+    def test_load_graph_missing(self):
+        self.assertIsNone(self._load())
+
+    def test_load_graph_not_a_cache(self):
+        self._write("graph.bin", "this is not a graph cache")
+
+        self.assertIsNone(self._load())
+
+    def test_load_graph_truncated(self):
+        self._save_graph()
+
+        with open(self.cache_path, "rb") as file:
+            content = file.read()
+
+        for cut in (4, 6, 20, 60, len(content) - 1):
+            with open(self.cache_path, "wb") as file:
+                file.write(content[:-cut])
+
+            self.assertIsNone(self._load())
+            self.assertListEqual([], list(self.catalog.courses()))
+
+    def test_load_graph_metadata_missing_key(self):
+        metadata = b'{"lengths": {}}'
+        with open(self.cache_path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, len(metadata)) + metadata)
+
+        self.assertIsNone(self._load())
+
+    def test_save_graph_replaces_cache(self):
+        self._write("graph.bin", "this is not a graph cache")
+
+        expected = self._snapshot(self._save_graph())
+
+        self.assertDictEqual(expected, self._snapshot(self._load()))
+        self.assertListEqual(
+            ["courses.txt", "graph.bin", "schedule.txt"],
+            sorted(os.listdir(self.directory.name)),
+        )
+
+    def test_load_graph_schedule_changed(self):
+        self._save_graph()
+
+        self._write("schedule.txt", SCHEDULE + "0325890 1901204 1921411\n")
+
+        self.assertIsNone(self._load())
+        self.assertListEqual([], list(self.catalog.courses()))
+
+    def test_load_graph_courses_changed(self):
+        self._save_graph()
+
+        self._write("courses.txt", COURSES.replace("MIS 2 1", "MIS 2 2"))
+
+        self.assertIsNone(self._load())
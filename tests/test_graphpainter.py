@@ -1,7 +1,9 @@
+from itertools import combinations
 from unittest.mock import patch
 
 from ddt import data, ddt, unpack
 
+from palatable.catalog import Catalog
 from palatable.color import Color
 from palatable.graph import Graph
 from palatable.graphpainter import GraphPainter
@@ -15,7 +17,7 @@ class TestGraphPainterInit(TestCase):
     def test_graphpainter_init(self, mock_generate_colors_matrix):
         gp = GraphPainter(self.graph, self.days, self.slots, self.fairness)
 
-        self.assertEqual(gp.current_courses, self.graph.adj_list)
+        self.assertEqual(gp.current_courses, self.graph.nodes())
 
         self.assertEqual(gp.days, self.days)
         self.assertEqual(gp.slots, self.slots)
@@ -23,6 +25,11 @@ class TestGraphPainterInit(TestCase):
 
         mock_generate_colors_matrix.assert_called_once_with()
         gp.colors = mock_generate_colors_matrix.return_value
+        self.assertEqual("greedy", gp.strategy)
+
+    def test_graphpainter_init_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            GraphPainter(self.graph, self.days, self.slots, self.fairness, "unknown")
 
     @data(
         {"days": 2, "slots": 1},
@@ -56,6 +63,9 @@ class TestGraphPainterInit(TestCase):
 
 
 class TestGraphPainterIsFairToSchedule(TestCase):
+    def _color(self, gp, course, day, slot):
+        gp._set_course_color(course, gp.colors[day][slot], day, slot)
+
     def test_is_fair_to_schedule_fair_no_students(self):
         self.course._students = []
 
@@ -91,7 +101,8 @@ class TestGraphPainterIsFairToSchedule(TestCase):
         course1._students.append(student1)
         course2._students.append(student2)
 
-        self.gp.colors[day][slot].colored_courses = [course1, course2]
+        self._color(self.gp, course1, day, slot)
+        self._color(self.gp, course2, day, slot)
 
         self.assertTrue(self.gp._is_fair_to_schedule(course1, day))
 
@@ -111,7 +122,8 @@ class TestGraphPainterIsFairToSchedule(TestCase):
         course1._students.append(student)
         course2._students.append(student)
 
-        self.gp.colors[day][slot].colored_courses = [course1, course2]
+        self._color(self.gp, course1, day, slot)
+        self._color(self.gp, course2, day, slot)
 
         self.assertFalse(self.gp._is_fair_to_schedule(course1, day))
 
@@ -133,8 +145,8 @@ class TestGraphPainterIsFairToSchedule(TestCase):
         course1._students.append(student)
         course2._students.append(student)
 
-        gp.colors[day][slot].colored_courses = [course1]
-        gp.colors[day][slot + 1].colored_courses = [course2]
+        self._color(gp, course1, day, slot)
+        self._color(gp, course2, day, slot + 1)
 
         self.assertFalse(gp._is_fair_to_schedule(course1, day))
 
@@ -157,12 +169,37 @@ class TestGraphPainterIsFairToSchedule(TestCase):
         course2._students.append(student)
         course3._students.append(student)
 
-        gp.colors[day][slot].colored_courses = [course1]
-        gp.colors[day][slot + 1].colored_courses = [course2]
-        gp.colors[day][slot + 2].colored_courses = [course3]
+        self._color(gp, course1, day, slot)
+        self._color(gp, course2, day, slot + 1)
+        self._color(gp, course3, day, slot + 2)
 
         self.assertFalse(gp._is_fair_to_schedule(course1, day))
 
+    def test_is_fair_to_schedule_fair_below_fairness(self):
+        """
+        Exams in different slots of the same day are fair until the student
+        already has as many exams that day as the fairness parameter.
+        """
+        day = 0
+        gp = GraphPainter(self.graph, 5, 5, 2)
+
+        student = Student(self.fake.bothify(text="#######"))
+        course1 = self._create_course()
+        course2 = self._create_course()
+        course3 = self._create_course()
+
+        for course in (course1, course2, course3):
+            course._students.append(student)
+
+        self._color(gp, course1, day, 0)
+        self.assertTrue(gp._is_fair_to_schedule(course2, day))
+
+        self._color(gp, course2, day, 2)
+        self.assertFalse(gp._is_fair_to_schedule(course3, day))
+
+        # Other days are not affected
+        self.assertTrue(gp._is_fair_to_schedule(course3, day + 1))
+
 
 class TestGraphPainterGetFirstcourseColor(TestCase):
     def test_get_first_course_color_no_days_is_none(self):
@@ -225,122 +262,66 @@ class TestGraphPainterGetSmallestAvailableColor(TestCase):
         self.assertIsNotNone(actual)
         self.assertEqual(expected, actual)
 
-    @patch.object(GraphPainter, "_is_color_valid")
-    @patch.object(Graph, "get_adjacency_list")
-    def test_get_smallest_available_color_neighbor_not_same_day_and_time(
-        self, mock_get_adjacency_list, mock_is_color_valid
-    ):
+    def _color_neighbor(self, day, slot):
         neighbor = self._create_course()
-        neighbor.color = Color(
-            self.fake.random_digit_not_null(), day=0, slot=0, instances=10
-        )
-        mock_get_adjacency_list.return_value = {(neighbor, 0)}
+        self.graph.add_edge(self.course, neighbor)
+        self.gp._set_course_color(neighbor, self.gp.colors[day][slot], day, slot)
 
-        self.gp._get_smallest_available_color(self.course)
-        mock_is_color_valid.assert_called_once()
+        return neighbor
 
-    @patch.object(GraphPainter, "_is_color_valid")
-    @patch.object(Graph, "get_adjacency_list")
-    def test_get_smallest_available_color_neighbor_same_day_and_time(
-        self, mock_get_adjacency_list, mock_is_color_valid
-    ):
-        self.gp.slots = 1
-        self.gp.days = 1
+    def test_get_smallest_available_color_neighbor_adjacent_slots_forbidden(self):
+        self._color_neighbor(0, 1)
 
-        neighbor = self._create_course()
-        neighbor.color = Color(
-            self.fake.random_digit_not_null(), day=0, slot=0, instances=10
-        )
-        mock_get_adjacency_list.return_value = {(neighbor, 0)}
+        # Slots 0, 1 and 2 of the first day are too close to the neighbor.
+        expected = self.gp.colors[0][3]
+        self.assertEqual(expected, self.gp._get_smallest_available_color(self.course))
 
-        self.gp._get_smallest_available_color(self.course)
-        mock_is_color_valid.assert_not_called()
+    def test_get_smallest_available_color_neighbor_same_day_and_time(self):
+        gp = GraphPainter(self.graph, 1, 1, self.fairness)
 
-    @patch.object(GraphPainter, "_is_color_valid")
-    @patch.object(Graph, "get_adjacency_list")
-    def test_get_smallest_available_color_neighbor_not_colored(
-        self, mock_get_adjacency_list, mock_is_color_valid
-    ):
-        self.gp.slots = 1
-        self.gp.days = 1
+        neighbor = self._create_course()
+        neighbor.sections = 1
+        self.graph.add_edge(self.course, neighbor)
+        gp._set_course_color(neighbor, gp.colors[0][0], 0, 0)
+
+        self.assertIsNone(gp._get_smallest_available_color(self.course))
 
+    def test_get_smallest_available_color_neighbor_not_colored(self):
         neighbor = self._create_course()
-        neighbor.color = None
-        mock_get_adjacency_list.return_value = {(neighbor, 0)}
+        self.graph.add_edge(self.course, neighbor)
 
         expected = self.gp.colors[0][0]
         actual = self.gp._get_smallest_available_color(self.course)
         self.assertEqual(expected, actual)
 
-        mock_is_color_valid.assert_not_called()
-
-
-@ddt
-class TestGraphPainterIsColorValid(TestCase):
-    @data(
-        {"slot1": 0, "slot2": 0},
-        {"slot1": 1, "slot2": 1},
-        {"slot1": 0, "slot2": 1},
-        {"slot1": 1, "slot2": 0},
-        {"slot1": 4, "slot2": 5},
-    )
-    @unpack
-    def test_is_color_valid_same_day_not_valid(self, slot1, slot2):
-        day = 0
-
-        current_color = Color(1, day, slot1, instances=10)
-        other_color = Color(2, day, slot2, instances=10)
-
-        self.assertFalse(
-            self.gp._is_color_valid(current_color, other_color, self.course)
+    def test_get_smallest_available_color_neighbor_uncolored_again(self):
+        neighbor = self._color_neighbor(0, 0)
+        self.assertEqual(
+            self.gp.colors[0][2], self.gp._get_smallest_available_color(self.course)
         )
 
-    @data(
-        {"available_instances": 1, "sections": 1},
-        {"available_instances": 1, "sections": 5},
-        {"available_instances": 3, "sections": 4},
-    )
-    @unpack
-    def test_is_color_valid_available_instances_not_valid(
-        self, available_instances, sections
-    ):
-        current_color = Color(1, 1, 0, instances=10)
-        other_color = Color(2, 2, 0, instances=10)
-
-        current_color.available_instances = available_instances
-        self.course.sections = sections
-
-        self.assertFalse(
-            self.gp._is_color_valid(current_color, other_color, self.course)
+        self.gp._unset_course_color(neighbor)
+        self.assertEqual(
+            self.gp.colors[0][0], self.gp._get_smallest_available_color(self.course)
         )
 
-    @patch.object(GraphPainter, "_is_fair_to_schedule")
-    def test_is_color_valid_is_fair_to_schedule_not_valid(
-        self, mock_is_fair_to_schedule
-    ):
-        current_color = Color(1, 1, 0, instances=10)
-        other_color = Color(2, 2, 0, instances=10)
-
-        current_color.available_instances = 10
-        self.course.sections = 5
+    def test_get_smallest_available_color_not_enough_instances(self):
+        self._color_neighbor(0, 0)
+        self.gp.colors[0][2].available_instances = self.course.sections
 
-        mock_is_fair_to_schedule.return_value = False
-        self.assertFalse(
-            self.gp._is_color_valid(current_color, other_color, self.course)
-        )
+        expected = self.gp.colors[0][3]
+        self.assertEqual(expected, self.gp._get_smallest_available_color(self.course))
 
     @patch.object(GraphPainter, "_is_fair_to_schedule")
-    def test_is_color_valid_valid(self, mock_is_fair_to_schedule):
-        current_color = Color(1, 1, 0, instances=10)
-        other_color = Color(2, 2, 0, instances=10)
+    def test_get_smallest_available_color_not_fair(self, mock_is_fair_to_schedule):
+        self._color_neighbor(0, 0)
+        mock_is_fair_to_schedule.side_effect = lambda course, day: day != 0
 
-        current_color.available_instances = 10
-        self.course.sections = 5
+        expected = self.gp.colors[1][0]
+        self.assertEqual(expected, self.gp._get_smallest_available_color(self.course))
 
-        mock_is_fair_to_schedule.return_value = True
-        self.assertTrue(
-            self.gp._is_color_valid(current_color, other_color, self.course)
-        )
+        # Fairness is checked once per day
+        self.assertEqual(2, mock_is_fair_to_schedule.call_count)
 
 
 class TestGraphPainterSetCourseColor(TestCase):
@@ -366,6 +347,16 @@ class TestGraphPainterSetCourseColor(TestCase):
             old_available_instances - self.course.sections,
         )
 
+    def test_set_course_color_updates_loads(self):
+        student = Student(self.fake.bothify(text="#######"))
+        self.course._students.append(student)
+
+        self.gp._set_course_color(self.course, self.gp.colors[2][1], 2, 1)
+
+        self.assertEqual(1, self.gp.loads.get_day_load(student, 2))
+        self.assertEqual(1, self.gp.loads.get_slot_load(student, 2, 1))
+        self.assertEqual(1, self.gp.loads.get_max_load(2))
+
     def test_set_course_color_negative_available_instances(self):
         day = 0
         slot = 0
@@ -391,6 +382,28 @@ class TestGraphPainterSetCourseColor(TestCase):
         self.assertNotIn(self.course, self.gp.colors[day][slot].colored_courses)
 
 
+class TestGraphPainterUnsetCourseColor(TestCase):
+    def test_unset_course_color(self):
+        day, slot = 1, 2
+        color = self.gp.colors[day][slot]
+        old_available_instances = color.available_instances
+
+        student = Student(self.fake.bothify(text="#######"))
+        self.course._students.append(student)
+
+        self.gp._set_course_color(self.course, color, day, slot)
+        self.gp._unset_course_color(self.course)
+
+        self.assertIsNone(self.course.color)
+        self.assertNotIn(self.course, color.colored_courses)
+        self.assertEqual(old_available_instances, color.available_instances)
+        self.assertEqual(0, self.gp.loads.get_day_load(student, day))
+
+    def test_unset_course_color_not_colored(self):
+        with self.assertRaises(ValueError):
+            self.gp._unset_course_color(self.course)
+
+
 class TestGraphPainterAttemptCourseColor(TestCase):
     @patch.object(GraphPainter, "_set_course_color")
     @patch.object(GraphPainter, "_get_smallest_available_color")
@@ -444,3 +457,418 @@ class TestGraphPainterPaint(TestCase):
     def test_paint_empty_graph(self):
         self.gp.graph = Graph(directed=False)
         self.assertEqual(0, self.gp.paint())
+
+
+class TestGraphPainterPaintDsatur(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.gp = GraphPainter(
+            self.graph, self.days, self.slots, self.fairness, strategy="dsatur"
+        )
+
+    def _assert_valid_coloring(self):
+        for course in self.graph:
+            for neighbor, _ in self.graph.get_adjacency_list(course):
+                if course.is_colored and neighbor.is_colored:
+                    same_day = course.color.day == neighbor.color.day
+                    distance = abs(course.color.slot - neighbor.color.slot)
+                    self.assertFalse(same_day and distance <= 1)
+
+    def test_paint_dsatur_all_colored(self):
+        self.assertEqual(len(self.graph), self.gp.paint())
+        self._assert_valid_coloring()
+
+    def test_paint_dsatur_empty_graph(self):
+        self.gp.graph = Graph(directed=False)
+        self.assertEqual(0, self.gp.paint())
+
+    def test_paint_dsatur_already_colored(self):
+        for course in self.graph:
+            course.color = True
+
+        self.assertEqual(0, self.gp.paint())
+
+    @patch.object(GraphPainter, "_get_first_course_color", return_value=None)
+    def test_paint_dsatur_impossible_scheduling(self, mock_get_first_course_color):
+        with self.assertRaises(RuntimeError):
+            self.gp.paint()
+
+        mock_get_first_course_color.assert_called_once()
+
+    def test_paint_dsatur_most_saturated_first(self):
+        """
+        Courses adjacent to colored courses are picked before courses with a
+        higher degree.
+        """
+        graph = Graph(directed=False)
+        hub = self._create_course()
+        leaves = [self._create_course() for _ in range(3)]
+        for leaf in leaves:
+            graph.add_edge(hub, leaf)
+
+        a, b, c = (self._create_course() for _ in range(3))
+        graph.add_edge(a, b)
+        graph.add_edge(b, c)
+        graph.add_edge(a, c)
+        graph.update_courses_degrees()
+
+        gp = GraphPainter(graph, self.days, self.slots, self.fairness, "dsatur")
+        order = []
+        set_course_color = gp._set_course_color
+
+        def record(course, *args):
+            order.append(course)
+            set_course_color(course, *args)
+
+        with patch.object(gp, "_set_course_color", side_effect=record):
+            gp.paint()
+
+        # The hub has the highest degree, then its leaves are the most
+        # saturated courses.
+        self.assertEqual(hub, order[0])
+        self.assertSetEqual(set(leaves), set(order[1:4]))
+
+
+class TestGraphPainterRepair(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.graph.update_courses_degrees()
+
+    def _repainter(self, fairness=None):
+        fairness = self.fairness if fairness is None else fairness
+        return GraphPainter(self.graph, self.days, self.slots, fairness)
+
+    def test_get_coloring(self):
+        self.gp.paint()
+
+        self.assertDictEqual(
+            {course: (course.color.day, course.color.slot) for course in self.graph},
+            self.gp.get_coloring(),
+        )
+
+    def test_get_coloring_by_key(self):
+        self.gp.paint()
+
+        self.assertDictEqual(
+            {
+                course.key: (course.color.day, course.color.slot)
+                for course in self.graph
+            },
+            self.gp.get_coloring(by_key=True),
+        )
+
+    def test_repair_by_key(self):
+        catalog = Catalog()
+        for course in self.graph:
+            catalog.add_course(course)
+
+        self.gp.paint()
+        previous = self.gp.get_coloring(by_key=True)
+        previous["unknown"] = (0, 0)
+
+        gp = GraphPainter(
+            self.graph, self.days, self.slots, self.fairness, catalog=catalog
+        )
+        report = gp.repair(previous)
+
+        self.assertListEqual([], report.moved)
+        self.assertDictEqual(
+            {key: previous[key] for key in previous if key != "unknown"},
+            gp.get_coloring(by_key=True),
+        )
+
+    def test_repair_by_key_without_catalog(self):
+        self.gp.paint()
+        previous = self.gp.get_coloring(by_key=True)
+
+        with self.assertRaises(ValueError):
+            self._repainter().repair(previous)
+
+    def test_repair_unchanged(self):
+        self.gp.paint()
+        previous = self.gp.get_coloring()
+
+        gp = self._repainter()
+        report = gp.repair(previous)
+
+        self.assertEqual(len(self.graph), report.colored_courses)
+        self.assertListEqual([], report.moved)
+        self.assertGreaterEqual(report.elapsed, 0)
+        self.assertDictEqual(previous, gp.get_coloring())
+
+    def test_repair_from_current_colors(self):
+        self.gp.paint()
+        previous = self.gp.get_coloring()
+
+        report = self._repainter().repair()
+
+        self.assertListEqual([], report.moved)
+        for course, (day, slot) in previous.items():
+            self.assertEqual((day, slot), (course.color.day, course.color.slot))
+
+    def test_repair_same_painter(self):
+        a, b, c, d = self.graph.nodes()
+        for student in (Student("first"), Student("second")):
+            a.students.append(student)
+            c.students.append(student)
+
+        gp = self._repainter()
+        gp.paint()
+        previous = gp.get_coloring()
+
+        report = gp.repair()
+
+        self.assertEqual(len(self.graph), report.colored_courses)
+        self.assertListEqual([], report.moved)
+        self.assertDictEqual(previous, gp.get_coloring())
+
+        for row in gp.colors:
+            for color in row:
+                used = sum(course.sections for course in color.colored_courses)
+                self.assertEqual(
+                    len(set(color.colored_courses)), len(color.colored_courses)
+                )
+                self.assertEqual(self.days - used, color.available_instances)
+
+        for course in self.graph:
+            self.assertFalse(gp._violates(course))
+
+    def test_repair_new_conflict(self):
+        a, b, c, d = self.graph.nodes()
+        previous = {a: (0, 0), b: (1, 0), c: (2, 0), d: (3, 0)}
+
+        # c and d now share a student, and have the same color
+        self.graph.increment_edge(c, d)
+        self.graph.update_courses_degrees()
+        previous[d] = (2, 0)
+
+        gp = self._repainter()
+        report = gp.repair(previous)
+
+        self.assertEqual(4, report.colored_courses)
+        self.assertEqual(1, len(report.moved))
+        self.assertIn(report.moved[0], (c, d))
+
+        # The other courses kept their colors
+        coloring = gp.get_coloring()
+        for course, position in previous.items():
+            if course not in report.moved:
+                self.assertEqual(position, coloring[course])
+
+        self.assertNotEqual(coloring[c], coloring[d])
+
+    def test_repair_releases_instances(self):
+        a, b, c, d = self.graph.nodes()
+        self.graph.increment_edge(c, d)
+        self.graph.update_courses_degrees()
+
+        gp = self._repainter()
+        gp.repair({a: (0, 0), b: (1, 0), c: (2, 0), d: (2, 0)})
+
+        for row in gp.colors:
+            for color in row:
+                used = sum(course.sections for course in color.colored_courses)
+                self.assertEqual(self.days - used, color.available_instances)
+
+    def test_repair_unfair(self):
+        a, b, c, d = self.graph.nodes()
+        student = Student("shared")
+        c.students.append(student)
+        d.students.append(student)
+
+        # c and d are not adjacent, but a student has both exams on day 2
+        previous = {a: (0, 0), b: (1, 0), c: (2, 0), d: (2, 3)}
+
+        report = self._repainter(fairness=1).repair(previous)
+
+        self.assertEqual(1, len(report.moved))
+        self.assertNotEqual(c.color.day, d.color.day)
+
+    def test_repair_colors_new_courses(self):
+        a, b, c, d = self.graph.nodes()
+        e = self._create_course()
+        self.graph.increment_edge(a, e)
+        self.graph.update_courses_degrees()
+
+        previous = {a: (0, 0), b: (1, 0), c: (2, 0), d: (3, 0)}
+        report = self._repainter().repair(previous)
+
+        self.assertEqual(5, report.colored_courses)
+        self.assertListEqual([], report.moved)
+        self.assertTrue(e.is_colored)
+
+    def test_repair_out_of_range_color(self):
+        a, b, c, d = self.graph.nodes()
+        previous = {a: (0, 0), b: (1, 0), c: (2, 0), d: (self.days, 0)}
+
+        report = self._repainter().repair(previous)
+
+        self.assertListEqual([d], report.moved)
+        self.assertTrue(d.is_colored)
+
+    def test_repair_empty_graph(self):
+        self.gp.graph = Graph(directed=False)
+
+        report = self.gp.repair({})
+
+        self.assertEqual(0, report.colored_courses)
+        self.assertListEqual([], report.moved)
+
+
+@ddt
+class TestGraphPainterMinimizeDays(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        # A clique of 6 courses with 3 sections each, on top of the base graph
+        clique = [self._create_course() for _ in range(6)]
+        for course, neighbor in combinations(clique, 2):
+            self.graph.add_edge(course, neighbor)
+
+        self.graph.add_edge(clique[0], next(iter(self.graph)))
+        self.graph.update_courses_degrees()
+
+    def _is_feasible(self, days, slots, strategy):
+        for course in self.graph:
+            course.color = None
+
+        gp = GraphPainter(self.graph, days, slots, self.fairness, strategy)
+        try:
+            return gp.paint() == len(self.graph)
+        except (RuntimeError, ValueError):
+            return False
+
+    @data((1, "greedy"), (2, "greedy"), (3, "greedy"), (1, "dsatur"), (3, "dsatur"))
+    @unpack
+    def test_minimize_days_same_as_linear_search(self, slots, strategy):
+        expected = next(
+            days
+            for days in range(1, len(self.graph) + 5)
+            if self._is_feasible(days, slots, strategy)
+        )
+
+        for course in self.graph:
+            course.color = None
+
+        gp = GraphPainter(self.graph, 1, slots, self.fairness, strategy)
+        report = gp.minimize_days()
+
+        self.assertEqual(expected, report.days)
+        self.assertEqual(expected, gp.days)
+        self.assertTrue(all(course.is_colored for course in self.graph))
+
+        for probe in report.probes:
+            self.assertEqual(probe.feasible, probe.days >= expected)
+            self.assertGreaterEqual(probe.elapsed, 0)
+
+    def test_minimize_days_probes(self):
+        report = GraphPainter(self.graph, 1, 1, self.fairness).minimize_days()
+
+        # Doubling up to 8 days, then a binary search between 4 and 8
+        self.assertEqual([1, 2, 4, 8, 6, 7], [probe.days for probe in report.probes])
+        self.assertEqual(7, report.days)
+
+    def test_minimize_days_infeasible(self):
+        gp = GraphPainter(self.graph, 1, 1, self.fairness)
+        report = gp.minimize_days(max_days=3)
+
+        self.assertIsNone(report.days)
+        self.assertEqual([1, 2, 3], [probe.days for probe in report.probes])
+        self.assertFalse(any(course.is_colored for course in self.graph))
+
+    def test_paint_stop_on_failure(self):
+        gp = GraphPainter(self.graph, 5, 1, self.fairness)
+        stopped = gp.paint(stop_on_failure=True)
+
+        self.assertLess(0, stopped)
+        self.assertLess(stopped, len(self.graph))
+        self.assertEqual(stopped, sum(course.is_colored for course in self.graph))
+
+        gp.reset(days=7)
+        self.assertEqual(len(self.graph), gp.paint())
+
+    def test_reset_after_graph_change(self):
+        gp = GraphPainter(self.graph, self.days, self.slots, self.fairness)
+        gp.paint()
+
+        # A new course, adjacent to a course painted before
+        course = self._create_course()
+        self.graph.add_edge(next(iter(self.graph)), course)
+        self.graph.update_courses_degrees()
+
+        gp.reset()
+
+        self.assertEqual(len(self.graph), gp.paint())
+        self.assertIn(course, gp._get_sorted_courses())
+
+    def test_minimize_days_keeps_order(self):
+        gp = GraphPainter(self.graph, 1, 1, self.fairness)
+        order = gp._get_sorted_courses()
+
+        gp.minimize_days()
+
+        self.assertIs(order, gp._get_sorted_courses())
+
+    def test_reset(self):
+        gp = GraphPainter(self.graph, self.days, self.slots, self.fairness)
+        colored_courses = gp.paint()
+
+        gp.reset(days=self.days + 1)
+
+        self.assertEqual(self.days + 1, gp.days)
+        self.assertEqual(self.days + 1, len(gp.colors))
+        self.assertFalse(any(course.is_colored for course in self.graph))
+        self.assertEqual(colored_courses, gp.paint())
+
+
+@ddt
+class TestGraphPainterSeed(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.graph.update_courses_degrees()
+
+    def _paint(self, strategy, seed):
+        for course in self.graph:
+            course.color = None
+
+        gp = GraphPainter(
+            self.graph, self.days, self.slots, self.fairness, strategy, seed=seed
+        )
+        gp.paint()
+
+        return gp
+
+    @data("greedy", "dsatur")
+    def test_paint_seeded_valid(self, strategy):
+        self._paint(strategy, seed=7)
+
+        self.assertTrue(all(course.is_colored for course in self.graph))
+        for course in self.graph:
+            for neighbor, _ in self.graph.get_adjacency_list(course):
+                if course.is_colored and neighbor.is_colored:
+                    same_day = course.color.day == neighbor.color.day
+                    distance = abs(course.color.slot - neighbor.color.slot)
+                    self.assertFalse(same_day and distance <= 1)
+
+    @data("greedy", "dsatur")
+    def test_paint_seeded_deterministic(self, strategy):
+        coloring = self._paint(strategy, seed=7).get_coloring()
+
+        self.assertDictEqual(coloring, self._paint(strategy, seed=7).get_coloring())
+
+    def test_sorted_courses_seeded_by_degree(self):
+        gp = GraphPainter(self.graph, self.days, self.slots, self.fairness, seed=3)
+        degrees = [course.degree for course in gp._get_sorted_courses()]
+
+        self.assertListEqual(sorted(degrees, reverse=True), degrees)
+
+    def test_apply_coloring(self):
+        coloring = self._paint("greedy", seed=None).get_coloring()
+
+        for course in self.graph:
+            course.color = None
+
+        gp = GraphPainter(self.graph, self.days, self.slots, self.fairness)
+
+        self.assertEqual(len(coloring), gp.apply_coloring(coloring))
+        self.assertDictEqual(coloring, gp.get_coloring())
@@ -27,7 +27,7 @@ class TestReadFile(TestCase):
 
         with patch("builtins.open", mock_open(read_data=read_data)) as mock_file:
             results = list(read_file(path))
-            mock_file.assert_called_with(path, "r")
+            mock_file.assert_called_with(path, "r", buffering=-1)
 
         self.assertEqual(1, len(results), msg="Expecting one line to be yielded.")
 
@@ -37,7 +37,7 @@ class TestReadFile(TestCase):
 
         with patch("builtins.open", mock_open(read_data=read_data)) as mock_file:
             results = list(read_file(path))
-            mock_file.assert_called_with(path, "r")
+            mock_file.assert_called_with(path, "r", buffering=-1)
 
         self.assertListEqual(results, [])
 
@@ -47,7 +47,7 @@ class TestReadFile(TestCase):
 
         with patch("builtins.open", mock_open(read_data=read_data)) as mock_file:
             results = list(read_file(path))
-            mock_file.assert_called_with(path, "r")
+            mock_file.assert_called_with(path, "r", buffering=-1)
 
         self.assertEqual(2, len(results), msg="Expecting two rows!")
         self.assertIn("some before\n", results)
@@ -60,11 +60,26 @@ class TestReadFile(TestCase):
 
         with patch("builtins.open", mock_open(read_data=read_data)) as mock_file:
             results = list(read_file(path))
-            mock_file.assert_called_with(path, "r")
+            mock_file.assert_called_with(path, "r", buffering=-1)
 
         self.assertNotIn(comment_line, results)
         self.assertEqual(2, len(results), msg="Expecting two rows!")
 
+    def test_buffering(self):
+        path = "/some/path.txt"
+
+        with patch("builtins.open", mock_open(read_data="line")) as mock_file:
+            list(read_file(path, buffering=1024))
+            mock_file.assert_called_with(path, "r", buffering=1024)
+
+    def test_file_closed(self):
+        path = "/some/path.txt"
+
+        with patch("builtins.open", mock_open(read_data="a\nb")) as mock_file:
+            list(read_file(path))
+
+        mock_file.return_value.__exit__.assert_called_once()
+
 
 class TestCalculateDistance(TestCase):
     def test_calculate_distance_first_second(self):
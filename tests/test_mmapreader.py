@@ -0,0 +1,65 @@
+import os
+import tempfile
+
+from palatable.mmapreader import intern_keys, iter_lines, read_courses, read_schedule
+from tests.case import TestCase
+
+
+class MMapReaderTestCase(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "file.txt")
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.directory.cleanup()
+
+    def _write(self, content):
+        with open(self.path, "w") as file:
+            file.write(content)
+
+
+class TestIterLines(MMapReaderTestCase):
+    def test_iter_lines_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            list(iter_lines(os.path.join(self.directory.name, "missing.txt")))
+
+    def test_iter_lines_empty(self):
+        self._write("")
+        self.assertListEqual([], list(iter_lines(self.path)))
+
+    def test_iter_lines_comments(self):
+        self._write("some before\n# some comment\nsome after")
+
+        self.assertListEqual(
+            [b"some before\n", b"some after"], list(iter_lines(self.path))
+        )
+
+
+class TestReadCourses(MMapReaderTestCase):
+    def test_read_courses(self):
+        self._write("# courses\n1901204\tLogicDesign \t\t\t2       3\n")
+
+        self.assertListEqual(
+            [("1901204", "LogicDesign", 2, 3)], list(read_courses(self.path))
+        )
+
+
+class TestReadSchedule(MMapReaderTestCase):
+    def test_intern_keys(self):
+        self.assertDictEqual({b"a": 0, b"b": 1}, intern_keys(["a", "b"]))
+
+    def test_read_schedule(self):
+        self._write(
+            "# students\n"
+            "0125897         1921425     1921411     1901472\n"
+            "\n"
+            "0325887         1921422     1901466\r\n"
+        )
+        ids = intern_keys(["1921425", "1901472", "1921422"])
+
+        self.assertListEqual(
+            [(b"0125897", [0, 1]), (b"0325887", [2])],
+            list(read_schedule(self.path, ids)),
+        )
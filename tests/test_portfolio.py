@@ -0,0 +1,113 @@
+import io
+from contextlib import redirect_stderr, redirect_stdout
+
+from palatable import scheduler
+from palatable.portfolio import (
+    Member,
+    MemberResult,
+    _score,
+    paint_portfolio,
+    portfolio_members,
+)
+from tests.case import FilesTestCase
+
+
+class TestPortfolio(FilesTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._save_graph()
+
+    def _paint_portfolio(self, members, **kwargs):
+        return paint_portfolio(
+            self.cache_path,
+            self.schedule_path,
+            self.courses_path,
+            3,
+            2,
+            2,
+            members,
+            **kwargs,
+        )
+
+    def test_portfolio_members(self):
+        self.assertListEqual(
+            [
+                Member("dsatur", None),
+                Member("greedy", None),
+                Member("dsatur", 2),
+                Member("greedy", 3),
+            ],
+            portfolio_members(4, "dsatur"),
+        )
+        self.assertListEqual([Member("greedy", None)], portfolio_members(1))
+
+    def test_score(self):
+        def result(index, colored_courses, max_load):
+            return MemberResult(
+                index, None, colored_courses, 5, max_load, 0.0, {}, None
+            )
+
+        results = [
+            result(0, 4, 1),
+            result(1, 5, 2),
+            result(2, 5, 1),
+            result(3, 5, 1),
+            MemberResult(4, None, 0, None, None, None, {}, "No schedule."),
+        ]
+
+        self.assertEqual(2, max(results, key=_score).index)
+
+    def test_paint_portfolio(self):
+        members = portfolio_members(4)
+        report = self._paint_portfolio(members, processes=2)
+
+        self.assertListEqual([0, 1, 2, 3], [result.index for result in report.results])
+        self.assertListEqual([], report.cancelled)
+        self.assertEqual(max(report.results, key=_score), report.best)
+
+        for result in report.results:
+            self.assertIsNone(result.error)
+            self.assertEqual(members[result.index], result.member)
+            self.assertEqual(5, result.courses)
+            self.assertEqual(result.colored_courses, len(result.coloring))
+
+    def test_paint_portfolio_target_met(self):
+        members = portfolio_members(6)
+        report = self._paint_portfolio(members, processes=1, target_load=5)
+
+        # Every member meets the target, the first result stops the others
+        self.assertEqual(1, len(report.results))
+        self.assertEqual(report.results[0], report.best)
+        self.assertEqual(5, report.best.colored_courses)
+        self.assertEqual(5, len(report.cancelled))
+
+    def test_paint_portfolio_no_members(self):
+        with self.assertRaises(ValueError):
+            self._paint_portfolio([])
+
+    def test_scheduler_portfolio(self):
+        argv = ["-d", self.schedule_path, "-c", self.courses_path, "-y", "3"]
+        argv += ["-s", "2"]
+
+        expected = io.StringIO()
+        with redirect_stdout(expected):
+            scheduler.main(argv)
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(0, scheduler.main(argv + ["--portfolio", "2"]))
+
+        # Both members color every course, the first one wins
+        self.assertTrue(output.getvalue().startswith(expected.getvalue()))
+        self.assertIn("dsatur", output.getvalue())
+
+    def test_scheduler_portfolio_arguments(self):
+        argv = ["-d", self.schedule_path, "-c", self.courses_path]
+
+        for extra in (
+            ["--portfolio", "0"],
+            ["--portfolio", "2", "--minimize-days"],
+            ["--target-load", "2"],
+        ):
+            with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()):
+                scheduler.parse_arguments(argv + extra)
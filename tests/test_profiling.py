@@ -0,0 +1,183 @@
+import io
+import json
+from contextlib import redirect_stderr, redirect_stdout
+
+from palatable import scheduler
+from palatable.course import Course
+from palatable.graph import Graph
+from palatable.graphbuilder import GraphBuilder
+from palatable.graphpainter import GraphPainter
+from palatable.profiling import Profiler, phase
+from tests.case import FilesTestCase, TestCase
+
+
+class TestProfiler(TestCase):
+    def test_phase(self):
+        profiler = Profiler()
+        calls = []
+        profiler.add_hook(lambda name, elapsed: calls.append(name))
+
+        for _ in range(3):
+            with profiler.phase("work"):
+                pass
+
+        self.assertEqual(3, profiler.phases["work"][0])
+        self.assertGreaterEqual(profiler.phases["work"][1], 0)
+        self.assertListEqual(["work"] * 3, calls)
+
+    def test_phase_without_profiler(self):
+        with phase(None, "work"):
+            pass
+
+    def test_phase_records_on_error(self):
+        profiler = Profiler()
+
+        with self.assertRaises(ValueError):
+            with profiler.phase("work"):
+                raise ValueError()
+
+        self.assertEqual(1, profiler.phases["work"][0])
+
+    def test_wrap(self):
+        class Worker(object):
+            def work(self, by):
+                return by * 2
+
+            def items(self, count):
+                yield from range(count)
+
+        worker = Worker()
+        profiler = Profiler()
+        profiler.wrap(worker, "work", "work", [("units", lambda by: by)])
+        profiler.wrap(worker, "items", "items")
+
+        self.assertEqual(4, worker.work(2))
+        self.assertEqual(6, worker.work(3))
+        self.assertListEqual([0, 1, 2], list(worker.items(3)))
+
+        self.assertEqual(2, profiler.phases["work"][0])
+        self.assertEqual(5, profiler.counters["units"])
+        # Generators count one call per item
+        self.assertEqual(3, profiler.phases["items"][0])
+
+        # Only the instance is wrapped
+        self.assertEqual(Worker.work, Worker().work.__func__)
+
+    def test_count(self):
+        profiler = Profiler()
+        profiler.count("moves")
+        profiler.count("moves", by=2)
+
+        self.assertEqual(3, profiler.counters["moves"])
+
+    def test_as_dict_and_json(self):
+        profiler = Profiler()
+        profiler.record("work", 0.5, calls=2)
+        profiler.count("moves")
+
+        expected = {
+            "phases": {"work": {"calls": 2, "seconds": 0.5}},
+            "counters": {"moves": 1},
+        }
+        self.assertDictEqual(expected, profiler.as_dict())
+        self.assertDictEqual(expected, json.loads(profiler.to_json()))
+
+    def test_print_table(self):
+        profiler = Profiler()
+        profiler.record("work", 0.5, calls=2)
+        profiler.count("moves")
+
+        output = io.StringIO()
+        profiler.print_table(output)
+
+        self.assertIn("work", output.getvalue())
+        self.assertIn("0.500000", output.getvalue())
+        self.assertIn("moves", output.getvalue())
+
+
+class TestProfilerInstrument(FilesTestCase):
+    def _snapshot(self, graph):
+        return {
+            course.key: sorted((n.key, w) for n, w in graph.get_adjacency_list(course))
+            for course in graph
+        }
+
+    def test_instrument_builder(self):
+        expected = self._snapshot(
+            GraphBuilder(1, self.schedule_path, self.courses_path).build()
+        )
+
+        profiler = Profiler()
+        gb = GraphBuilder(1, self.schedule_path, self.courses_path, profiler=profiler)
+        graph = gb.build()
+
+        self.assertDictEqual(expected, self._snapshot(graph))
+        self.assertEqual(1, profiler.phases["build"][0])
+        self.assertEqual(1, profiler.phases["read_courses"][0])
+        self.assertEqual(6, profiler.phases["read_schedule"][0])
+        self.assertEqual(1, profiler.phases["stream_schedule"][0])
+
+    def test_instrument_painter(self):
+        gb = GraphBuilder(1, self.schedule_path, self.courses_path)
+        graph = gb.build()
+
+        profiler = Profiler()
+        gp = GraphPainter(graph, 5, 3, 2, profiler=profiler)
+        colored_courses = gp.paint()
+
+        phases, counters = profiler.phases, profiler.counters
+        self.assertEqual(1, phases["paint"][0])
+        self.assertEqual(colored_courses, phases["set_color"][0])
+        self.assertLess(0, counters["validity_checks"])
+        self.assertEqual(phases["fairness_check"][0], counters["fairness_checks"])
+        self.assertEqual(
+            sum(course.degree for course in graph if course.is_colored),
+            counters["neighbors_scanned"],
+        )
+
+    def test_validity_checks(self):
+        course, neighbor = Course("a", "a", 1, 1), Course("b", "b", 1, 1)
+        graph = Graph(directed=False)
+        graph.add_edge(course, neighbor)
+        graph.update_courses_degrees()
+
+        profiler = Profiler()
+        gp = GraphPainter(graph, 2, 5, 2, profiler=profiler)
+        gp._set_course_color(neighbor, gp.colors[0][0], 0, 0)
+        gp.colors[0][2].available_instances = course.sections
+
+        self.assertEqual(gp.colors[0][3], gp._get_smallest_available_color(course))
+
+        # Slots 0 and 1 of the first day are forbidden, so slot 2, which is
+        # full, and slot 3 are examined
+        self.assertEqual(2, profiler.counters["validity_checks"])
+        self.assertEqual(1, profiler.phases["color_search"][0])
+
+    def test_scheduler_profile(self):
+        argv = ["-d", self.schedule_path, "-c", self.courses_path]
+
+        expected = io.StringIO()
+        with redirect_stdout(expected):
+            scheduler.main(argv)
+
+        output, errors = io.StringIO(), io.StringIO()
+        with redirect_stdout(output), redirect_stderr(errors):
+            scheduler.main(argv + ["--profile", "json"])
+
+        self.assertEqual(expected.getvalue(), output.getvalue())
+
+        report = json.loads(errors.getvalue())
+        for name in ("build", "paint", "print_schedule"):
+            self.assertEqual(1, report["phases"][name]["calls"])
+
+        self.assertIn("neighbors_scanned", report["counters"])
+
+    def test_scheduler_profile_table(self):
+        errors = io.StringIO()
+        with redirect_stdout(io.StringIO()), redirect_stderr(errors):
+            scheduler.main(
+                ["-d", self.schedule_path, "-c", self.courses_path, "--profile"]
+            )
+
+        self.assertIn("print_schedule", errors.getvalue())
+        self.assertIn("validity_checks", errors.getvalue())
@@ -0,0 +1,65 @@
+import os
+import tempfile
+
+from palatable.schedulediff import ScheduleDiff
+from tests.case import TestCase
+
+
+class TestScheduleDiff(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.old_path = self._write("old.txt", ["# old", "s1 a b", "s2 a c", "s3 b c"])
+        self.new_path = self._write("new.txt", ["s1 b a", "s2 a d", "", "s4 c"])
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.directory.cleanup()
+
+    def _write(self, name, lines):
+        path = os.path.join(self.directory.name, name)
+
+        with open(path, "w") as file:
+            file.write("\n".join(lines) + "\n")
+
+        return path
+
+    def test_init_empty(self):
+        diff = ScheduleDiff()
+
+        self.assertDictEqual({}, diff.added)
+        self.assertDictEqual({}, diff.removed)
+        self.assertDictEqual({}, diff.changed)
+        self.assertEqual(0, len(diff))
+
+    def test_from_files(self):
+        diff = ScheduleDiff.from_files(self.old_path, self.new_path)
+
+        self.assertDictEqual({"s4": ["c"]}, diff.added)
+        self.assertDictEqual({"s3": ["b", "c"]}, diff.removed)
+        # s1 only reordered its courses
+        self.assertDictEqual({"s2": (["a", "c"], ["a", "d"])}, diff.changed)
+        self.assertEqual(3, len(diff))
+
+    def test_from_files_same_file(self):
+        diff = ScheduleDiff.from_files(self.old_path, self.old_path)
+
+        self.assertEqual(0, len(diff))
+
+    def test_iter(self):
+        diff = ScheduleDiff.from_files(self.old_path, self.new_path)
+
+        self.assertListEqual(
+            [
+                ("s3", ["b", "c"], None),
+                ("s2", ["a", "c"], ["a", "d"]),
+                ("s4", None, ["c"]),
+            ],
+            list(diff),
+        )
+
+    def test_repr(self):
+        diff = ScheduleDiff(added={"s1": ["a"]})
+
+        self.assertEqual("<ScheduleDiff: added=1 removed=0 changed=0>", repr(diff))
@@ -0,0 +1,112 @@
+import io
+import subprocess
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+
+from palatable.color import Color
+from palatable.course import Course
+from palatable.graphpainter import MinimizeReport, Probe
+from palatable.scheduler import parse_arguments, print_probes, print_schedule
+from tests.case import TestCase
+
+# Cumulative import time of palatable.scheduler, in microseconds. It was about
+# 95ms with tabulate, multiprocessing and Faker imported eagerly.
+IMPORT_BUDGET = 75_000
+
+# Modules the CLI must not load before it needs them
+LAZY_MODULES = ("tabulate", "faker", "concurrent", "multiprocessing", "hashlib")
+
+
+def import_times(*arguments):
+    """
+    Runs a fresh interpreter with -X importtime and returns the cumulative
+    import time of every imported module, in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *arguments],
+        capture_output=True,
+        text=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+class TestSchedulerImports(TestCase):
+    def test_import_budget(self):
+        # The best of a few runs, to leave the noise of a busy machine out
+        best = min(
+            import_times("-c", "import palatable.scheduler")["palatable.scheduler"]
+            for _ in range(3)
+        )
+
+        self.assertLess(best, IMPORT_BUDGET)
+
+    def test_help_lazy_modules(self):
+        times = import_times("-m", "palatable.scheduler", "-h")
+
+        # The scheduler runs as __main__, its imports are still listed
+        self.assertIn("palatable.graphbuilder", times)
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, times)
+
+
+class TestPrintSchedule(TestCase):
+    def test_print_schedule(self):
+        colors = [[Color(1, day=0, slot=0), Color(2, day=0, slot=1)]]
+        colors[0][1].colored_courses.append(Course("1901204", "Logic", 2, 3))
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            print_schedule(colors, days=1, slots=2)
+
+        self.assertIn("1901204", output.getvalue())
+        self.assertIn("day/slot", output.getvalue())
+
+
+class TestPrintProbes(TestCase):
+    def test_print_probes(self):
+        report = MinimizeReport(
+            2, [Probe(1, 3, False, 0.001), Probe(2, 5, True, 0.002)]
+        )
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            print_probes(report)
+
+        self.assertIn("Minimum days: 2", output.getvalue())
+        self.assertIn("0.002", output.getvalue())
+
+    def test_print_probes_infeasible(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            print_probes(MinimizeReport(None, [Probe(1, 0, False, 0.001)]))
+
+        self.assertIn("No number of days", output.getvalue())
+
+
+class TestParseArguments(TestCase):
+    def _parse(self, *argv):
+        return parse_arguments(["-d", "schedule.txt", "-c", "courses.txt", *argv])
+
+    def test_workers(self):
+        self.assertEqual(2, self._parse("--workers", "2").workers)
+
+        for argv in (["--workers", "0"], ["--engine", "sparse", "--workers", "2"]):
+            with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()):
+                self._parse(*argv)
+
+    def test_buffer_size(self):
+        self.assertEqual(-1, self._parse().buffer_size)
+        self.assertEqual(4096, self._parse("--buffer-size", "4096").buffer_size)
+
+        for buffer_size in ("0", "1", "-2"):
+            with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()):
+                self._parse("--buffer-size", buffer_size)
@@ -0,0 +1,229 @@
+import asyncio
+import json
+import os
+from unittest.mock import patch
+
+from palatable import graphcache
+from palatable.graphbuilder import GraphBuilder
+from palatable.graphpainter import GraphPainter
+from palatable.server import ScheduleServer, main, parse_arguments
+from tests.case import FilesTestCase
+
+
+class TestScheduleServer(FilesTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._save_graph()
+
+    def _server(self, **kwargs):
+        return ScheduleServer(
+            self.cache_path, self.schedule_path, self.courses_path, **kwargs
+        )
+
+    def _serve(self, server, *requests, path=None):
+        """
+        Starts the server, sends the requests concurrently and returns the
+        (status, body) of every response.
+        """
+
+        async def run():
+            listener = await server.start(port=0, path=path)
+
+            if path:
+                connect = lambda: asyncio.open_unix_connection(path)  # noqa: E731
+            else:
+                port = listener.sockets[0].getsockname()[1]
+                connect = lambda: asyncio.open_connection(  # noqa: E731
+                    "127.0.0.1", port
+                )
+
+            async with listener:
+                return await asyncio.gather(
+                    *(self._request(connect, *request) for request in requests)
+                )
+
+        try:
+            return asyncio.run(run())
+        finally:
+            server.close()
+
+    @staticmethod
+    async def _request(connect, method, target, body=None):
+        reader, writer = await connect()
+
+        payload = b"" if body is None else json.dumps(body).encode()
+        writer.write(
+            f"{method} {target} HTTP/1.1\r\nHost: localhost\r\n"
+            f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload
+        )
+        await writer.drain()
+
+        response = await reader.read()
+        writer.close()
+
+        head, _, body = response.partition(b"\r\n\r\n")
+        status = int(head.split(b" ", 2)[1])
+
+        return status, json.loads(body)
+
+    def _expected_schedule(self, days, slots, fairness, strategy="greedy"):
+        gb = GraphBuilder(slots, self.schedule_path, self.courses_path)
+        graph = gb.build()
+
+        painter = GraphPainter(
+            graph, days, slots, fairness, strategy=strategy, catalog=gb.catalog
+        )
+        colored_courses = painter.paint()
+
+        return colored_courses, [
+            [[course.key for course in color.colored_courses] for color in row]
+            for row in painter.colors
+        ]
+
+    def test_health(self):
+        # Only the workers load the graph
+        with patch.object(graphcache, "load_graph") as mock_load_graph:
+            [(status, body)] = self._serve(self._server(), ("GET", "/health"))
+
+        mock_load_graph.assert_not_called()
+        self.assertEqual(status, 200)
+        self.assertEqual(body["courses"], 5)
+        self.assertEqual(body["students"], 6)
+
+    def test_paint_defaults(self):
+        [(status, body)] = self._serve(
+            self._server(days=2, slots=3, fairness=1), ("GET", "/paint")
+        )
+
+        colored_courses, schedule = self._expected_schedule(2, 3, 1)
+        self.assertEqual(status, 200)
+        self.assertEqual(body["colored_courses"], colored_courses)
+        self.assertEqual(body["schedule"], schedule)
+        self.assertEqual(body["courses"], 5)
+
+    def test_paint_query_and_body(self):
+        responses = self._serve(
+            self._server(),
+            ("GET", "/paint?days=2&slots=4&fairness=0"),
+            ("POST", "/paint", {"days": 3, "slots": 2, "strategy": "dsatur"}),
+        )
+
+        self.assertEqual(
+            [body["schedule"] for _, body in responses],
+            [
+                self._expected_schedule(2, 4, 0)[1],
+                self._expected_schedule(3, 2, 2, strategy="dsatur")[1],
+            ],
+        )
+
+    def test_concurrent_requests_do_not_share_colors(self):
+        params = [(days, slots) for days in (2, 3) for slots in (1, 2, 3)]
+        responses = self._serve(
+            self._server(processes=2),
+            *(("GET", f"/paint?days={d}&slots={s}&fairness=1") for d, s in params),
+        )
+
+        for (days, slots), (status, body) in zip(params, responses):
+            self.assertEqual(status, 200)
+            self.assertEqual(
+                body["schedule"], self._expected_schedule(days, slots, 1)[1]
+            )
+
+    def test_unix_socket(self):
+        path = os.path.join(self.directory.name, "palatable.sock")
+        [(status, body)] = self._serve(
+            self._server(), ("GET", "/paint?days=2&slots=2"), path=path
+        )
+
+        self.assertEqual(status, 200)
+        self.assertEqual(body["schedule"], self._expected_schedule(2, 2, 2)[1])
+
+    def test_errors(self):
+        responses = self._serve(
+            self._server(),
+            ("GET", "/paint?days=0"),
+            ("GET", "/paint?days=two"),
+            ("POST", "/paint", {"strategy": "random"}),
+            ("POST", "/paint", {"colors": 3}),
+            ("GET", "/paint?days=1"),
+            ("GET", "/unknown"),
+            ("DELETE", "/paint"),
+            ("POST", "/health"),
+        )
+
+        self.assertEqual(
+            [status for status, _ in responses],
+            [400, 400, 400, 400, 422, 404, 405, 405],
+        )
+        for _, body in responses:
+            self.assertIn("error", body)
+
+    def test_worker_killed(self):
+        server = self._server()
+
+        async def run():
+            listener = await server.start(port=0)
+            port = listener.sockets[0].getsockname()[1]
+
+            def connect():
+                return asyncio.open_connection("127.0.0.1", port)
+
+            async with listener:
+                responses = [await self._request(connect, "GET", "/paint")]
+
+                for process in list(server.executor._processes.values()):
+                    process.kill()
+                    process.join()
+
+                for target in ("/paint", "/paint", "/health"):
+                    responses.append(await self._request(connect, "GET", target))
+
+                return responses
+
+        try:
+            responses = asyncio.run(run())
+        finally:
+            server.close()
+
+        # The request painted by the dead worker fails, the next ones are
+        # painted by a new pool
+        self.assertListEqual([200, 503, 200, 200], [status for status, _ in responses])
+        self.assertEqual(1, responses[-1][1]["restarts"])
+
+    def test_invalid_processes(self):
+        with self.assertRaises(ValueError):
+            self._server(processes=0)
+
+    def test_invalid_cache(self):
+        self._write("graph.bin", "not a graph cache")
+
+        with self.assertRaises(RuntimeError):
+            self._serve(self._server(), ("GET", "/health"))
+
+    def _main(self, *argv):
+        def run(coroutine):
+            coroutine.close()
+
+        argv = ["-d", self.schedule_path, "-c", self.courses_path, *argv]
+        with patch("palatable.server.get_graph") as mock_get_graph, patch(
+            "palatable.server.asyncio.run", side_effect=run
+        ):
+            main(argv)
+
+        return mock_get_graph
+
+    def test_main_valid_cache(self):
+        self._main("--graph-cache", self.cache_path).assert_not_called()
+
+    def test_main_builds_graph(self):
+        self._main().assert_called_once()
+
+    def test_parse_arguments(self):
+        args = parse_arguments(
+            ["-d", self.schedule_path, "-c", self.courses_path, "--port", "0"]
+        )
+
+        self.assertEqual((args.days, args.slots, args.fairness), (5, 5, 2))
+        self.assertEqual(args.port, 0)
+        self.assertIsNone(args.socket)
+        self.assertGreaterEqual(args.processes, 1)
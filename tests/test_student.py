@@ -1,3 +1,5 @@
+from palatable.color import Color
+from palatable.course import Course
 from palatable.student import Student
 from tests.case import TestCase
 
@@ -7,38 +9,13 @@ class TestStudentInit(TestCase):
         key = self.fake.random_int()
         student = Student(key)
         self.assertEqual(student.key, key)
-        self.assertSetEqual(student._registered_courses, set())
-
-    def test_all_students(self):
-        self.assertEqual(0, len(Student._all_students))
-
-        key_1 = "test-key-1"
-        Student(key_1)
-
-        self.assertIn(key_1, Student._all_students)
-        self.assertEqual(1, len(Student._all_students))
-
-        key_2 = "test-key-2"
-        Student(key_2)
-
-        self.assertIn(key_2, Student._all_students)
-        self.assertEqual(2, len(Student._all_students))
-
-    def test_student_same_key(self):
-        key = self.fake.random_int()
-        Student(key)
-
-        with self.assertRaises(AttributeError):
-            Student(key)
-
-        self.assertIn(key, Student._all_students)
-        self.assertEqual(1, len(Student._all_students))
+        self.assertTupleEqual((), student._registered_courses)
 
 
 class TestStudentAddCourse(TestCase):
     def test_registered_courses_and_courses(self):
         student = Student(1234)
-        self.assertSetEqual(student._registered_courses, set())
+        self.assertTupleEqual((), student._registered_courses)
 
         student._registered_courses = [1, 2, 3]
         self.assertListEqual(student.courses, [1, 2, 3])
@@ -50,4 +27,33 @@ class TestStudentAddCourse(TestCase):
         student.add_course(2)
         student.add_course(3)
 
-        self.assertSetEqual(student.courses, {1, 2, 3})
+        self.assertSetEqual({1, 2, 3}, set(student.courses))
+
+    def test_add_course_twice(self):
+        student = Student(1234)
+
+        student.add_course(1)
+        student.add_course(1)
+
+        self.assertTupleEqual((1,), student.courses)
+
+    def test_remove_course(self):
+        student = Student(1234)
+        student.add_course(1)
+        student.add_course(2)
+
+        student.remove_course(1)
+        self.assertTupleEqual((2,), student.courses)
+
+        # Removing a course the student is not registered in is a no-op
+        student.remove_course(3)
+        self.assertTupleEqual((2,), student.courses)
+
+
+class TestSlots(TestCase):
+    def test_no_instance_dict(self):
+        for obj in (Student(1234), Course("1", "name", 1, 1), Color(1)):
+            self.assertFalse(hasattr(obj, "__dict__"))
+
+            with self.assertRaises(AttributeError):
+                obj.undeclared = True
@@ -0,0 +1,88 @@
+from palatable.studentload import StudentLoadIndex
+from tests.case import TestCase
+
+
+class TestStudentLoadIndexAdd(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.index = StudentLoadIndex(days=3, slots=4)
+
+    def test_empty(self):
+        self.assertEqual(0, self.index.get_day_load("a", 0))
+        self.assertEqual(0, self.index.get_slot_load("a", 0, 0))
+        self.assertFalse(self.index.is_double_booked("a", 0))
+        self.assertEqual(0, self.index.get_max_load(0))
+
+    def test_add(self):
+        self.index.add(["a", "b"], 0, 0)
+        self.index.add(["a"], 0, 2)
+
+        self.assertEqual(2, self.index.get_day_load("a", 0))
+        self.assertEqual(1, self.index.get_day_load("b", 0))
+        self.assertEqual(1, self.index.get_slot_load("a", 0, 2))
+        self.assertEqual(0, self.index.get_day_load("a", 1))
+
+        self.assertFalse(self.index.is_double_booked("a", 0))
+        self.assertEqual(2, self.index.get_max_load(0))
+        self.assertEqual(0, self.index.get_max_load(1))
+
+    def test_add_same_slot_double_booked(self):
+        self.index.add(["a", "b"], 1, 3)
+        self.index.add(["a"], 1, 3)
+
+        self.assertTrue(self.index.is_double_booked("a", 1))
+        self.assertFalse(self.index.is_double_booked("b", 1))
+        self.assertFalse(self.index.is_double_booked("a", 0))
+
+
+class TestStudentLoadIndexRemove(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.index = StudentLoadIndex(days=2, slots=3)
+
+    def test_remove(self):
+        self.index.add(["a", "b"], 0, 0)
+        self.index.add(["a"], 0, 1)
+        self.index.remove(["a"], 0, 1)
+
+        self.assertEqual(1, self.index.get_day_load("a", 0))
+        self.assertEqual(0, self.index.get_slot_load("a", 0, 1))
+        self.assertEqual(1, self.index.get_max_load(0))
+
+    def test_remove_all(self):
+        self.index.add(["a", "b"], 0, 0)
+        self.index.remove(["a", "b"], 0, 0)
+
+        self.assertEqual(0, self.index.get_day_load("a", 0))
+        self.assertEqual(0, self.index.get_max_load(0))
+
+    def test_remove_keeps_max_of_other_students(self):
+        self.index.add(["a", "b"], 0, 0)
+        self.index.add(["a", "b"], 0, 2)
+        self.index.remove(["a"], 0, 2)
+
+        self.assertEqual(2, self.index.get_max_load(0))
+
+        self.index.remove(["b"], 0, 2)
+        self.assertEqual(1, self.index.get_max_load(0))
+
+    def test_remove_double_booked(self):
+        self.index.add(["a"], 1, 1)
+        self.index.add(["a"], 1, 1)
+        self.index.add(["a"], 1, 2)
+        self.index.add(["a"], 1, 2)
+
+        self.index.remove(["a"], 1, 1)
+        self.assertTrue(self.index.is_double_booked("a", 1))
+
+        self.index.remove(["a"], 1, 2)
+        self.assertFalse(self.index.is_double_booked("a", 1))
+
+    def test_remove_no_exam(self):
+        self.index.add(["a"], 0, 0)
+
+        with self.assertRaises(ValueError):
+            self.index.remove(["a"], 0, 1)
+
+        with self.assertRaises(ValueError):
+            self.index.remove(["b"], 0, 0)
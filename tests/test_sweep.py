@@ -0,0 +1,124 @@
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+
+from palatable import pool, scheduler
+from palatable.graphbuilder import GraphBuilder
+from palatable.graphpainter import GraphPainter
+from palatable.sweep import SweepResult, shortest_complete, sweep
+from tests.case import FilesTestCase
+
+
+class TestSweep(FilesTestCase):
+    def _sweep(self, days, slots, fairness, **kwargs):
+        return sweep(
+            self.schedule_path, self.courses_path, days, slots, fairness, **kwargs
+        )
+
+    def _paint(self, days, slots, fairness):
+        gb = GraphBuilder(slots, self.schedule_path, self.courses_path)
+        graph = gb.build()
+
+        painter = GraphPainter(graph, days, slots, fairness, catalog=gb.catalog)
+        colored_courses = painter.paint()
+
+        return colored_courses, max(map(painter.loads.get_max_load, range(days)))
+
+    def test_sweep_same_as_painting(self):
+        results = self._sweep([2, 3], [1, 2], [0, 1])
+
+        self.assertEqual(
+            [(r.days, r.slots, r.fairness) for r in results],
+            [(d, s, f) for d in (2, 3) for s in (1, 2) for f in (0, 1)],
+        )
+        for result in results:
+            self.assertIsNone(result.error)
+            self.assertEqual(result.courses, 5)
+            self.assertEqual(
+                (result.colored_courses, result.max_load),
+                self._paint(result.days, result.slots, result.fairness),
+            )
+
+    def test_sweep_processes(self):
+        expected = self._sweep([2, 3], [1, 2, 3], [1])
+        results = self._sweep([2, 3], [1, 2, 3], [1], processes=2)
+
+        self.assertEqual(
+            [result[:-2] for result in results], [result[:-2] for result in expected]
+        )
+
+    def test_sweep_threads_paint_their_own_graph(self):
+        schedule_path = self._write("small.txt", "0125897 1901204 1901351\n")
+
+        def run(paths):
+            return sweep(*paths, [3], [2], [1])[0].courses
+
+        paths = [(self.schedule_path, self.courses_path)]
+        paths += [(schedule_path, self.courses_path)]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for _ in range(10):
+                self.assertListEqual([5, 2], list(executor.map(run, paths)))
+
+        # The in-process painting leaves nothing behind in the pool module
+        self.assertDictEqual({}, pool._worker)
+
+    def test_sweep_records_errors(self):
+        [result] = self._sweep([1], [1], [1])
+
+        self.assertIsNone(result.colored_courses)
+        self.assertIn("Available instances", result.error)
+
+    def test_sweep_graph_cache(self):
+
+        expected = self._sweep([3], [2], [1], graph_cache=self.cache_path)
+        self.assertTrue(os.path.exists(self.cache_path))
+
+        results = self._sweep([3], [2], [1], graph_cache=self.cache_path, processes=2)
+        self.assertEqual(results[0][:-2], expected[0][:-2])
+
+    def test_sweep_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self._sweep([3], [2], [1], processes=0)
+
+        with self.assertRaises(ValueError):
+            self._sweep([3], [2], [1], strategy="random")
+
+    def test_shortest_complete(self):
+        results = [
+            SweepResult(2, 3, 1, 5, 5, 2, 0.1, None),
+            SweepResult(3, 1, 1, 5, 5, 1, 0.1, None),
+            SweepResult(2, 1, 1, 4, 5, 1, 0.1, None),
+            SweepResult(1, 1, 1, None, None, None, None, "error"),
+        ]
+
+        self.assertEqual(shortest_complete(results), results[1])
+        self.assertIsNone(shortest_complete(results[2:]))
+
+    def test_main(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            scheduler.main(
+                [
+                    "sweep",
+                    "-d",
+                    self.schedule_path,
+                    "-c",
+                    self.courses_path,
+                    "-y",
+                    "1",
+                    "3",
+                    "-s",
+                    "2",
+                    "-f",
+                    "1",
+                    "-p",
+                    "1",
+                ]
+            )
+
+        output = output.getvalue()
+        self.assertIn("Available instances", output)
+        self.assertIn("5/5", output)
+        self.assertIn("Shortest complete schedule: 3 days x 2 slots", output)